@@ -15,12 +15,63 @@ Configuration (.env file):
     SANDBOX_TIMEOUT=300            # Optional, sandbox timeout in seconds, default 300
     SANDBOX_COUNT=2                # Optional, total sandbox count, default 2
     PROCESS_COUNT=2                # Optional, process count, default 2
-    THREAD_POOL_SIZE=5             # Optional, thread pool size per process, default 5
+    THREAD_POOL_SIZE=5             # Optional, disk I/O thread pool size per process, default 5
+    APPIUM_MAX_CONNECTIONS=1000    # Optional, shared async Appium HTTP pool size per process, default 1000
     USE_MOUNTED_APK=false          # Optional, default false (upload APK from local)
                                    #   Set to true to install from mounted path, requires COS disk mounted to sandbox
+    SANDBOX_POOL_SIZE=0            # Optional, pre-warmed sandbox pool size (total across processes), default 0 (disabled)
+    SANDBOX_POOL_REFILL_CONCURRENCY=10  # Optional, max concurrent pool refill creates per process, default 10
+    SANDBOX_POOL_MAX_IDLE_SECONDS=120   # Optional, idle sandboxes older than this are discarded, default 120
+    KEEP_RAW_LATENCIES=false       # Optional, also keep raw latency samples in details.json, default false
+                                   #   Percentiles always come from mergeable log-bucket histograms
+    UPLOAD_CHUNK_SIZE_MB=8         # Optional, APK upload chunk size in MB, default 8
+    UPLOAD_PARALLELISM=4           # Optional, APK chunks pushed in parallel (separate connections), default 4
+    PIPELINE_OPERATIONS=true       # Optional, run operations as a dependency graph (false = strictly sequential)
+    APK_SHARED_DIR=                # Optional, device path of a volume shared by all sandboxes (content-addressed
+                                   #   APK cache: one upload per run, other sandboxes install from it), default off
+
+    LOAD_MODE=burst                # Optional, burst (all at once) | open (arrival rate) | closed (virtual users)
+    ARRIVAL_RATE=1.0               # Optional, open mode: target sandbox creates per second (at hold), default 1.0
+    ARRIVAL_PROCESS=poisson        # Optional, open mode: poisson | constant inter-arrival times
+    RAMP_UP_SECONDS=0              # Optional, open/closed: linear ramp-up duration, default 0
+    HOLD_SECONDS=60                # Optional, open/closed: steady-state duration, default 60
+    RAMP_DOWN_SECONDS=0            # Optional, open/closed: linear ramp-down duration, default 0
+    MAX_IN_FLIGHT=0                # Optional, open mode: max concurrent testers (0 = unlimited)
+    VIRTUAL_USERS=10               # Optional, closed mode: users looping create -> operate -> destroy
+                                   #   In open/closed mode SANDBOX_COUNT caps the total number of sandboxes
+    METRICS_WINDOW_SECONDS=10      # Optional, per-window breakdown size in summary.json, default 10
+    TIMESERIES_ENABLED=true        # Optional, stream per-second metrics to timeseries.jsonl during the run
+    TIMESERIES_FLUSH_SECONDS=1     # Optional, how often completed seconds are appended to the file
+    PROGRESS_INTERVAL_SECONDS=5    # Optional, multi-process live progress line interval, default 5
+    WORKER_TIMEOUT_SECONDS=0       # Optional, stop workers and report partial results after this (0 = no limit)
+    JOURNAL_FSYNC_SECONDS=1        # Optional, max seconds between result journal fsyncs (0 = fsync every result)
+    EVENT_LOG_ENABLED=true         # Optional, write lifecycle events to events.jsonl (input of `batch.py report`)
+    EVENT_LOG_BUFFER_KB=256        # Optional, event log write buffer per process, default 256
+    CONSOLE_VERBOSITY=all          # Optional, terminal output: all | progress (no per-sandbox steps) | summary
+                                   #   (no per-sandbox lines); console.log always gets everything
+    CONSOLE_FLUSH_MS=100           # Optional, console writer thread batch interval, default 100
+    ADAPTIVE_CONCURRENCY=false     # Optional, adaptive (AIMD + latency) limits for create / connect / kill
+    ADAPTIVE_CONCURRENCY_INITIAL=20     # Optional, starting limit per call type (total across processes)
+    ADAPTIVE_CONCURRENCY_MAX=1000       # Optional, upper bound per call type (total across processes)
+    ADAPTIVE_LATENCY_TOLERANCE=2.0      # Optional, back off when smoothed latency exceeds this x best latency
+    CREATE_MAX_RETRIES=1           # Optional, sandbox create retries, default 1
+    APPIUM_READY_TIMEOUT_SECONDS=60     # Optional, max wait for /healthz before creating the Appium session
+    READINESS_MIN_INTERVAL_MS=50        # Optional, first readiness poll interval (grows x1.5 per miss)
+    READINESS_MAX_INTERVAL_MS=1000      # Optional, readiness poll interval cap
+    RETRY_BACKOFF_BASE_MS=200      # Optional, jittered exponential backoff base for create retries
+    RETRY_BACKOFF_MAX_MS=10000     # Optional, backoff cap
+    SCREENSHOT_FORMAT=png          # Optional, png (as captured) | jpeg | webp (re-encode needs Pillow)
+    SCREENSHOT_QUALITY=80          # Optional, jpeg/webp quality 1-100, default 80
+    SCREENSHOT_MAX_WIDTH=0         # Optional, downscale wider frames to this width (0 = keep, needs Pillow)
+    SCREENSHOT_WRITE_QUEUE=64      # Optional, frames buffered for the background disk writer per process
+    LOGCAT_POLL_SECONDS=5          # Optional, interval of incremental logcat reads during operations
+    LOGCAT_FILTER=                 # Optional, logcat filterspecs applied on the device (e.g. "*:W"), default all
+    LOGCAT_ROTATE_MB=16            # Optional, uncompressed MB per gzip logcat segment, default 16
 
 Usage:
     python batch.py
+    python batch.py --resume output/batch_output/<task_dir>   # Run only sandboxes missing from the journal
+    python batch.py report output/batch_output/<task_dir>     # Rebuild summary/time series from events.jsonl
 """
 
 from __future__ import annotations
@@ -36,23 +87,36 @@ os.environ.setdefault("E2B_MAX_CONNECTIONS", "2000")
 
 import sys
 import time
+import argparse
 import json
+import base64
+import uuid
 import random
 import signal
 import asyncio
+import math
+import io
+import re
+import gzip
+import shlex
+import queue
+import secrets
 import hashlib
 import logging
-import statistics
+import functools
+import threading
 import traceback
 import multiprocessing
 from pathlib import Path
 from datetime import datetime
 from dataclasses import dataclass, field
 from types import FrameType
-from typing import List, Optional, Dict, Any, Tuple, TextIO, Callable, Union
+from typing import List, Optional, Dict, Any, Tuple, TextIO, Callable, Union, Deque, Set, ClassVar, AsyncIterator, Iterator
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor
-from contextlib import contextmanager
+from contextlib import contextmanager, asynccontextmanager, nullcontext
 
+import httpx
 import requests
 
 # =============================================================================
@@ -90,6 +154,9 @@ def setup_logging(level: Optional[str] = None) -> logging.Logger:
     console_handler.setFormatter(formatter)
     root_logger.addHandler(console_handler)
 
+    # httpx logs every request at INFO; with all Appium calls on httpx that floods the console
+    logging.getLogger("httpx").setLevel(log_level if log_level <= logging.DEBUG else logging.WARNING)
+
     return logging.getLogger(__name__)
 
 
@@ -112,8 +179,52 @@ DEFAULT_CONFIG = {
     'SANDBOX_TIMEOUT': 300,
     'SANDBOX_COUNT': 2,
     'PROCESS_COUNT': 2,
-    'THREAD_POOL_SIZE': 5,
+    'THREAD_POOL_SIZE': 5,         # Disk I/O only; Appium calls are async
+    'APPIUM_MAX_CONNECTIONS': 1000,
     'USE_MOUNTED_APK': False,      # Default: upload APK from local; set to True after mounting COS disk
+    'SANDBOX_POOL_SIZE': 0,        # 0 = disabled; total pre-warmed sandboxes (split across processes)
+    'SANDBOX_POOL_REFILL_CONCURRENCY': 10,
+    'SANDBOX_POOL_MAX_IDLE_SECONDS': 120,
+    'KEEP_RAW_LATENCIES': False,   # Keep raw samples in details.json (histograms are always kept)
+    'UPLOAD_CHUNK_SIZE_MB': 8,
+    'UPLOAD_PARALLELISM': 4,
+    'LOAD_MODE': 'burst',          # burst | open | closed
+    'ARRIVAL_RATE': 1.0,           # open: creates/second at hold
+    'ARRIVAL_PROCESS': 'poisson',  # open: poisson | constant
+    'RAMP_UP_SECONDS': 0,
+    'HOLD_SECONDS': 60,
+    'RAMP_DOWN_SECONDS': 0,
+    'MAX_IN_FLIGHT': 0,            # open: 0 = unlimited
+    'VIRTUAL_USERS': 10,           # closed: concurrent users
+    'METRICS_WINDOW_SECONDS': 10,
+    'TIMESERIES_ENABLED': True,
+    'TIMESERIES_FLUSH_SECONDS': 1.0,
+    'PROGRESS_INTERVAL_SECONDS': 5.0,
+    'WORKER_TIMEOUT_SECONDS': 0.0,   # 0 = no limit
+    'JOURNAL_FSYNC_SECONDS': 1.0,    # 0 = fsync every result
+    'EVENT_LOG_ENABLED': True,
+    'EVENT_LOG_BUFFER_KB': 256,
+    'CONSOLE_VERBOSITY': 'all',    # all | progress | summary (terminal only; console.log gets everything)
+    'CONSOLE_FLUSH_MS': 100,
+    'ADAPTIVE_CONCURRENCY': False,
+    'ADAPTIVE_CONCURRENCY_INITIAL': 20,
+    'ADAPTIVE_CONCURRENCY_MAX': 1000,
+    'ADAPTIVE_LATENCY_TOLERANCE': 2.0,
+    'CREATE_MAX_RETRIES': 1,
+    'APPIUM_READY_TIMEOUT_SECONDS': 60.0,
+    'READINESS_MIN_INTERVAL_MS': 50.0,
+    'READINESS_MAX_INTERVAL_MS': 1000.0,
+    'RETRY_BACKOFF_BASE_MS': 200,
+    'RETRY_BACKOFF_MAX_MS': 10000,
+    'SCREENSHOT_FORMAT': 'png',    # png (as captured) | jpeg | webp
+    'SCREENSHOT_QUALITY': 80,
+    'SCREENSHOT_MAX_WIDTH': 0,     # 0 = keep captured size
+    'SCREENSHOT_WRITE_QUEUE': 64,
+    'LOGCAT_POLL_SECONDS': 5.0,
+    'LOGCAT_FILTER': '',           # Device-side filterspecs, e.g. "*:W" or "ActivityManager:I *:S"
+    'LOGCAT_ROTATE_MB': 16,
+    'PIPELINE_OPERATIONS': True,   # Run OPERATION_GRAPH concurrently; False = OPERATIONS order, one at a time
+    'APK_SHARED_DIR': '',          # Shared (mounted) device dir for content-addressed APKs, '' = disabled
 }
 
 # Mount path prefix (for mounted APK mode)
@@ -122,6 +233,77 @@ MOUNT_PATH_PREFIX = '/data/local/tmp/mnt'
 # Error message truncation length
 MAX_ERROR_MSG_LENGTH = 200
 
+# Latency histogram relative accuracy (1% => bucket bounds grow by ~2%)
+HISTOGRAM_RELATIVE_ACCURACY = 0.01
+
+# Latencies at or below this value (ms) are counted in the zero bucket
+HISTOGRAM_MIN_LATENCY_MS = 0.001
+
+# APK upload: file read block size (multiple of 3 so per-block base64 output concatenates cleanly)
+UPLOAD_READ_BLOCK_SIZE = 3 * 256 * 1024
+
+# APK upload: on-device chunk staging directory
+UPLOAD_TEMP_DIR = '/data/local/tmp/chunks'
+
+# Seconds a tester waits for another tester's upload to the shared APK dir
+APK_SHARED_WAIT_SECONDS = 300
+
+# Per-second metrics stream (one JSON object per line, one file per process)
+TIMESERIES_FILE = 'timeseries.jsonl'
+
+# A second is flushed once it is this many seconds old (late outcomes land in another line for the same second)
+TIMESERIES_GRACE_SECONDS = 2
+
+# Append-only per-sandbox result journal (one file per process) and run metadata used by --resume
+JOURNAL_FILE = 'journal.jsonl'
+RUN_META_FILE = 'run.json'
+
+# Console message classes: terminal output keeps classes up to the CONSOLE_VERBOSITY threshold
+CONSOLE_GENERAL = 0       # Headers, progress, summary
+CONSOLE_SANDBOX = 1       # One line per finished sandbox
+CONSOLE_SANDBOX_STEP = 2  # Per-sandbox step lines (AsyncSandboxTester._log)
+CONSOLE_VERBOSITY_LEVELS = {'summary': CONSOLE_GENERAL, 'progress': CONSOLE_SANDBOX, 'all': CONSOLE_SANDBOX_STEP}
+
+# Lifecycle event log (one file per process), flushed at least this often, and the `report` output subdirectory
+EVENT_LOG_FILE = 'events.jsonl'
+EVENT_LOG_FLUSH_SECONDS = 1.0
+REPORT_DIR_NAME = 'report'
+
+# Adaptive concurrency: multiplicative decrease factor, latency smoothing, baseline drift per sample,
+# samples before latency can trigger a decrease, and max recorded limit changes per call type
+LIMITER_DECREASE_FACTOR = 0.7
+LIMITER_EWMA_ALPHA = 0.2
+LIMITER_BASELINE_DRIFT = 0.01
+LIMITER_MIN_SAMPLES = 5
+LIMITER_HISTORY_MAX = 500
+
+# Errors that signal platform pressure (when no HTTP status code is attached to the exception)
+OVERLOAD_ERROR_PATTERN = re.compile(
+    r'\b(429|50[0234])\b|too many requests|rate limit|service unavailable|bad gateway|gateway timeout',
+    re.IGNORECASE
+)
+
+# Readiness prober: poll interval growth per miss, per-probe HTTP timeout, and max wait on connect retries
+READINESS_BACKOFF_FACTOR = 1.5
+READINESS_PROBE_TIMEOUT_SECONDS = 5
+READINESS_RETRY_TIMEOUT_SECONDS = 5
+
+# Screenshot pipeline: file extension per SCREENSHOT_FORMAT, and background writer tasks per process
+SCREENSHOT_EXTENSIONS = {'png': 'png', 'jpeg': 'jpg', 'webp': 'webp'}
+SCREENSHOT_WRITERS = 2
+
+# Logcat lines in `-v epoch` format start with the epoch timestamp used as the read cursor
+LOGCAT_TIMESTAMP_PATTERN = re.compile(r'^\s*(\d+\.\d+)\s')
+
+# Platform calls guarded by an adaptive limiter
+LIMITED_CALLS = ['sandbox_create', 'appium_connect', 'sandbox_kill']
+
+# Seconds the parent waits for workers to exit after asking them to stop (then terminates them)
+WORKER_STOP_GRACE_SECONDS = 10
+
+# Percentiles reported in summary.json
+REPORT_PERCENTILES = [('p50', 0.50), ('p90', 0.90), ('p95', 0.95), ('p99', 0.99), ('p999', 0.999)]
+
 # App configurations for testing
 # This is an example configuration. Users can customize by adding their own apps.
 # Required fields: name, package, activity, apk_name, remote_path, mounted_path, permissions
@@ -159,6 +341,33 @@ OPERATIONS = [
     ('get_logs', 'Get Logs'),
 ]
 
+# Operation dependency graph (PIPELINE_OPERATIONS=true): key -> dependencies and lane.
+# Dependencies only order operations; a failed dependency does not skip its dependents,
+# so every operation is still measured on every run. Lanes cap how many operations of
+# one kind run at the same time on a device (see OPERATION_LANES).
+OPERATION_GRAPH: Dict[str, Dict[str, Any]] = {
+    'upload_apk':      {'deps': [], 'lane': 'transfer'},
+    'install_apk':     {'deps': ['upload_apk'], 'lane': 'package'},
+    'launch_apk':      {'deps': ['install_apk'], 'lane': 'ui'},
+    'screenshot_1':    {'deps': ['launch_apk'], 'lane': 'capture'},
+    'get_page_xml':    {'deps': ['launch_apk'], 'lane': 'capture'},
+    'tap_random_1':    {'deps': ['screenshot_1', 'get_page_xml'], 'lane': 'ui'},
+    'get_device_info': {'deps': [], 'lane': 'query'},
+    'open_browser':    {'deps': ['tap_random_1'], 'lane': 'ui'},
+    'tap_random_2':    {'deps': ['open_browser'], 'lane': 'ui'},
+    'screenshot_2':    {'deps': ['tap_random_2'], 'lane': 'capture'},
+    'get_logs':        {'deps': ['screenshot_2', 'get_device_info'], 'lane': 'query'},  # Final logcat read
+}
+
+# Max concurrent operations per lane (per sandbox); UI input is serialized
+OPERATION_LANES = {
+    'transfer': 1,
+    'package': 1,
+    'ui': 1,
+    'capture': 2,
+    'query': 2,
+}
+
 
 # =============================================================================
 # Exceptions
@@ -218,7 +427,66 @@ def load_config() -> Dict[str, Any]:
         'SANDBOX_COUNT': sandbox_count,
         'PROCESS_COUNT': int(os.getenv("PROCESS_COUNT", str(DEFAULT_CONFIG['PROCESS_COUNT']))),
         'THREAD_POOL_SIZE': int(os.getenv("THREAD_POOL_SIZE", str(DEFAULT_CONFIG['THREAD_POOL_SIZE']))),
+        'APPIUM_MAX_CONNECTIONS': int(os.getenv(
+            "APPIUM_MAX_CONNECTIONS", str(DEFAULT_CONFIG['APPIUM_MAX_CONNECTIONS']))),
         'USE_MOUNTED_APK': _parse_bool("USE_MOUNTED_APK", DEFAULT_CONFIG['USE_MOUNTED_APK']),
+        'SANDBOX_POOL_SIZE': int(os.getenv("SANDBOX_POOL_SIZE", str(DEFAULT_CONFIG['SANDBOX_POOL_SIZE']))),
+        'SANDBOX_POOL_REFILL_CONCURRENCY': int(os.getenv(
+            "SANDBOX_POOL_REFILL_CONCURRENCY", str(DEFAULT_CONFIG['SANDBOX_POOL_REFILL_CONCURRENCY']))),
+        'SANDBOX_POOL_MAX_IDLE_SECONDS': int(os.getenv(
+            "SANDBOX_POOL_MAX_IDLE_SECONDS", str(DEFAULT_CONFIG['SANDBOX_POOL_MAX_IDLE_SECONDS']))),
+        'KEEP_RAW_LATENCIES': _parse_bool("KEEP_RAW_LATENCIES", DEFAULT_CONFIG['KEEP_RAW_LATENCIES']),
+        'UPLOAD_CHUNK_SIZE_MB': int(os.getenv("UPLOAD_CHUNK_SIZE_MB", str(DEFAULT_CONFIG['UPLOAD_CHUNK_SIZE_MB']))),
+        'UPLOAD_PARALLELISM': int(os.getenv("UPLOAD_PARALLELISM", str(DEFAULT_CONFIG['UPLOAD_PARALLELISM']))),
+        'LOAD_MODE': os.getenv("LOAD_MODE", DEFAULT_CONFIG['LOAD_MODE']).strip().lower(),
+        'ARRIVAL_RATE': float(os.getenv("ARRIVAL_RATE", str(DEFAULT_CONFIG['ARRIVAL_RATE']))),
+        'ARRIVAL_PROCESS': os.getenv("ARRIVAL_PROCESS", DEFAULT_CONFIG['ARRIVAL_PROCESS']).strip().lower(),
+        'RAMP_UP_SECONDS': float(os.getenv("RAMP_UP_SECONDS", str(DEFAULT_CONFIG['RAMP_UP_SECONDS']))),
+        'HOLD_SECONDS': float(os.getenv("HOLD_SECONDS", str(DEFAULT_CONFIG['HOLD_SECONDS']))),
+        'RAMP_DOWN_SECONDS': float(os.getenv("RAMP_DOWN_SECONDS", str(DEFAULT_CONFIG['RAMP_DOWN_SECONDS']))),
+        'MAX_IN_FLIGHT': int(os.getenv("MAX_IN_FLIGHT", str(DEFAULT_CONFIG['MAX_IN_FLIGHT']))),
+        'VIRTUAL_USERS': int(os.getenv("VIRTUAL_USERS", str(DEFAULT_CONFIG['VIRTUAL_USERS']))),
+        'METRICS_WINDOW_SECONDS': float(os.getenv(
+            "METRICS_WINDOW_SECONDS", str(DEFAULT_CONFIG['METRICS_WINDOW_SECONDS']))),
+        'TIMESERIES_ENABLED': _parse_bool("TIMESERIES_ENABLED", DEFAULT_CONFIG['TIMESERIES_ENABLED']),
+        'TIMESERIES_FLUSH_SECONDS': float(os.getenv(
+            "TIMESERIES_FLUSH_SECONDS", str(DEFAULT_CONFIG['TIMESERIES_FLUSH_SECONDS']))),
+        'PROGRESS_INTERVAL_SECONDS': float(os.getenv(
+            "PROGRESS_INTERVAL_SECONDS", str(DEFAULT_CONFIG['PROGRESS_INTERVAL_SECONDS']))),
+        'WORKER_TIMEOUT_SECONDS': float(os.getenv(
+            "WORKER_TIMEOUT_SECONDS", str(DEFAULT_CONFIG['WORKER_TIMEOUT_SECONDS']))),
+        'JOURNAL_FSYNC_SECONDS': float(os.getenv(
+            "JOURNAL_FSYNC_SECONDS", str(DEFAULT_CONFIG['JOURNAL_FSYNC_SECONDS']))),
+        'EVENT_LOG_ENABLED': _parse_bool("EVENT_LOG_ENABLED", DEFAULT_CONFIG['EVENT_LOG_ENABLED']),
+        'EVENT_LOG_BUFFER_KB': int(os.getenv("EVENT_LOG_BUFFER_KB", str(DEFAULT_CONFIG['EVENT_LOG_BUFFER_KB']))),
+        'CONSOLE_VERBOSITY': os.getenv("CONSOLE_VERBOSITY", DEFAULT_CONFIG['CONSOLE_VERBOSITY']).strip().lower(),
+        'CONSOLE_FLUSH_MS': float(os.getenv("CONSOLE_FLUSH_MS", str(DEFAULT_CONFIG['CONSOLE_FLUSH_MS']))),
+        'ADAPTIVE_CONCURRENCY': _parse_bool("ADAPTIVE_CONCURRENCY", DEFAULT_CONFIG['ADAPTIVE_CONCURRENCY']),
+        'ADAPTIVE_CONCURRENCY_INITIAL': int(os.getenv(
+            "ADAPTIVE_CONCURRENCY_INITIAL", str(DEFAULT_CONFIG['ADAPTIVE_CONCURRENCY_INITIAL']))),
+        'ADAPTIVE_CONCURRENCY_MAX': int(os.getenv(
+            "ADAPTIVE_CONCURRENCY_MAX", str(DEFAULT_CONFIG['ADAPTIVE_CONCURRENCY_MAX']))),
+        'ADAPTIVE_LATENCY_TOLERANCE': float(os.getenv(
+            "ADAPTIVE_LATENCY_TOLERANCE", str(DEFAULT_CONFIG['ADAPTIVE_LATENCY_TOLERANCE']))),
+        'CREATE_MAX_RETRIES': int(os.getenv("CREATE_MAX_RETRIES", str(DEFAULT_CONFIG['CREATE_MAX_RETRIES']))),
+        'RETRY_BACKOFF_BASE_MS': float(os.getenv("RETRY_BACKOFF_BASE_MS", str(DEFAULT_CONFIG['RETRY_BACKOFF_BASE_MS']))),
+        'RETRY_BACKOFF_MAX_MS': float(os.getenv("RETRY_BACKOFF_MAX_MS", str(DEFAULT_CONFIG['RETRY_BACKOFF_MAX_MS']))),
+        'APPIUM_READY_TIMEOUT_SECONDS': float(os.getenv(
+            "APPIUM_READY_TIMEOUT_SECONDS", str(DEFAULT_CONFIG['APPIUM_READY_TIMEOUT_SECONDS']))),
+        'READINESS_MIN_INTERVAL_MS': float(os.getenv(
+            "READINESS_MIN_INTERVAL_MS", str(DEFAULT_CONFIG['READINESS_MIN_INTERVAL_MS']))),
+        'READINESS_MAX_INTERVAL_MS': float(os.getenv(
+            "READINESS_MAX_INTERVAL_MS", str(DEFAULT_CONFIG['READINESS_MAX_INTERVAL_MS']))),
+        'SCREENSHOT_FORMAT': os.getenv("SCREENSHOT_FORMAT", DEFAULT_CONFIG['SCREENSHOT_FORMAT']).strip().lower(),
+        'SCREENSHOT_QUALITY': int(os.getenv("SCREENSHOT_QUALITY", str(DEFAULT_CONFIG['SCREENSHOT_QUALITY']))),
+        'SCREENSHOT_MAX_WIDTH': int(os.getenv("SCREENSHOT_MAX_WIDTH", str(DEFAULT_CONFIG['SCREENSHOT_MAX_WIDTH']))),
+        'SCREENSHOT_WRITE_QUEUE': int(os.getenv(
+            "SCREENSHOT_WRITE_QUEUE", str(DEFAULT_CONFIG['SCREENSHOT_WRITE_QUEUE']))),
+        'LOGCAT_POLL_SECONDS': float(os.getenv("LOGCAT_POLL_SECONDS", str(DEFAULT_CONFIG['LOGCAT_POLL_SECONDS']))),
+        'LOGCAT_FILTER': os.getenv("LOGCAT_FILTER", DEFAULT_CONFIG['LOGCAT_FILTER']).strip(),
+        'LOGCAT_ROTATE_MB': int(os.getenv("LOGCAT_ROTATE_MB", str(DEFAULT_CONFIG['LOGCAT_ROTATE_MB']))),
+        'PIPELINE_OPERATIONS': _parse_bool("PIPELINE_OPERATIONS", DEFAULT_CONFIG['PIPELINE_OPERATIONS']),
+        'APK_SHARED_DIR': os.getenv("APK_SHARED_DIR", DEFAULT_CONFIG['APK_SHARED_DIR']).strip().rstrip('/'),
     }
     
     _validate_config(config)
@@ -252,6 +520,116 @@ def _validate_config(config: Dict[str, Any]) -> None:
     if config['THREAD_POOL_SIZE'] < 1:
         errors.append(f"THREAD_POOL_SIZE must be >= 1, current value: {config['THREAD_POOL_SIZE']}")
 
+    if config['APPIUM_MAX_CONNECTIONS'] < 1:
+        errors.append(f"APPIUM_MAX_CONNECTIONS must be >= 1, current value: {config['APPIUM_MAX_CONNECTIONS']}")
+
+    if config['SANDBOX_POOL_SIZE'] < 0:
+        errors.append(f"SANDBOX_POOL_SIZE must be >= 0, current value: {config['SANDBOX_POOL_SIZE']}")
+
+    if config['SANDBOX_POOL_REFILL_CONCURRENCY'] < 1:
+        errors.append(f"SANDBOX_POOL_REFILL_CONCURRENCY must be >= 1, "
+                      f"current value: {config['SANDBOX_POOL_REFILL_CONCURRENCY']}")
+
+    if config['SANDBOX_POOL_SIZE'] > 0 and \
+            not 1 <= config['SANDBOX_POOL_MAX_IDLE_SECONDS'] < config['SANDBOX_TIMEOUT']:
+        errors.append(f"SANDBOX_POOL_MAX_IDLE_SECONDS must be >= 1 and < SANDBOX_TIMEOUT, "
+                      f"current value: {config['SANDBOX_POOL_MAX_IDLE_SECONDS']}")
+
+    if config['LOAD_MODE'] not in ('burst', 'open', 'closed'):
+        errors.append(f"LOAD_MODE must be burst, open or closed, current value: {config['LOAD_MODE']}")
+
+    if config['ARRIVAL_PROCESS'] not in ('poisson', 'constant'):
+        errors.append(f"ARRIVAL_PROCESS must be poisson or constant, current value: {config['ARRIVAL_PROCESS']}")
+
+    if config['LOAD_MODE'] == 'open' and config['ARRIVAL_RATE'] <= 0:
+        errors.append(f"ARRIVAL_RATE must be > 0, current value: {config['ARRIVAL_RATE']}")
+
+    if min(config['RAMP_UP_SECONDS'], config['HOLD_SECONDS'], config['RAMP_DOWN_SECONDS']) < 0:
+        errors.append("RAMP_UP_SECONDS, HOLD_SECONDS and RAMP_DOWN_SECONDS must be >= 0")
+
+    if config['LOAD_MODE'] != 'burst' and \
+            config['RAMP_UP_SECONDS'] + config['HOLD_SECONDS'] + config['RAMP_DOWN_SECONDS'] <= 0:
+        errors.append("Load profile duration (RAMP_UP_SECONDS + HOLD_SECONDS + RAMP_DOWN_SECONDS) must be > 0")
+
+    if config['MAX_IN_FLIGHT'] < 0:
+        errors.append(f"MAX_IN_FLIGHT must be >= 0, current value: {config['MAX_IN_FLIGHT']}")
+
+    if config['LOAD_MODE'] == 'closed' and config['VIRTUAL_USERS'] < 1:
+        errors.append(f"VIRTUAL_USERS must be >= 1, current value: {config['VIRTUAL_USERS']}")
+
+    if config['METRICS_WINDOW_SECONDS'] <= 0:
+        errors.append(f"METRICS_WINDOW_SECONDS must be > 0, current value: {config['METRICS_WINDOW_SECONDS']}")
+
+    if config['TIMESERIES_FLUSH_SECONDS'] <= 0:
+        errors.append(f"TIMESERIES_FLUSH_SECONDS must be > 0, current value: {config['TIMESERIES_FLUSH_SECONDS']}")
+
+    if config['PROGRESS_INTERVAL_SECONDS'] <= 0:
+        errors.append(f"PROGRESS_INTERVAL_SECONDS must be > 0, current value: {config['PROGRESS_INTERVAL_SECONDS']}")
+
+    if config['WORKER_TIMEOUT_SECONDS'] < 0:
+        errors.append(f"WORKER_TIMEOUT_SECONDS must be >= 0, current value: {config['WORKER_TIMEOUT_SECONDS']}")
+
+    if config['JOURNAL_FSYNC_SECONDS'] < 0:
+        errors.append(f"JOURNAL_FSYNC_SECONDS must be >= 0, current value: {config['JOURNAL_FSYNC_SECONDS']}")
+
+    if config['EVENT_LOG_BUFFER_KB'] < 1:
+        errors.append(f"EVENT_LOG_BUFFER_KB must be >= 1, current value: {config['EVENT_LOG_BUFFER_KB']}")
+
+    if config['CONSOLE_VERBOSITY'] not in CONSOLE_VERBOSITY_LEVELS:
+        errors.append(f"CONSOLE_VERBOSITY must be one of {'/'.join(CONSOLE_VERBOSITY_LEVELS)}, "
+                      f"current value: {config['CONSOLE_VERBOSITY']}")
+
+    if config['CONSOLE_FLUSH_MS'] <= 0:
+        errors.append(f"CONSOLE_FLUSH_MS must be > 0, current value: {config['CONSOLE_FLUSH_MS']}")
+
+    if config['ADAPTIVE_CONCURRENCY_INITIAL'] < 1:
+        errors.append(f"ADAPTIVE_CONCURRENCY_INITIAL must be >= 1, current value: {config['ADAPTIVE_CONCURRENCY_INITIAL']}")
+
+    if config['ADAPTIVE_CONCURRENCY_MAX'] < config['ADAPTIVE_CONCURRENCY_INITIAL']:
+        errors.append(f"ADAPTIVE_CONCURRENCY_MAX must be >= ADAPTIVE_CONCURRENCY_INITIAL, "
+                      f"current value: {config['ADAPTIVE_CONCURRENCY_MAX']}")
+
+    if config['ADAPTIVE_LATENCY_TOLERANCE'] <= 1:
+        errors.append(f"ADAPTIVE_LATENCY_TOLERANCE must be > 1, current value: {config['ADAPTIVE_LATENCY_TOLERANCE']}")
+
+    if config['CREATE_MAX_RETRIES'] < 0:
+        errors.append(f"CREATE_MAX_RETRIES must be >= 0, current value: {config['CREATE_MAX_RETRIES']}")
+
+    if config['RETRY_BACKOFF_BASE_MS'] < 0 or config['RETRY_BACKOFF_MAX_MS'] < config['RETRY_BACKOFF_BASE_MS']:
+        errors.append("RETRY_BACKOFF_BASE_MS must be >= 0 and RETRY_BACKOFF_MAX_MS >= RETRY_BACKOFF_BASE_MS")
+
+    if config['APPIUM_READY_TIMEOUT_SECONDS'] <= 0:
+        errors.append(f"APPIUM_READY_TIMEOUT_SECONDS must be > 0, current value: {config['APPIUM_READY_TIMEOUT_SECONDS']}")
+
+    if config['READINESS_MIN_INTERVAL_MS'] <= 0 or config['READINESS_MAX_INTERVAL_MS'] < config['READINESS_MIN_INTERVAL_MS']:
+        errors.append("READINESS_MIN_INTERVAL_MS must be > 0 and READINESS_MAX_INTERVAL_MS >= READINESS_MIN_INTERVAL_MS")
+
+    if config['SCREENSHOT_FORMAT'] not in SCREENSHOT_EXTENSIONS:
+        errors.append(f"SCREENSHOT_FORMAT must be png, jpeg or webp, current value: {config['SCREENSHOT_FORMAT']}")
+    elif (config['SCREENSHOT_FORMAT'] != 'png' or config['SCREENSHOT_MAX_WIDTH'] > 0) and not pillow_available():
+        errors.append("SCREENSHOT_FORMAT=jpeg/webp and SCREENSHOT_MAX_WIDTH require Pillow (pip install pillow)")
+
+    if not 1 <= config['SCREENSHOT_QUALITY'] <= 100:
+        errors.append(f"SCREENSHOT_QUALITY must be between 1 and 100, current value: {config['SCREENSHOT_QUALITY']}")
+
+    if config['SCREENSHOT_MAX_WIDTH'] < 0:
+        errors.append(f"SCREENSHOT_MAX_WIDTH must be >= 0, current value: {config['SCREENSHOT_MAX_WIDTH']}")
+
+    if config['SCREENSHOT_WRITE_QUEUE'] < 1:
+        errors.append(f"SCREENSHOT_WRITE_QUEUE must be >= 1, current value: {config['SCREENSHOT_WRITE_QUEUE']}")
+
+    if config['LOGCAT_POLL_SECONDS'] <= 0:
+        errors.append(f"LOGCAT_POLL_SECONDS must be > 0, current value: {config['LOGCAT_POLL_SECONDS']}")
+
+    if config['LOGCAT_ROTATE_MB'] < 1:
+        errors.append(f"LOGCAT_ROTATE_MB must be >= 1, current value: {config['LOGCAT_ROTATE_MB']}")
+
+    if config['UPLOAD_CHUNK_SIZE_MB'] < 1:
+        errors.append(f"UPLOAD_CHUNK_SIZE_MB must be >= 1, current value: {config['UPLOAD_CHUNK_SIZE_MB']}")
+
+    if config['UPLOAD_PARALLELISM'] < 1:
+        errors.append(f"UPLOAD_PARALLELISM must be >= 1, current value: {config['UPLOAD_PARALLELISM']}")
+
     if errors:
         raise ConfigurationError("\n".join(errors))
 
@@ -262,6 +640,9 @@ def _validate_config(config: Dict[str, Any]) -> None:
     if config.get('PROCESS_COUNT', 1) > 1 and config['SANDBOX_COUNT'] < config.get('PROCESS_COUNT', 1):
         print("Warning: PROCESS_COUNT > SANDBOX_COUNT, will only start SANDBOX_COUNT processes", file=sys.stderr)
 
+    if config['SANDBOX_POOL_SIZE'] > config['SANDBOX_COUNT']:
+        print("Warning: SANDBOX_POOL_SIZE > SANDBOX_COUNT, pool will only warm SANDBOX_COUNT sandboxes", file=sys.stderr)
+
 
 # =============================================================================
 # Utility Functions
@@ -361,6 +742,69 @@ def create_operation_metrics() -> Dict[str, OperationMetrics]:
     }
 
 
+def build_operation_graph(pipelined: bool = True) -> Dict[str, Dict[str, Any]]:
+    """
+    Return the operation graph to execute.
+
+    Pipelined mode uses OPERATION_GRAPH; sequential mode chains OPERATIONS in order
+    (each operation depends on the previous one), matching the original behavior.
+    """
+    if not pipelined:
+        keys = [key for key, _ in OPERATIONS]
+        return {key: {'deps': keys[i - 1:i], 'lane': OPERATION_GRAPH[key]['lane']} for i, key in enumerate(keys)}
+
+    # Validate: every operation present, deps known, no cycles
+    keys = {key for key, _ in OPERATIONS}
+    if set(OPERATION_GRAPH) != keys:
+        raise ValueError(f"OPERATION_GRAPH keys do not match OPERATIONS: {sorted(set(OPERATION_GRAPH) ^ keys)}")
+    visiting: Set[str] = set()
+    visited: Set[str] = set()
+
+    def visit(key: str) -> None:
+        if key in visited:
+            return
+        if key in visiting:
+            raise ValueError(f"OPERATION_GRAPH has a cycle through '{key}'")
+        visiting.add(key)
+        for dep in OPERATION_GRAPH[key]['deps']:
+            if dep not in OPERATION_GRAPH:
+                raise ValueError(f"OPERATION_GRAPH: '{key}' depends on unknown operation '{dep}'")
+            visit(dep)
+        visiting.discard(key)
+        visited.add(key)
+
+    for key in OPERATION_GRAPH:
+        visit(key)
+    return OPERATION_GRAPH
+
+
+def compute_critical_path(graph: Dict[str, Dict[str, Any]],
+                          durations_ms: Dict[str, float]) -> Tuple[float, List[str]]:
+    """Longest dependency chain by measured operation duration: (total ms, operation keys in order)"""
+    finish: Dict[str, float] = {}
+    via: Dict[str, Optional[str]] = {}
+
+    def longest(key: str) -> float:
+        if key not in finish:
+            best_dep, best = None, 0.0
+            for dep in graph[key]['deps']:
+                if longest(dep) > best:
+                    best_dep, best = dep, finish[dep]
+            finish[key] = best + durations_ms.get(key, 0.0)
+            via[key] = best_dep
+        return finish[key]
+
+    if not graph:
+        return 0.0, []
+    end = max(graph, key=longest)
+    path: List[str] = []
+    node: Optional[str] = end
+    while node is not None:
+        path.append(node)
+        node = via[node]
+    return finish[end], path[::-1]
+
+
 # =============================================================================
 # APK Management
 # =============================================================================
@@ -405,60 +849,499 @@ def ensure_apk_ready(app_name: str = 'meituan') -> bool:
     if apk_path.exists():
         file_size_mb = apk_path.stat().st_size / (1024 * 1024)
         print(f"APK exists: {apk_path} ({file_size_mb:.1f}MB)")
-        return True
-
-    print(f"APK not found, starting download: {config['apk_name']}")
-    print("(Download time not included in batch operation time)")
+    else:
+        print(f"APK not found, starting download: {config['apk_name']}")
+        print("(Download time not included in batch operation time)")
 
-    if download_apk(config['apk_name'], apk_path):
+        if not download_apk(config['apk_name'], apk_path):
+            return False
         file_size_mb = apk_path.stat().st_size / (1024 * 1024)
         print(f"APK download complete: {apk_path} ({file_size_mb:.1f}MB)")
-        return True
-    return False
+
+    # Warm the digest cache so testers only verify against the device
+    start = time.perf_counter()
+    digest = file_md5(apk_path)
+    print(f"APK MD5: {digest} ({(time.perf_counter() - start) * 1000:.0f}ms)")
+    return True
+
+
+# Local file digest cache: resolved path -> (mtime_ns, size, md5)
+_digest_cache: Dict[str, Tuple[int, int, str]] = {}
+_digest_cache_lock = threading.Lock()
+
+
+def file_md5(path: Path) -> str:
+    """MD5 of a local file, hashed incrementally and cached by (mtime, size)"""
+    st = path.stat()
+    key = str(path.resolve())
+    with _digest_cache_lock:
+        cached = _digest_cache.get(key)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+
+    md5 = hashlib.md5()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(UPLOAD_READ_BLOCK_SIZE), b''):
+            md5.update(block)
+    digest = md5.hexdigest()
+    with _digest_cache_lock:
+        _digest_cache[key] = (st.st_mtime_ns, st.st_size, digest)
+    return digest
+
+
+class _Base64JsonBody:
+    """
+    Streamed push_file request body: {"path": ..., "data": "<base64 of file[offset:offset+length]>"}.
+
+    Reads the file slice block by block (disk reads run in the I/O thread pool) and
+    base64-encodes each block on the fly, so a chunk is never held in memory. The exact
+    encoded length is known up front, so the request is sent with Content-Length
+    instead of chunked transfer encoding.
+    """
+
+    def __init__(self, file_path: Path, offset: int, length: int, remote_path: str,
+                 executor: Optional[ThreadPoolExecutor] = None):
+        self.file_path = file_path
+        self.offset = offset
+        self.length = length
+        self.executor = executor
+        self._head = ('{"path": ' + json.dumps(remote_path) + ', "data": "').encode('utf-8')
+        self._tail = b'"}'
+
+    def __len__(self) -> int:
+        return len(self._head) + 4 * ((self.length + 2) // 3) + len(self._tail)
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        loop = asyncio.get_running_loop()
+        yield self._head
+        f = await loop.run_in_executor(self.executor, open, self.file_path, 'rb')
+        try:
+            await loop.run_in_executor(self.executor, f.seek, self.offset)
+            remaining = self.length
+            while remaining > 0:
+                block = await loop.run_in_executor(self.executor, f.read, min(UPLOAD_READ_BLOCK_SIZE, remaining))
+                if not block:
+                    raise IOError(f"Unexpected EOF reading {self.file_path} at offset {self.offset + self.length - remaining}")
+                remaining -= len(block)
+                yield base64.b64encode(block)
+        finally:
+            f.close()
+        yield self._tail
+
+
+class StreamedApkUploader:
+    """
+    Parallel streamed file upload over Appium push_file.
+
+    The file is split into chunks that are pushed concurrently over the shared HTTP pool
+    (one keep-alive connection per in-flight chunk), then merged, cleaned up and hashed
+    on the device with a single shell command. The local digest comes from file_md5()
+    (cached), so the APK is not re-read locally after the transfer.
+    """
+
+    def __init__(self, client: AsyncAppiumClient, chunk_size: int, parallelism: int,
+                 executor: Optional[ThreadPoolExecutor], log: Callable[[str], None]):
+        self.client = client
+        self.chunk_size = chunk_size
+        self.parallelism = parallelism
+        self.executor = executor
+        self._log = log
+
+    async def _push_chunk(self, semaphore: asyncio.Semaphore, file_path: Path, index: int, offset: int,
+                          length: int, max_attempts: int = 2) -> float:
+        chunk_path = f"{UPLOAD_TEMP_DIR}/chunk_{index:04d}"
+        async with semaphore:
+            start = time.perf_counter()
+            for attempt in range(max_attempts):
+                try:
+                    body = _Base64JsonBody(file_path, offset, length, chunk_path, self.executor)
+                    await self.client.post_stream('/appium/device/push_file', body, timeout=300)
+                    break
+                except (httpx.HTTPError, AppiumError):
+                    if attempt == max_attempts - 1:
+                        raise
+            return (time.perf_counter() - start) * 1000
+
+    async def upload(self, file_path: Path, remote_path: str) -> Tuple[bool, Dict[str, float]]:
+        """
+        Upload file_path to remote_path.
+
+        Returns:
+            (md5 match, phase timings in ms)
+        """
+        loop = asyncio.get_running_loop()
+        timings: Dict[str, float] = {}
+        file_size = await loop.run_in_executor(self.executor, lambda: file_path.stat().st_size)
+        chunks = [(i, off, min(self.chunk_size, file_size - off))
+                  for i, off in enumerate(range(0, file_size, self.chunk_size))]
+
+        # Local digest overlaps with the transfer (cache hit after the first upload)
+        digest_future = loop.run_in_executor(self.executor, file_md5, file_path)
+
+        t0 = time.perf_counter()
+        await self.client.shell(f"rm -rf {UPLOAD_TEMP_DIR} && mkdir -p {UPLOAD_TEMP_DIR} && rm -f {remote_path}")
+        timings['prep'] = (time.perf_counter() - t0) * 1000
+
+        t0 = time.perf_counter()
+        semaphore = asyncio.Semaphore(self.parallelism)
+        chunk_ms = await asyncio.gather(*[self._push_chunk(semaphore, file_path, i, off, length)
+                                          for i, off, length in chunks])
+        timings['upload'] = (time.perf_counter() - t0) * 1000
+        self._log(f"  [upload] {len(chunks)} chunks x {self.chunk_size / (1024 * 1024):.0f}MB, "
+                  f"parallel={self.parallelism}: {timings['upload']:.0f}ms "
+                  f"(slowest chunk {max(chunk_ms, default=0):.0f}ms)")
+
+        # Merge + cleanup + hash in one round trip (chunk_NNNN names glob in order)
+        t0 = time.perf_counter()
+        output = await self.client.shell(f"cat {UPLOAD_TEMP_DIR}/chunk_* > {remote_path} && rm -rf {UPLOAD_TEMP_DIR} "
+                                         f"&& md5sum {remote_path}")
+        timings['merge'] = (time.perf_counter() - t0) * 1000
+        local_md5 = await digest_future
+
+        remote_md5 = output.strip().split()[0] if output.strip() else ''
+        match = remote_md5.lower() == local_md5.lower()
+        if not match:
+            self._log(f"  [upload] MD5 MISMATCH! local={local_md5}, remote={remote_md5}")
+        return match, timings
+
+
+class ArtifactCache:
+    """
+    Content-addressed APK cache shared by all testers in a process.
+
+    Before uploading, a tester asks the device which copies it already has (its own
+    remote_path or <shared_dir>/<md5>.apk on a volume mounted into every sandbox) and
+    skips the transfer on a digest match. With a shared dir, one tester per digest
+    uploads to the shared location while the others wait and install from it.
+
+    Cache status per tester: device_hit, shared_hit, shared_upload (this tester fed
+    the shared dir) or miss (private upload).
+    """
+
+    def __init__(self, shared_dir: str = ''):
+        self.shared_dir = shared_dir.rstrip('/')
+        self._uploads: Dict[str, asyncio.Event] = {}
+        self._published: Dict[str, bool] = {}
+
+    def shared_path(self, digest: str) -> str:
+        return f"{self.shared_dir}/{digest}.apk"
+
+    async def probe(self, client: AsyncAppiumClient, digest: str, remote_path: str) -> Tuple[str, Optional[str]]:
+        """Return (status, device path) of a copy matching digest, or ('', None)"""
+        candidates = [('device_hit', remote_path)]
+        if self.shared_dir:
+            candidates.append(('shared_hit', self.shared_path(digest)))
+        output = await client.shell(f"md5sum {' '.join(path for _, path in candidates)} 2>/dev/null")
+
+        found: Dict[str, str] = {}
+        for line in str(output or '').splitlines():
+            parts = line.split()
+            if len(parts) >= 2:
+                found[parts[-1]] = parts[0].lower()
+        for status, path in candidates:
+            if found.get(path) == digest.lower():
+                return status, path
+        return '', None
+
+    def claim_upload(self, digest: str) -> bool:
+        """True if the caller should upload digest to the shared dir (first claimant, or previous upload failed)"""
+        event = self._uploads.get(digest)
+        if event is None or (event.is_set() and not self._published.get(digest, False)):
+            self._uploads[digest] = asyncio.Event()
+            self._published[digest] = False
+            return True
+        return False
+
+    def publish(self, digest: str, ok: bool) -> None:
+        self._published[digest] = ok
+        self._uploads[digest].set()
+
+    async def wait(self, digest: str, timeout: float = APK_SHARED_WAIT_SECONDS) -> bool:
+        """Wait for the shared upload of digest, True if it was published successfully"""
+        event = self._uploads.get(digest)
+        if event is None:
+            return False
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return self._published.get(digest, False)
 
 
 # =============================================================================
 # Logging Output Class
 # =============================================================================
 class TeeLogger:
-    """Logger that outputs to both terminal and file (supports context manager)"""
+    """
+    Queued console: output goes to the log file and (by verbosity) the terminal (context manager).
+
+    write() only appends to a queue; a single writer thread drains it every flush interval
+    and writes each batch with one call per stream, so concurrent testers never block on
+    terminal or file I/O. The log file receives every message in write order; the terminal
+    skips message classes above the verbosity threshold (see CONSOLE_VERBOSITY_LEVELS).
+    Per-sandbox step lines are queued unformatted with the call time and formatted by the
+    writer, so their console.log text is the same as a direct print.
+    """
 
-    def __init__(self, log_file: Path, mirror_to_terminal: bool = True):
+    def __init__(self, log_file: Path, mirror_to_terminal: bool = True, append: bool = False,
+                 verbosity: str = 'all', flush_interval: float = 0.1):
         self._terminal = sys.stdout
         self._log_file = log_file
         self._mirror_to_terminal = mirror_to_terminal
+        self._mode = 'a' if append else 'w'
         self._file: Optional[TextIO] = None
         self._original_stdout: Optional[TextIO] = None
+        self.verbosity = verbosity
+        self._threshold = CONSOLE_VERBOSITY_LEVELS.get(verbosity, CONSOLE_SANDBOX_STEP)
+        self._flush_interval = flush_interval
+        self._queue: Deque[Tuple[int, Any]] = deque()  # append/popleft are thread-safe
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._writer: Optional[threading.Thread] = None
+        # Overhead stats: time spent in write() by callers and by the writer thread
+        self.messages = 0
+        self.batches = 0
+        self.max_batch = 0
+        self.caller_ns = 0
+        self.writer_ns = 0
+        self.terminal_dropped = 0
 
     def __enter__(self) -> 'TeeLogger':
         self._original_stdout = sys.stdout
-        # Line buffering: avoid forced flush on every write, reduce I/O overhead in high-concurrency scenarios
-        self._file = open(self._log_file, 'w', encoding='utf-8', buffering=1)
+        self._file = open(self._log_file, self._mode, encoding='utf-8')
+        self._writer = threading.Thread(target=self._run_writer, name='console-writer', daemon=True)
+        self._writer.start()
         sys.stdout = self
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         sys.stdout = self._original_stdout or self._terminal
+        self._stop.set()
+        self._wake.set()
+        if self._writer is not None:
+            self._writer.join()
+            self._writer = None
+        self._drain()  # Anything written while the writer was stopping
         if self._file:
             self._file.close()
             self._file = None
     
-    def write(self, message: str) -> None:
-        if self._mirror_to_terminal:
-            self._terminal.write(message)
-        if self._file:
-            self._file.write(message)
+    def write(self, message: str, level: int = CONSOLE_GENERAL) -> None:
+        start = time.perf_counter_ns()
+        self._queue.append((level, message))
+        self.messages += 1
+        self.caller_ns += time.perf_counter_ns() - start
+
+    def log_sandbox(self, sandbox_id: int, message: str) -> None:
+        """Queue a per-sandbox step line ("  [time] [Sandbox id] message")"""
+        start = time.perf_counter_ns()
+        self._queue.append((CONSOLE_SANDBOX_STEP, (time.time(), sandbox_id, message)))
+        self.messages += 1
+        self.caller_ns += time.perf_counter_ns() - start
     
     def flush(self) -> None:
-        if self._mirror_to_terminal:
-            self._terminal.flush()
-        if self._file:
-            self._file.flush()
+        self._wake.set()
+
+    def _run_writer(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self._flush_interval)
+            self._wake.clear()
+            self._drain()
+
+    def _drain(self) -> None:
+        batch: List[Tuple[int, Any]] = []
+        try:
+            while True:
+                batch.append(self._queue.popleft())
+        except IndexError:
+            pass
+        if not batch:
+            return
+        start = time.perf_counter_ns()
+        file_parts: List[str] = []
+        terminal_parts: List[str] = []
+        for level, item in batch:
+            if level == CONSOLE_SANDBOX_STEP and isinstance(item, tuple):
+                ts, sandbox_id, message = item
+                item = (f"  [{datetime.fromtimestamp(ts).strftime('%H:%M:%S.%f')[:-3]}] "
+                        f"[Sandbox {sandbox_id:2d}] {message}\n")
+            file_parts.append(item)
+            if level <= self._threshold:
+                terminal_parts.append(item)
+            else:
+                self.terminal_dropped += 1
+        try:
+            if self._file:
+                self._file.write(''.join(file_parts))
+                self._file.flush()
+            if self._mirror_to_terminal and terminal_parts:
+                self._terminal.write(''.join(terminal_parts))
+                self._terminal.flush()
+        except (OSError, ValueError):
+            pass
+        self.batches += 1
+        self.max_batch = max(self.max_batch, len(batch))
+        self.writer_ns += time.perf_counter_ns() - start
+
+    def stats(self) -> Dict[str, Any]:
+        """Console logging overhead so far (for summary.json 'logging')"""
+        return {
+            'verbosity': self.verbosity,
+            'messages': self.messages,
+            'terminal_dropped': self.terminal_dropped,
+            'batches': self.batches,
+            'max_batch': self.max_batch,
+            'caller_overhead_ms': round(self.caller_ns / 1e6, 3),
+            'caller_avg_us': round(self.caller_ns / 1e3 / self.messages, 3) if self.messages else 0.0,
+            'writer_ms': round(self.writer_ns / 1e6, 3),
+        }
+
+
+def console_print(message: str, level: int = CONSOLE_GENERAL) -> None:
+    """print() with a message class, so the queued console can keep it off the terminal"""
+    out = sys.stdout
+    if isinstance(out, TeeLogger):
+        out.write(message + "\n", level)
+    else:
+        print(message)
+
+
+def console_log_sandbox(sandbox_id: int, message: str) -> None:
+    """Per-sandbox step line, queued unformatted so the writer thread stamps and filters it"""
+    out = sys.stdout
+    if isinstance(out, TeeLogger):
+        out.log_sandbox(sandbox_id, message)
+    else:
+        print(f"  [{format_timestamp()}] [Sandbox {sandbox_id:2d}] {message}")
+
+
+def merge_console_stats(per_process: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Sum console logging stats of the parent and worker processes"""
+    merged: Dict[str, Any] = {'messages': 0, 'terminal_dropped': 0, 'batches': 0, 'max_batch': 0,
+                              'caller_overhead_ms': 0.0, 'writer_ms': 0.0}
+    for stats in per_process.values():
+        for key in merged:
+            if key == 'max_batch':
+                merged[key] = max(merged[key], int(stats.get(key, 0)))
+            else:
+                merged[key] += stats.get(key, 0)
+    merged['caller_overhead_ms'] = round(merged['caller_overhead_ms'], 3)
+    merged['writer_ms'] = round(merged['writer_ms'], 3)
+    merged['caller_avg_us'] = round(merged['caller_overhead_ms'] * 1e3 / merged['messages'], 3) if merged['messages'] else 0.0
+    merged['verbosity'] = next((st.get('verbosity') for st in per_process.values() if st.get('verbosity')), 'all')
+    merged['per_process'] = per_process
+    return merged
 
 
 # =============================================================================
 # Data Classes
 # =============================================================================
+class LatencyHistogram:
+    """
+    Mergeable, bounded-memory latency histogram (DDSketch-style log buckets).
+
+    Each sample is counted in bucket ceil(log(v) / log(gamma)), so any reported
+    percentile is within HISTOGRAM_RELATIVE_ACCURACY of a real sample. Buckets are
+    sparse, and the bucket count is bounded by the latency range rather than the
+    number of samples (~1000 buckets for 1us..1 day), so merging worker results
+    costs the same at 10 or 10k sandboxes.
+    """
+
+    def __init__(self, relative_accuracy: float = HISTOGRAM_RELATIVE_ACCURACY):
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.buckets: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = 0.0
+        self.max = 0.0
+
+    def record(self, value_ms: float) -> None:
+        """Record a single latency sample"""
+        if self.count == 0:
+            self.min = self.max = value_ms
+        else:
+            self.min = min(self.min, value_ms)
+            self.max = max(self.max, value_ms)
+        self.count += 1
+        self.sum += value_ms
+
+        if value_ms <= HISTOGRAM_MIN_LATENCY_MS:
+            self.zero_count += 1
+            return
+        idx = math.ceil(math.log(value_ms) / self._log_gamma)
+        self.buckets[idx] = self.buckets.get(idx, 0) + 1
+
+    def merge(self, other: 'LatencyHistogram') -> None:
+        """Merge another histogram (must use the same relative accuracy)"""
+        if other.count == 0:
+            return
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError(f"Cannot merge histograms with different accuracy: "
+                             f"{self.relative_accuracy} vs {other.relative_accuracy}")
+        if self.count == 0:
+            self.min, self.max = other.min, other.max
+        else:
+            self.min = min(self.min, other.min)
+            self.max = max(self.max, other.max)
+        self.count += other.count
+        self.sum += other.sum
+        self.zero_count += other.zero_count
+        for idx, c in other.buckets.items():
+            self.buckets[idx] = self.buckets.get(idx, 0) + c
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Return the q-quantile (0 <= q <= 1), same rank rule as the old sorted-list P95"""
+        if self.count == 0:
+            return 0.0
+        if self.count == 1:
+            return self.min
+        rank = min(int(self.count * q), self.count - 1)
+        if rank == 0:
+            return self.min
+        if rank == self.count - 1:
+            return self.max
+
+        seen = self.zero_count
+        if rank < seen:
+            return self.min
+        for idx in sorted(self.buckets):
+            seen += self.buckets[idx]
+            if rank < seen:
+                value = 2 * self._gamma ** idx / (self._gamma + 1)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Compact JSON form (bucket keys are strings for JSON)"""
+        return {
+            'relative_accuracy': self.relative_accuracy,
+            'count': self.count,
+            'sum': self.sum,
+            'min': self.min,
+            'max': self.max,
+            'zero_count': self.zero_count,
+            'buckets': {str(k): v for k, v in sorted(self.buckets.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'LatencyHistogram':
+        h = cls(float(data.get('relative_accuracy', HISTOGRAM_RELATIVE_ACCURACY) or HISTOGRAM_RELATIVE_ACCURACY))
+        h.count = int(data.get('count', 0) or 0)
+        h.sum = float(data.get('sum', 0.0) or 0.0)
+        h.min = float(data.get('min', 0.0) or 0.0)
+        h.max = float(data.get('max', 0.0) or 0.0)
+        h.zero_count = int(data.get('zero_count', 0) or 0)
+        h.buckets = {int(k): int(v) for k, v in (data.get('buckets') or {}).items()}
+        return h
+
+
 @dataclass
 class OperationMetrics:
     """Metrics for a single operation type"""
@@ -466,13 +1349,17 @@ class OperationMetrics:
     total_runs: int = 0
     success_count: int = 0
     failure_count: int = 0
-    latencies_ms: List[float] = field(default_factory=list)
+    histogram: LatencyHistogram = field(default_factory=LatencyHistogram)
+    latencies_ms: List[float] = field(default_factory=list)  # Raw samples, only if keep_raw_latencies
     errors: List[str] = field(default_factory=list)
 
     # Retry statistics
     retry_triggered: int = 0  # Number of retries triggered
     retry_success: int = 0    # Successful after retry
     retry_failed: int = 0     # Still failed after retry
+
+    # Set from KEEP_RAW_LATENCIES (BatchRunner / _run_multiprocess)
+    keep_raw_latencies: ClassVar[bool] = False
     
     @property
     def success_rate(self) -> float:
@@ -480,29 +1367,33 @@ class OperationMetrics:
     
     @property
     def avg_latency_ms(self) -> float:
-        return statistics.mean(self.latencies_ms) if self.latencies_ms else 0.0
+        return self.histogram.mean
     
     @property
     def p95_latency_ms(self) -> float:
-        if len(self.latencies_ms) < 2:
-            return self.latencies_ms[0] if self.latencies_ms else 0.0
-        sorted_lat = sorted(self.latencies_ms)
-        idx = min(int(len(sorted_lat) * 0.95), len(sorted_lat) - 1)
-        return sorted_lat[idx]
+        return self.histogram.percentile(0.95)
     
     @property
     def max_latency_ms(self) -> float:
-        return max(self.latencies_ms) if self.latencies_ms else 0.0
+        return self.histogram.max
     
     @property
     def min_latency_ms(self) -> float:
-        return min(self.latencies_ms) if self.latencies_ms else 0.0
+        return self.histogram.min
+
+    def percentile(self, q: float) -> float:
+        return self.histogram.percentile(q)
+
+    def _record_latency(self, latency_ms: float) -> None:
+        self.histogram.record(latency_ms)
+        if self.keep_raw_latencies:
+            self.latencies_ms.append(latency_ms)
     
     def record_success(self, latency_ms: float, retried: bool = False) -> None:
         """Record successful operation"""
         self.total_runs += 1
         self.success_count += 1
-        self.latencies_ms.append(latency_ms)
+        self._record_latency(latency_ms)
         if retried:
             self.retry_triggered += 1
             self.retry_success += 1
@@ -513,41 +1404,48 @@ class OperationMetrics:
         self.failure_count += 1
         self.errors.append(error[:MAX_ERROR_MSG_LENGTH])
         if latency_ms > 0:
-            self.latencies_ms.append(latency_ms)
+            self._record_latency(latency_ms)
         if retried:
             self.retry_triggered += 1
             self.retry_failed += 1
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
-        return {
+        data: Dict[str, Any] = {
             'name': self.name,
             'total_runs': self.total_runs,
             'success_count': self.success_count,
             'failure_count': self.failure_count,
             'success_rate': f"{self.success_rate:.2f}%",
             'avg_latency_ms': f"{self.avg_latency_ms:.2f}",
-            'p95_latency_ms': f"{self.p95_latency_ms:.2f}",
+        }
+        for label, q in REPORT_PERCENTILES:
+            data[f'{label}_latency_ms'] = f"{self.percentile(q):.2f}"
+        data.update({
             'max_latency_ms': f"{self.max_latency_ms:.2f}",
             'min_latency_ms': f"{self.min_latency_ms:.2f}",
             'retry_triggered': self.retry_triggered,
             'retry_success': self.retry_success,
             'retry_failed': self.retry_failed,
-        }
+        })
+        return data
     
     def to_detail_dict(self) -> Dict[str, Any]:
-        """Convert to detail dictionary (for details.json, includes raw samples)"""
-        return {
+        """Convert to detail dictionary (for details.json, histogram plus optional raw samples)"""
+        data: Dict[str, Any] = {
             'name': self.name,
             'total_runs': self.total_runs,
             'success_count': self.success_count,
             'failure_count': self.failure_count,
-            'latencies_ms': self.latencies_ms,
+            'histogram': self.histogram.to_dict(),
             'errors': self.errors,
             'retry_triggered': self.retry_triggered,
             'retry_success': self.retry_success,
             'retry_failed': self.retry_failed,
         }
+        if self.latencies_ms:
+            data['latencies_ms'] = self.latencies_ms
+        return data
     
     @classmethod
     def from_detail_dict(cls, data: Dict[str, Any]) -> 'OperationMetrics':
@@ -557,6 +1455,14 @@ class OperationMetrics:
         m.success_count = int(data.get('success_count', 0) or 0)
         m.failure_count = int(data.get('failure_count', 0) or 0)
         m.latencies_ms = [float(x) for x in (data.get('latencies_ms') or [])]
+        if isinstance(data.get('histogram'), dict):
+            m.histogram = LatencyHistogram.from_dict(data['histogram'])
+        else:
+            # Compatible with old format: rebuild histogram from raw samples
+            for x in m.latencies_ms:
+                m.histogram.record(x)
+        if not cls.keep_raw_latencies:
+            m.latencies_ms = []
         m.errors = [str(x) for x in (data.get('errors') or [])]
         m.retry_triggered = int(data.get('retry_triggered', 0) or 0)
         m.retry_success = int(data.get('retry_success', 0) or 0)
@@ -568,7 +1474,9 @@ class OperationMetrics:
         self.total_runs += other.total_runs
         self.success_count += other.success_count
         self.failure_count += other.failure_count
-        self.latencies_ms.extend(other.latencies_ms)
+        self.histogram.merge(other.histogram)
+        if self.keep_raw_latencies:
+            self.latencies_ms.extend(other.latencies_ms)
         self.errors.extend(other.errors)
         self.retry_triggered += other.retry_triggered
         self.retry_success += other.retry_success
@@ -585,9 +1493,12 @@ class SandboxTestResult:
 
     create_latency_ms: float = 0.0
     connect_latency_ms: float = 0.0
+    ready_latency_ms: float = 0.0     # Time until Appium /healthz answered 200 (part of connect)
     total_latency_ms: float = 0.0
 
     create_success: bool = False
+    ready_success: bool = False
+    ready_probes: int = 0
     connect_success: bool = False
     operations_success: bool = False
     destroy_success: bool = False
@@ -595,6 +1506,22 @@ class SandboxTestResult:
     # Retry related
     create_retry_count: int = 0  # Retry count (0 means success on first try)
     create_retried: bool = False  # Whether retry was triggered
+    create_source: str = ""       # 'pool' (warm pool hit) or 'cold' (created on demand)
+    apk_cache_status: str = ""    # device_hit / shared_hit / shared_upload / miss ('' = not uploaded)
+
+    # Load generator timing
+    start_ts: float = 0.0             # Epoch seconds when the tester started (for per-window breakdown)
+    scheduled_offset_s: float = 0.0   # Scheduled arrival offset (open mode) / iteration start (closed mode)
+    queue_delay_ms: float = 0.0       # Start delay behind the schedule (MAX_IN_FLIGHT backpressure)
+    virtual_user: int = -1            # Closed mode: virtual user index
+
+    # Operation graph timing
+    operations_wall_ms: float = 0.0                          # First operation start to last operation end
+    critical_path_ms: float = 0.0                            # Longest dependency chain by operation latency
+    critical_path: List[str] = field(default_factory=list)   # Operation keys on that chain
+
+    # Screenshot pipeline: one entry per frame (capture_ms, encode_ms, write_ms, bytes, write_ok)
+    screenshots: List[Dict[str, Any]] = field(default_factory=list)
 
     # Timestamps (for debugging)
     start_time: str = ""           # Test start time
@@ -620,9 +1547,22 @@ class SandboxTestResult:
             'operations_success': self.operations_success,
             'create_latency_ms': self.create_latency_ms,
             'connect_latency_ms': self.connect_latency_ms,
+            'ready_latency_ms': self.ready_latency_ms,
+            'ready_success': self.ready_success,
+            'ready_probes': self.ready_probes,
             'total_latency_ms': self.total_latency_ms,
             'create_retry_count': self.create_retry_count,
             'create_retried': self.create_retried,
+            'create_source': self.create_source,
+            'apk_cache_status': self.apk_cache_status,
+            'start_ts': self.start_ts,
+            'scheduled_offset_s': self.scheduled_offset_s,
+            'queue_delay_ms': self.queue_delay_ms,
+            'virtual_user': self.virtual_user,
+            'operations_wall_ms': self.operations_wall_ms,
+            'critical_path_ms': self.critical_path_ms,
+            'critical_path': self.critical_path,
+            'screenshots': self.screenshots,
             'start_time': self.start_time,
             'end_time': self.end_time,
             'create_start_time': self.create_start_time,
@@ -649,10 +1589,23 @@ def _sandbox_test_result_from_detail_dict(data: Dict[str, Any]) -> SandboxTestRe
     
     r.create_latency_ms = float(data.get('create_latency_ms', 0.0) or 0.0)
     r.connect_latency_ms = float(data.get('connect_latency_ms', 0.0) or 0.0)
+    r.ready_latency_ms = float(data.get('ready_latency_ms', 0.0) or 0.0)
+    r.ready_success = bool(data.get('ready_success', False))
+    r.ready_probes = int(data.get('ready_probes', 0) or 0)
     r.total_latency_ms = float(data.get('total_latency_ms', 0.0) or 0.0)
     
     r.create_retry_count = int(data.get('create_retry_count', 0) or 0)
     r.create_retried = bool(data.get('create_retried', False))
+    r.create_source = str(data.get('create_source', '') or '')
+    r.apk_cache_status = str(data.get('apk_cache_status', '') or '')
+    r.start_ts = float(data.get('start_ts', 0.0) or 0.0)
+    r.scheduled_offset_s = float(data.get('scheduled_offset_s', 0.0) or 0.0)
+    r.queue_delay_ms = float(data.get('queue_delay_ms', 0.0) or 0.0)
+    r.virtual_user = int(data.get('virtual_user', -1))
+    r.operations_wall_ms = float(data.get('operations_wall_ms', 0.0) or 0.0)
+    r.critical_path_ms = float(data.get('critical_path_ms', 0.0) or 0.0)
+    r.critical_path = [str(x) for x in (data.get('critical_path') or [])]
+    r.screenshots = [dict(x) for x in (data.get('screenshots') or [])]
     
     r.start_time = str(data.get('start_time', '') or '')
     r.end_time = str(data.get('end_time', '') or '')
@@ -686,6 +1639,939 @@ def _sandbox_test_result_from_detail_dict(data: Dict[str, Any]) -> SandboxTestRe
     return r
 
 
+# =============================================================================
+# Screenshot Pipeline
+# =============================================================================
+def pillow_available() -> bool:
+    """Pillow is optional; only needed to re-encode or downscale screenshots"""
+    try:
+        import PIL  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def encode_screenshot(b64_png: str, fmt: str = 'png', quality: int = 80, max_width: int = 0) -> bytes:
+    """
+    Decode an Appium screenshot (base64 PNG) and optionally downscale / re-encode it.
+
+    Runs on the I/O thread pool. With the defaults (png, no max width) the decoded
+    PNG bytes are returned unchanged and Pillow is not needed.
+    """
+    png = base64.b64decode(b64_png)
+    if fmt == 'png' and not max_width:
+        return png
+
+    from PIL import Image
+    with Image.open(io.BytesIO(png)) as img:
+        frame = img
+        if max_width and frame.width > max_width:
+            frame = frame.resize((max_width, max(1, round(frame.height * max_width / frame.width))),
+                                 Image.BILINEAR)
+        if fmt == 'jpeg' and frame.mode not in ('RGB', 'L'):
+            frame = frame.convert('RGB')
+        out = io.BytesIO()
+        if fmt == 'png':
+            frame.save(out, format='PNG')
+        else:
+            frame.save(out, format=fmt.upper(), quality=quality)
+        return out.getvalue()
+
+
+class ScreenshotWriter:
+    """
+    Bounded background writer for screenshot files (one per process).
+
+    Testers hand encoded frames to submit() and continue with the next operation;
+    SCREENSHOT_WRITERS tasks drain the queue onto the I/O thread pool. The queue is
+    bounded, so when the disk falls behind, submit() waits instead of letting frames
+    pile up in memory. Each submit returns a future resolving to the write time (ms).
+    """
+
+    def __init__(self, executor: ThreadPoolExecutor, queue_size: int, writers: int = SCREENSHOT_WRITERS):
+        self.executor = executor
+        self.writers = max(1, writers)
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, queue_size))
+        self._tasks: List[asyncio.Task] = []
+
+    def start(self) -> None:
+        self._tasks = [asyncio.create_task(self._run()) for _ in range(self.writers)]
+
+    async def submit(self, path: Path, data: bytes) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((path, data, future))
+        return future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            path, data, future = await self._queue.get()
+            start = time.perf_counter()
+            try:
+                await loop.run_in_executor(self.executor, path.write_bytes, data)
+                if not future.done():
+                    future.set_result((time.perf_counter() - start) * 1000)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            finally:
+                self._queue.task_done()
+
+    async def close(self) -> None:
+        """Write out everything queued, then stop the writer tasks"""
+        if self._tasks:
+            await self._queue.join()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+
+# =============================================================================
+# Logcat Collector
+# =============================================================================
+class LogcatCollector:
+    """
+    Incremental logcat capture for one device.
+
+    A background task reads `logcat -d -v epoch -T <cursor>` every poll interval,
+    where the cursor is the timestamp of the last line already saved, so each read
+    returns only new lines. LOGCAT_FILTER filterspecs are passed to logcat and
+    applied on the device. Lines are appended to gzip segments on the I/O thread
+    pool, rotating after `rotate_bytes` of uncompressed text, so memory use does
+    not grow with the log. finish() does one last read and closes the files.
+    """
+
+    def __init__(self, client: 'AsyncAppiumClient', out_dir: Path, executor: ThreadPoolExecutor,
+                 poll_interval: float, filter_spec: str = '', rotate_bytes: int = 16 * 1024 * 1024,
+                 name: str = 'logcat'):
+        self.client = client
+        self.out_dir = out_dir
+        self.executor = executor
+        self.poll_interval = poll_interval
+        self.filter_args = filter_spec.split() if filter_spec else []
+        self.rotate_bytes = rotate_bytes
+        self.name = name
+        self.cursor: Optional[str] = None
+        self.lines_written = 0
+        self.bytes_written = 0
+        self.files: List[Path] = []
+        self._seen_at_cursor: Set[str] = set()  # Lines at the cursor timestamp (-T is inclusive)
+        self._segment: Optional[gzip.GzipFile] = None
+        self._segment_bytes = 0
+        self._write_lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                await self.poll()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if logger:
+                    logger.debug(f"Logcat poll failed: {e}")
+
+    async def poll(self) -> int:
+        """Read lines newer than the cursor and append them to the current segment"""
+        args = ['logcat', '-d', '-v', 'epoch']
+        if self.cursor is not None:
+            args += ['-T', self.cursor]
+        output = await self.client.shell(_shell_command_text(args + self.filter_args))
+        lines = self._take_new_lines(output)
+        if lines:
+            await asyncio.get_running_loop().run_in_executor(self.executor, self._write, lines)
+        return len(lines)
+
+    def _take_new_lines(self, output: str) -> List[str]:
+        new_lines: List[str] = []
+        for line in output.splitlines():
+            match = LOGCAT_TIMESTAMP_PATTERN.match(line)
+            if not match:
+                if line.startswith('--------- beginning of'):
+                    continue
+                new_lines.append(line)  # Continuation of the previous entry
+                continue
+            ts = match.group(1)
+            if self.cursor is not None and float(ts) <= float(self.cursor):
+                if ts == self.cursor and line not in self._seen_at_cursor:
+                    self._seen_at_cursor.add(line)
+                    new_lines.append(line)
+                continue
+            if ts != self.cursor:
+                self.cursor = ts
+                self._seen_at_cursor = set()
+            self._seen_at_cursor.add(line)
+            new_lines.append(line)
+        return new_lines
+
+    def _write(self, lines: List[str]) -> None:
+        data = ('\n'.join(lines) + '\n').encode('utf-8', errors='replace')
+        with self._write_lock:
+            if self._segment is None or self._segment_bytes >= self.rotate_bytes:
+                self._close_segment()
+                path = self.out_dir / f"{self.name}_{len(self.files):03d}.txt.gz"
+                self._segment = gzip.open(path, 'wb', compresslevel=6)
+                self._segment_bytes = 0
+                self.files.append(path)
+            self._segment.write(data)
+            self._segment_bytes += len(data)
+            self.bytes_written += len(data)
+            self.lines_written += len(lines)
+
+    def _close_segment(self) -> None:
+        if self._segment is not None:
+            self._segment.close()
+            self._segment = None
+
+    async def _cancel(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def finish(self) -> int:
+        """Stop polling, read the remaining lines, close the files; returns total lines saved"""
+        await self._cancel()
+        try:
+            await self.poll()
+        finally:
+            await self.stop()
+        return self.lines_written
+
+    async def stop(self) -> None:
+        """Stop polling and close the current segment (no final read)"""
+        await self._cancel()
+        await asyncio.get_running_loop().run_in_executor(self.executor, self._locked_close)
+
+    def _locked_close(self) -> None:
+        with self._write_lock:
+            self._close_segment()
+
+
+# =============================================================================
+# Time Series Metrics
+# =============================================================================
+class TimeSeriesRecorder:
+    """
+    Per-second metrics stream for one process.
+
+    Every create / connect / operation outcome is bucketed by the wall-clock second it
+    finished in. A background task appends completed seconds to an append-only JSONL
+    file, one line per second with per-operation counts, errors, percentiles and the
+    serialized histogram, so the file can be tailed during a run and merged across
+    workers afterwards (see merge_timeseries_files).
+    """
+
+    def __init__(self, path: Path, worker_id: Optional[int] = 0, flush_interval: float = 1.0):
+        self.path = path
+        self.worker_id = worker_id
+        self.flush_interval = flush_interval
+        self._buckets: Dict[int, Dict[str, Dict[str, Any]]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self.lines_written = 0
+
+    def record(self, op: str, success: bool, latency_ms: float, ts: Optional[float] = None) -> None:
+        """Record one outcome at ts (epoch seconds, default now)"""
+        second = int(ts if ts is not None else time.time())
+        ops = self._buckets.setdefault(second, {})
+        entry = ops.get(op)
+        if entry is None:
+            entry = ops[op] = {'count': 0, 'errors': 0, 'histogram': LatencyHistogram()}
+        entry['count'] += 1
+        if not success:
+            entry['errors'] += 1
+        entry['histogram'].record(latency_ms)
+
+    def start(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._task = asyncio.create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            self.flush()
+
+    def flush(self, force: bool = False) -> None:
+        """Append completed seconds (all seconds if force) to the file"""
+        cutoff = int(time.time()) - TIMESERIES_GRACE_SECONDS
+        ready = sorted(sec for sec in self._buckets if force or sec <= cutoff)
+        if not ready:
+            return
+        lines = [json.dumps(_timeseries_line(sec, self._buckets.pop(sec), self.worker_id), ensure_ascii=False)
+                 for sec in ready]
+        try:
+            with self.path.open('a', encoding='utf-8') as f:
+                f.write("\n".join(lines) + "\n")
+            self.lines_written += len(lines)
+        except OSError as e:
+            if logger:
+                logger.warning(f"Failed to write time series: {e}")
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self.flush(force=True)
+
+
+def _timeseries_line(second: int, ops: Dict[str, Dict[str, Any]], worker_id: Optional[int]) -> Dict[str, Any]:
+    """Serialize one second of outcomes"""
+    line: Dict[str, Any] = {
+        'ts': second,
+        'time': datetime.fromtimestamp(second).isoformat(),
+    }
+    if worker_id is not None:
+        line['worker_id'] = worker_id
+    line['ops'] = {}
+    for op, entry in sorted(ops.items()):
+        h: LatencyHistogram = entry['histogram']
+        line['ops'][op] = {
+            'count': entry['count'],
+            'errors': entry['errors'],
+            'p50_ms': round(h.percentile(0.50), 2),
+            'p95_ms': round(h.percentile(0.95), 2),
+            'p99_ms': round(h.percentile(0.99), 2),
+            'max_ms': round(h.max, 2),
+            'histogram': h.to_dict(),
+        }
+    return line
+
+
+def merge_timeseries_files(paths: List[Path], out_path: Path) -> int:
+    """Merge per-worker timeseries.jsonl files into one timeline; returns the number of seconds written"""
+    merged: Dict[int, Dict[str, Dict[str, Any]]] = {}
+    for path in paths:
+        if not path.exists():
+            continue
+        with path.open('r', encoding='utf-8') as f:
+            for raw in f:
+                try:
+                    line = json.loads(raw)
+                except json.JSONDecodeError:
+                    continue  # Truncated last line of a killed worker
+                ops = merged.setdefault(int(line['ts']), {})
+                for op, data in (line.get('ops') or {}).items():
+                    entry = ops.get(op)
+                    if entry is None:
+                        entry = ops[op] = {'count': 0, 'errors': 0, 'histogram': LatencyHistogram()}
+                    entry['count'] += int(data.get('count', 0))
+                    entry['errors'] += int(data.get('errors', 0))
+                    entry['histogram'].merge(LatencyHistogram.from_dict(data.get('histogram') or {}))
+
+    with out_path.open('w', encoding='utf-8') as f:
+        for second in sorted(merged):
+            f.write(json.dumps(_timeseries_line(second, merged[second], None), ensure_ascii=False) + "\n")
+    return len(merged)
+
+
+# =============================================================================
+# Result Journal
+# =============================================================================
+class ResultJournal:
+    """
+    Append-only per-sandbox result journal (JSONL).
+
+    Each SandboxTestResult is written and flushed to the OS as soon as it completes, so
+    it survives the process being killed. fsync is batched: at most one per
+    JOURNAL_FSYNC_SECONDS (a background task covers idle periods), which protects
+    against a host crash without an fsync per sandbox.
+    """
+
+    def __init__(self, path: Path, fsync_interval: float = 1.0):
+        self.path = path
+        self.fsync_interval = fsync_interval
+        self.records = 0
+        self._pending = 0
+        self._last_fsync = time.monotonic()
+        self._file: Optional[TextIO] = open(path, 'a', encoding='utf-8')
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self.fsync_interval > 0:
+            self._task = asyncio.create_task(self._sync_loop())
+
+    async def _sync_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.fsync_interval)
+            self.sync()
+
+    def append(self, record: Dict[str, Any]) -> None:
+        if self._file is None:
+            return
+        try:
+            self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self._file.flush()
+            self.records += 1
+            self._pending += 1
+            if time.monotonic() - self._last_fsync >= self.fsync_interval:
+                self.sync()
+        except OSError as e:
+            if logger:
+                logger.warning(f"Failed to write result journal: {e}")
+
+    def sync(self) -> None:
+        if self._file is not None and self._pending:
+            try:
+                os.fsync(self._file.fileno())
+            except OSError as e:
+                if logger:
+                    logger.warning(f"Failed to fsync result journal: {e}")
+            self._pending = 0
+        self._last_fsync = time.monotonic()
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._file is not None:
+            self.sync()
+            self._file.close()
+            self._file = None
+
+
+def load_journal(task_dir: Path) -> Dict[int, Dict[str, Any]]:
+    """Read every journal under task_dir (including worker_*/), last record per sandbox id wins"""
+    records: Dict[int, Dict[str, Any]] = {}
+    for path in sorted(task_dir.rglob(JOURNAL_FILE)):
+        with path.open('r', encoding='utf-8') as f:
+            for raw in f:
+                try:
+                    data = json.loads(raw)
+                except json.JSONDecodeError:
+                    continue  # Torn last line of a killed process
+                if isinstance(data, dict) and 'sandbox_id' in data:
+                    records[int(data['sandbox_id'])] = data
+    return records
+
+
+def load_resume_state(task_dir: Path, config: Dict[str, Any]) -> Tuple[int, List[SandboxTestResult], List[int]]:
+    """Return (total, journaled results, sandbox ids still to run) for --resume"""
+    meta_path = task_dir / RUN_META_FILE
+    meta = json.loads(meta_path.read_text(encoding='utf-8')) if meta_path.exists() else {}
+    total = int(meta.get('sandbox_count') or config['SANDBOX_COUNT'])
+    journaled = load_journal(task_dir)
+    prior = [_sandbox_test_result_from_detail_dict(d) for sid, d in sorted(journaled.items()) if sid < total]
+    remaining = [sid for sid in range(total) if sid not in journaled]
+    return total, prior, remaining
+
+
+def write_run_meta(task_dir: Path, config: Dict[str, Any], sandbox_count: int, process_count: int) -> None:
+    meta = {
+        'sandbox_count': sandbox_count,
+        'process_count': process_count,
+        'load_mode': config.get('LOAD_MODE', 'burst'),
+        'created_at': datetime.now().isoformat(),
+    }
+    (task_dir / RUN_META_FILE).write_text(json.dumps(meta, indent=2, ensure_ascii=False), encoding='utf-8')
+
+
+# =============================================================================
+# Event Log
+# =============================================================================
+class EventLog:
+    """
+    Compact lifecycle event stream (JSONL, one file per process).
+
+    Each event is one short line: t (epoch seconds), w (worker), s (sandbox id), e (event)
+    plus event fields. Events: create_start, create_end, ready, connect, op (one per
+    operation), destroy and end (the finished result). Lines go through a large write
+    buffer that a background task flushes every EVENT_LOG_FLUSH_SECONDS, so an event
+    costs no syscall and the file can still be tailed. `python batch.py report`
+    rebuilds summary.json and timeseries.jsonl from these files (see rebuild_report).
+    """
+
+    def __init__(self, path: Path, worker_id: int = 0, buffer_bytes: int = 256 * 1024,
+                 flush_interval: float = EVENT_LOG_FLUSH_SECONDS):
+        self.path = path
+        self.worker_id = worker_id
+        self.flush_interval = flush_interval
+        self.events = 0
+        self._file: Optional[TextIO] = open(path, 'a', encoding='utf-8', buffering=buffer_bytes)
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            self.flush()
+
+    def emit(self, sandbox_id: int, event: str, **fields: Any) -> None:
+        if self._file is None:
+            return
+        record = {'t': round(time.time(), 3), 'w': self.worker_id, 's': sandbox_id, 'e': event, **fields}
+        try:
+            self._file.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + "\n")
+            self.events += 1
+        except OSError as e:
+            if logger:
+                logger.warning(f"Failed to write event log: {e}")
+
+    def flush(self) -> None:
+        if self._file is not None:
+            try:
+                self._file.flush()
+            except OSError as e:
+                if logger:
+                    logger.warning(f"Failed to flush event log: {e}")
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._file is not None:
+            self.flush()
+            self._file.close()
+            self._file = None
+
+
+def result_end_event(result: SandboxTestResult) -> Dict[str, Any]:
+    """Fields of the 'end' event: everything in the result not covered by earlier events"""
+    return {
+        'ok': result.success, 'ms': round(result.total_latency_ms, 2), 'ops_ok': result.operations_success,
+        'start_ts': result.start_ts, 'queue_ms': round(result.queue_delay_ms, 2),
+        'offset_s': result.scheduled_offset_s, 'vu': result.virtual_user, 'apk': result.apk_cache_status,
+        'wall_ms': round(result.operations_wall_ms, 2), 'crit_ms': round(result.critical_path_ms, 2),
+        'path': result.critical_path, 'frames': result.screenshots, 'err': result.error,
+    }
+
+
+def find_event_logs(sources: List[Path]) -> List[Path]:
+    """Event log files from file paths and directories (searched recursively)"""
+    paths: List[Path] = []
+    for source in sources:
+        if source.is_dir():
+            paths.extend(sorted(p for p in source.rglob(EVENT_LOG_FILE) if REPORT_DIR_NAME not in p.parts))
+        elif source.exists():
+            paths.append(source)
+    return list(dict.fromkeys(paths))
+
+
+def iter_events(paths: List[Path]) -> Iterator[Dict[str, Any]]:
+    for path in paths:
+        with path.open('r', encoding='utf-8') as f:
+            for raw in f:
+                try:
+                    event = json.loads(raw)
+                except json.JSONDecodeError:
+                    continue  # Torn last line of a killed process
+                if isinstance(event, dict) and 'e' in event and 's' in event:
+                    yield event
+
+
+def results_from_events(paths: List[Path]) -> List[SandboxTestResult]:
+    """
+    Rebuild one SandboxTestResult per sandbox id from event logs.
+
+    A create_start starts the sandbox over (a resumed run re-runs unfinished ids).
+    Sandboxes without an end event were interrupted and are reported as failed.
+    """
+    results: Dict[int, SandboxTestResult] = {}
+    for ev in iter_events(paths):
+        sid, kind, t = int(ev['s']), ev['e'], float(ev.get('t', 0.0))
+        r = results.get(sid)
+        if kind == 'create_start' or r is None:
+            r = results[sid] = SandboxTestResult(sandbox_id=sid, worker_id=int(ev.get('w', 0) or 0))
+            r.start_ts = t
+            r.start_time = datetime.fromtimestamp(t).strftime('%H:%M:%S.%f')[:-3]
+            r.error = 'No end event (run interrupted)'
+            r.operation_metrics = create_operation_metrics()
+        if kind == 'create_end':
+            r.create_success = bool(ev.get('ok'))
+            r.create_latency_ms = float(ev.get('ms', 0.0))
+            r.create_source = ev.get('src', '')
+            r.create_retry_count = int(ev.get('retries', 0))
+            r.create_retried = r.create_retry_count > 0
+            r.real_sandbox_id = ev.get('rid', '')
+        elif kind == 'ready':
+            r.ready_success = bool(ev.get('ok'))
+            r.ready_latency_ms = float(ev.get('ms', 0.0))
+            r.ready_probes = int(ev.get('probes', 0))
+        elif kind == 'connect':
+            r.connect_success = bool(ev.get('ok'))
+            r.connect_latency_ms = float(ev.get('ms', 0.0))
+        elif kind == 'op':
+            metrics = r.operation_metrics.get(ev.get('k', ''))
+            if metrics is not None:
+                if ev.get('ok'):
+                    metrics.record_success(float(ev.get('ms', 0.0)), retried=bool(ev.get('retried')))
+                else:
+                    metrics.record_failure(str(ev.get('err', '')), float(ev.get('ms', 0.0)),
+                                           retried=bool(ev.get('retried')))
+        elif kind == 'destroy':
+            r.destroy_success = bool(ev.get('ok'))
+        elif kind == 'end':
+            r.success = bool(ev.get('ok'))
+            r.total_latency_ms = float(ev.get('ms', 0.0))
+            r.operations_success = bool(ev.get('ops_ok'))
+            r.start_ts = float(ev.get('start_ts') or r.start_ts)
+            r.queue_delay_ms = float(ev.get('queue_ms', 0.0))
+            r.scheduled_offset_s = float(ev.get('offset_s', 0.0))
+            r.virtual_user = int(ev.get('vu', -1))
+            r.apk_cache_status = ev.get('apk', '')
+            r.operations_wall_ms = float(ev.get('wall_ms', 0.0))
+            r.critical_path_ms = float(ev.get('crit_ms', 0.0))
+            r.critical_path = list(ev.get('path') or [])
+            r.screenshots = list(ev.get('frames') or [])
+            r.error = ev.get('err', '')
+            r.end_time = datetime.fromtimestamp(t).strftime('%H:%M:%S.%f')[:-3]
+    return [results[sid] for sid in sorted(results)]
+
+
+def timeseries_from_events(paths: List[Path], out_path: Path) -> int:
+    """Rebuild timeseries.jsonl (create / ready / connect / operations / sandbox_total) from event logs"""
+    recorder = TimeSeriesRecorder(out_path, worker_id=None)
+    series = {'create_end': 'sandbox_create', 'ready': 'appium_ready', 'connect': 'appium_connect', 'end': 'sandbox_total'}
+    for ev in iter_events(paths):
+        op = ev.get('k') if ev['e'] == 'op' else series.get(ev['e'])
+        if op:
+            recorder.record(op, bool(ev.get('ok')), float(ev.get('ms', 0.0)), ts=float(ev.get('t', 0.0)))
+    out_path.unlink(missing_ok=True)
+    recorder.flush(force=True)
+    return recorder.lines_written
+
+
+def rebuild_report(sources: List[Path], out_dir: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+    """
+    Offline report from event logs: prints the summary tables and writes summary.json
+    and timeseries.jsonl to out_dir (default: <first source dir>/report). Nothing is re-run;
+    run.json next to the logs (if present) supplies the planned sandbox count and load mode.
+    """
+    paths = find_event_logs(sources)
+    if not paths:
+        print(f"No {EVENT_LOG_FILE} found in: {', '.join(str(s) for s in sources)}")
+        return None
+    first = sources[0] if sources[0].is_dir() else sources[0].parent
+    out_dir = out_dir or first / REPORT_DIR_NAME
+    out_dir.mkdir(parents=True, exist_ok=True)
+    print(f"Rebuilding report from {len(paths)} event log(s): {', '.join(str(p) for p in paths)}")
+
+    results = results_from_events(paths)
+    if not results:
+        print("No sandbox events found")
+        return None
+
+    config = dict(DEFAULT_CONFIG)
+    meta_path = next((d / RUN_META_FILE for d in [first, *first.parents][:3] if (d / RUN_META_FILE).exists()), None)
+    meta = json.loads(meta_path.read_text(encoding='utf-8')) if meta_path else {}
+    config['LOAD_MODE'] = meta.get('load_mode', config['LOAD_MODE'])
+    config['PROCESS_COUNT'] = int(meta.get('process_count') or len(paths))
+    total = max(int(meta.get('sandbox_count') or 0), len(results))
+
+    times = [float(ev.get('t', 0.0)) for ev in iter_events(paths)]
+    start_time = datetime.fromtimestamp(min(r.start_ts for r in results if r.start_ts > 0) if any(
+        r.start_ts > 0 for r in results) else min(times))
+    end_time = datetime.fromtimestamp(max(times))
+
+    reporter = ResultReporter(total)
+    summary = reporter.aggregate(results, start_time, end_time, config)
+    summary['report'] = {
+        'event_logs': [str(p) for p in paths],
+        'sandboxes_with_events': len(results),
+        'interrupted': sum(1 for r in results if r.error == 'No end event (run interrupted)'),
+    }
+    reporter.print_summary(summary)
+    if summary['report']['interrupted']:
+        print(f"Interrupted sandboxes (no end event, counted as failed): {summary['report']['interrupted']}")
+    (out_dir / 'summary.json').write_text(json.dumps(summary, indent=2, ensure_ascii=False), encoding='utf-8')
+    seconds = timeseries_from_events(paths, out_dir / TIMESERIES_FILE)
+    print(f"\nReport saved to: {out_dir} (summary.json, {TIMESERIES_FILE}: {seconds} seconds)")
+    return summary
+
+
+# =============================================================================
+# Load Profile
+# =============================================================================
+class LoadProfile:
+    """
+    Ramp-up / hold / ramp-down load profile.
+
+    rate_at(t) rises linearly from 0 to peak over ramp_up, stays at peak for hold and
+    falls back to 0 over ramp_down. Open-loop arrivals are generated by inverting the
+    cumulative rate: constant arrivals fall on every integer of the cumulative count,
+    Poisson arrivals on the cumulative sum of Exp(1) draws (non-homogeneous Poisson).
+    """
+
+    def __init__(self, peak: float, ramp_up: float, hold: float, ramp_down: float):
+        self.peak = peak
+        self.ramp_up = ramp_up
+        self.hold = hold
+        self.ramp_down = ramp_down
+        self.duration = ramp_up + hold + ramp_down
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], peak: float) -> 'LoadProfile':
+        return cls(peak, float(config.get('RAMP_UP_SECONDS', 0)), float(config.get('HOLD_SECONDS', 0)),
+                   float(config.get('RAMP_DOWN_SECONDS', 0)))
+
+    def level_at(self, t: float) -> float:
+        """Fraction of peak (0..1) at offset t seconds"""
+        if t < 0 or t > self.duration:
+            return 0.0
+        if t < self.ramp_up:
+            return t / self.ramp_up
+        if t <= self.ramp_up + self.hold:
+            return 1.0
+        return max(0.0, (self.duration - t) / self.ramp_down) if self.ramp_down else 0.0
+
+    def rate_at(self, t: float) -> float:
+        return self.peak * self.level_at(t)
+
+    def cumulative(self, t: float) -> float:
+        """Expected arrivals in [0, t]"""
+        t = min(max(t, 0.0), self.duration)
+        up = min(t, self.ramp_up)
+        total = self.peak * up * up / (2 * self.ramp_up) if self.ramp_up else 0.0
+        if t > self.ramp_up:
+            total += self.peak * (min(t, self.ramp_up + self.hold) - self.ramp_up)
+        if t > self.ramp_up + self.hold and self.ramp_down:
+            d = t - self.ramp_up - self.hold
+            total += self.peak * (d - d * d / (2 * self.ramp_down))
+        return total
+
+    def _invert(self, target: float) -> float:
+        lo, hi = 0.0, self.duration
+        for _ in range(60):
+            mid = (lo + hi) / 2
+            if self.cumulative(mid) < target:
+                lo = mid
+            else:
+                hi = mid
+        return hi
+
+    def arrival_times(self, process: str, max_count: int, rng: random.Random) -> List[float]:
+        """Arrival offsets (seconds) for the whole profile, capped at max_count"""
+        total = self.cumulative(self.duration)
+        times: List[float] = []
+        c = 0.0
+        while len(times) < max_count:
+            c += rng.expovariate(1.0) if process == 'poisson' else 1.0
+            if c > total:
+                break
+            times.append(self._invert(c))
+        return times
+
+
+# =============================================================================
+# Adaptive Concurrency
+# =============================================================================
+def _error_status_code(error: BaseException) -> Optional[int]:
+    """HTTP status carried by an exception (AppiumError, httpx), if any"""
+    code = getattr(error, 'status_code', None)
+    if code is None:
+        code = getattr(getattr(error, 'response', None), 'status_code', None)
+    try:
+        return int(code) if code is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def is_overload_error(error: BaseException) -> bool:
+    """True for errors that signal platform pressure: 429, 5xx, rate limits and timeouts"""
+    if isinstance(error, (asyncio.TimeoutError, httpx.TimeoutException)):
+        return True
+    # e2b is imported lazily, so match its exception classes by name
+    if type(error).__name__ in ('RateLimitException', 'TimeoutException'):
+        return True
+    code = _error_status_code(error)
+    if code is not None:
+        return code == 429 or code >= 500
+    return bool(OVERLOAD_ERROR_PATTERN.search(str(error)))
+
+
+def backoff_delay(attempt: int, base_ms: float, max_ms: float) -> float:
+    """Full-jitter exponential backoff in seconds for retry attempt (1-based)"""
+    return random.uniform(0, min(max_ms, base_ms * 2 ** (attempt - 1))) / 1000
+
+
+class AdaptiveLimiter:
+    """
+    Adaptive concurrency limit for one platform call (AIMD + latency gradient).
+
+    The limit grows by 1 per success until the first sign of pressure (slow start),
+    then by 1/limit per success (about +1 per limit's worth of calls). It is multiplied
+    by LIMITER_DECREASE_FACTOR, at most once per smoothed round trip, on 429/5xx/timeouts
+    or when smoothed latency exceeds latency_tolerance x the best recent latency. Other
+    errors (bad template, auth) leave the limit alone.
+
+    With enabled=False calls are never queued and the limit stays fixed, but outcomes
+    are still counted so the report shows overload errors either way.
+    """
+
+    def __init__(self, name: str, initial: int, max_limit: int, latency_tolerance: float = 2.0,
+                 enabled: bool = True, min_limit: int = 1):
+        self.name = name
+        self.enabled = enabled
+        self.limit = float(initial)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_tolerance = latency_tolerance
+        self.in_flight = 0
+        self._cond = asyncio.Condition()
+        self._slow_start = True
+        self._baseline_ms = 0.0
+        self._ewma_ms = 0.0
+        self._last_decrease = 0.0
+        self._started = time.monotonic()
+
+        # Statistics
+        self.successes = 0
+        self.failures = 0
+        self.overload_errors = 0
+        self.decreases = 0
+        self.min_seen = int(self.limit)
+        self.max_seen = int(self.limit)
+        self.wait = LatencyHistogram()
+        self.history: List[Dict[str, Any]] = []
+        self._record('start')
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one slot for the duration of a call; the outcome adjusts the limit"""
+        wait_start = time.perf_counter()
+        await self._acquire()
+        self.wait.record((time.perf_counter() - wait_start) * 1000)
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception as e:
+            self._on_failure(e)
+            raise
+        else:
+            self._on_success((time.perf_counter() - start) * 1000)
+        finally:
+            await self._release()
+
+    async def _acquire(self) -> None:
+        if not self.enabled:
+            self.in_flight += 1
+            return
+        async with self._cond:
+            await self._cond.wait_for(lambda: self.in_flight < max(self.min_limit, int(self.limit)))
+            self.in_flight += 1
+
+    async def _release(self) -> None:
+        if not self.enabled:
+            self.in_flight -= 1
+            return
+        async with self._cond:
+            self.in_flight -= 1
+            self._cond.notify(max(1, int(self.limit) - self.in_flight))
+
+    def _on_success(self, latency_ms: float) -> None:
+        self.successes += 1
+        if self._baseline_ms <= 0 or latency_ms < self._baseline_ms:
+            self._baseline_ms = latency_ms
+        else:
+            # Drift up slowly so a permanently slower platform is not treated as overload forever
+            self._baseline_ms += (latency_ms - self._baseline_ms) * LIMITER_BASELINE_DRIFT
+        self._ewma_ms = latency_ms if self._ewma_ms <= 0 else \
+            self._ewma_ms + (latency_ms - self._ewma_ms) * LIMITER_EWMA_ALPHA
+
+        if not self.enabled:
+            return
+        if self.successes >= LIMITER_MIN_SAMPLES and self._ewma_ms > self.latency_tolerance * self._baseline_ms:
+            self._decrease(f"latency {self._ewma_ms:.0f}ms > {self.latency_tolerance:g}x {self._baseline_ms:.0f}ms")
+            return
+
+        before = int(self.limit)
+        self.limit = min(float(self.max_limit), self.limit + (1.0 if self._slow_start else 1.0 / self.limit))
+        if int(self.limit) != before:
+            self._record('increase')
+
+    def _on_failure(self, error: BaseException) -> None:
+        self.failures += 1
+        if is_overload_error(error):
+            self.overload_errors += 1
+            if self.enabled:
+                self._decrease(f"overload: {str(error)[:80]}")
+
+    def _decrease(self, reason: str) -> None:
+        self._slow_start = False
+        now = time.monotonic()
+        if now - self._last_decrease < self._ewma_ms / 1000:
+            return  # At most one decrease per smoothed round trip
+        self._last_decrease = now
+        self.limit = max(float(self.min_limit), self.limit * LIMITER_DECREASE_FACTOR)
+        self.decreases += 1
+        self._record(reason)
+
+    def _record(self, reason: str) -> None:
+        self.min_seen = min(self.min_seen, int(self.limit))
+        self.max_seen = max(self.max_seen, int(self.limit))
+        self.history.append({
+            't': round(time.monotonic() - self._started, 3),
+            'limit': int(self.limit),
+            'in_flight': self.in_flight,
+            'reason': reason,
+        })
+        if len(self.history) > LIMITER_HISTORY_MAX:
+            self.history = self.history[::2]  # Thin evenly, keep the overall shape
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'enabled': self.enabled,
+            'limit': int(self.limit),
+            'min_limit_seen': self.min_seen,
+            'max_limit_seen': self.max_seen,
+            'successes': self.successes,
+            'failures': self.failures,
+            'overload_errors': self.overload_errors,
+            'decreases': self.decreases,
+            'wait_p50_ms': round(self.wait.percentile(0.50), 2),
+            'wait_p95_ms': round(self.wait.percentile(0.95), 2),
+            'history': self.history,
+        }
+
+
+def create_limiters(config: Dict[str, Any]) -> Dict[str, AdaptiveLimiter]:
+    """One limiter per guarded platform call (per process)"""
+    return {
+        name: AdaptiveLimiter(
+            name,
+            initial=int(config.get('ADAPTIVE_CONCURRENCY_INITIAL', 20) or 20),
+            max_limit=int(config.get('ADAPTIVE_CONCURRENCY_MAX', 1000) or 1000),
+            latency_tolerance=float(config.get('ADAPTIVE_LATENCY_TOLERANCE', 2.0) or 2.0),
+            enabled=bool(config.get('ADAPTIVE_CONCURRENCY', False)),
+        )
+        for name in LIMITED_CALLS
+    }
+
+
+def merge_limiter_stats(per_worker: Dict[int, Dict[str, Dict[str, Any]]]) -> Dict[str, Dict[str, Any]]:
+    """Combine worker limiter stats: limits and counters add up, histories stay per worker"""
+    merged: Dict[str, Dict[str, Any]] = {}
+    for wid, stats in sorted(per_worker.items()):
+        for name, d in stats.items():
+            m = merged.setdefault(name, {
+                'enabled': d.get('enabled', False), 'limit': 0, 'successes': 0, 'failures': 0,
+                'overload_errors': 0, 'decreases': 0, 'wait_p95_ms': 0.0, 'history': {},
+            })
+            for key in ('limit', 'successes', 'failures', 'overload_errors', 'decreases'):
+                m[key] += int(d.get(key, 0))
+            m['wait_p95_ms'] = max(m['wait_p95_ms'], float(d.get('wait_p95_ms', 0.0)))
+            m['history'][str(wid)] = d.get('history', [])
+    return merged
+
+
 # =============================================================================
 # Resource Manager
 # =============================================================================
@@ -695,8 +2581,12 @@ class ResourceManager:
     def __init__(self):
         self._sandboxes: Dict[int, Any] = {}
         self._drivers: Dict[int, Any] = {}
+        self._pool: Optional['SandboxPool'] = None
         self._cleanup_done = False
         self._lock = asyncio.Lock()
+
+    def register_pool(self, pool: 'SandboxPool') -> None:
+        self._pool = pool
     
     async def register_sandbox(self, sandbox_id: int, sandbox: Any) -> None:
         async with self._lock:
@@ -718,39 +2608,241 @@ class ResourceManager:
                 return
             self._cleanup_done = True
 
+            # Drain warm pool first so idle and in-flight pool sandboxes are not orphaned
+            if self._pool is not None:
+                await self._pool.drain()
+
             sandbox_count = len(self._sandboxes)
             driver_count = len(self._drivers)
 
-            if sandbox_count == 0 and driver_count == 0:
-                return
+            if sandbox_count == 0 and driver_count == 0:
+                return
+
+            print(f"\nCleaning up resources... (sandboxes: {sandbox_count}, drivers: {driver_count})")
+
+            # Clean up Appium sessions
+            async def quit_driver(driver: Any) -> None:
+                try:
+                    await driver.quit()
+                except Exception as e:
+                    if logger:
+                        logger.debug(f"Failed to cleanup driver: {e}")
+
+            await asyncio.gather(
+                *[quit_driver(d) for d in self._drivers.values()],
+                return_exceptions=True
+            )
+
+            # Clean up sandboxes
+            async def kill_sandbox(sandbox: Any) -> None:
+                try:
+                    await sandbox.kill()
+                except Exception as e:
+                    if logger:
+                        logger.debug(f"Failed to cleanup sandbox: {e}")
+
+            await asyncio.gather(
+                *[kill_sandbox(s) for s in self._sandboxes.values()],
+                return_exceptions=True
+            )
+
+            self._sandboxes.clear()
+            self._drivers.clear()
+            print("Resource cleanup complete")
+
+
+# =============================================================================
+# Sandbox Pool
+# =============================================================================
+class SandboxPool:
+    """
+    Pre-warmed sandbox pool.
+
+    Sandboxes are created ahead of time (and refilled in the background) so that
+    template cold-start is moved out of each tester's measured create path.
+    The pool never creates more sandboxes than the remaining demand of the run,
+    and idle sandboxes older than max_idle_seconds are discarded instead of handed out.
+    A hit has its timeout reset so the tester gets the full SANDBOX_TIMEOUT.
+    """
+
+    def __init__(self, config: Dict[str, Any], demand: int, create_limiter: Optional[AdaptiveLimiter] = None):
+        self.target_size = max(0, int(config.get('SANDBOX_POOL_SIZE', 0) or 0))
+        self._create_limiter = create_limiter
+        self.refill_concurrency = max(1, int(config.get('SANDBOX_POOL_REFILL_CONCURRENCY', 10) or 10))
+        self.max_idle_seconds = float(config.get('SANDBOX_POOL_MAX_IDLE_SECONDS', 120) or 120)
+        self._template = config['SANDBOX_TEMPLATE']
+        self._timeout = config['SANDBOX_TIMEOUT']
+
+        self._idle: Deque[Tuple[Any, float]] = deque()  # (sandbox, created_at monotonic)
+        self._pending = 0                               # pool creates in flight
+        self._remaining = max(0, int(demand))           # sandboxes still to hand out
+        self._semaphore = asyncio.Semaphore(self.refill_concurrency)
+        self._tasks: Set[asyncio.Task] = set()
+        self._closed = False
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.create_failures = 0
+
+    @property
+    def idle_count(self) -> int:
+        return len(self._idle)
+
+    def _spawn(self, coro: Any) -> None:
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _schedule_refill(self) -> None:
+        """Start pool creates until idle + pending reaches target size (capped by remaining demand)"""
+        if self._closed:
+            return
+        wanted = min(self.target_size, self._remaining)
+        while len(self._idle) + self._pending < wanted:
+            self._pending += 1
+            self._spawn(self._create_one())
+
+    async def _create_one(self) -> None:
+        try:
+            async with self._semaphore:
+                if self._closed:
+                    return
+                SandboxClass = get_async_sandbox_class()
+                try:
+                    async with (self._create_limiter.slot() if self._create_limiter else nullcontext()):
+                        sandbox = await SandboxClass.create(template=self._template, timeout=self._timeout)
+                except Exception as e:
+                    self.create_failures += 1
+                    if logger:
+                        logger.debug(f"Pool sandbox create failed: {extract_error_details(e)}")
+                    return
+            if self._closed:
+                await self._kill(sandbox)
+                return
+            self._idle.append((sandbox, time.monotonic()))
+        finally:
+            self._pending -= 1
+
+    async def _kill(self, sandbox: Any) -> None:
+        try:
+            await sandbox.kill()
+        except Exception as e:
+            if logger:
+                logger.debug(f"Failed to kill pool sandbox: {e}")
+
+    async def fill(self) -> None:
+        """Warm the pool up to target size and wait for the initial creates to finish"""
+        self._schedule_refill()
+        if self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    async def acquire(self) -> Optional[Any]:
+        """Take a warm sandbox from the pool, returns None on a miss (caller creates cold)"""
+        self._remaining = max(0, self._remaining - 1)
+        sandbox = None
+        while self._idle:
+            candidate, created_at = self._idle.popleft()
+            if time.monotonic() - created_at > self.max_idle_seconds:
+                self.expired += 1
+                self._spawn(self._kill(candidate))
+                continue
+            try:
+                # Idle time counted against the sandbox's own timeout; give it the full timeout back
+                await candidate.set_timeout(self._timeout)
+            except Exception as e:
+                if logger:
+                    logger.debug(f"Pool sandbox set_timeout failed: {extract_error_details(e)}")
+                self.expired += 1
+                self._spawn(self._kill(candidate))
+                continue
+            sandbox = candidate
+            break
+
+        if sandbox is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+        self._schedule_refill()
+        return sandbox
+
+    async def drain(self) -> None:
+        """Stop refilling, kill idle sandboxes and any pool sandbox still being created"""
+        self._closed = True
+        idle = [s for s, _ in self._idle]
+        self._idle.clear()
+        if idle:
+            print(f"Draining sandbox pool... (idle: {len(idle)})")
+            await asyncio.gather(*[self._kill(s) for s in idle], return_exceptions=True)
+
+        pending = [t for t in self._tasks if not t.done()]
+        if pending:
+            try:
+                # In-flight creates kill their own sandbox once they see the pool is closed
+                await asyncio.wait(pending, timeout=60)
+            except Exception as e:
+                if logger:
+                    logger.debug(f"Failed to wait for pool creates: {e}")
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'target_size': self.target_size,
+            'refill_concurrency': self.refill_concurrency,
+            'max_idle_seconds': self.max_idle_seconds,
+            'hits': self.hits,
+            'misses': self.misses,
+            'expired': self.expired,
+            'create_failures': self.create_failures,
+        }
+
+
+# =============================================================================
+# Batched Shell
+# =============================================================================
+@dataclass
+class ShellResult:
+    """Output and exit code of one command in a shell batch"""
+    command: str
+    exit_code: Optional[int] = None  # None: the batch ended before this command finished
+    output: str = ''
+
+    @property
+    def ok(self) -> bool:
+        return self.exit_code == 0
 
-            print(f"\nCleaning up resources... (sandboxes: {sandbox_count}, drivers: {driver_count})")
 
-            # Clean up drivers
-            loop = asyncio.get_running_loop()
-            for driver in list(self._drivers.values()):
-                try:
-                    await loop.run_in_executor(None, driver.quit)
-                except Exception as e:
-                    if logger:
-                        logger.debug(f"Failed to cleanup driver: {e}")
+def _shell_command_text(command: Union[str, List[str]]) -> str:
+    """A command given as argv list is quoted for sh; a string is used as-is"""
+    return command if isinstance(command, str) else ' '.join(shlex.quote(str(a)) for a in command)
 
-            # Clean up sandboxes
-            async def kill_sandbox(sandbox: Any) -> None:
-                try:
-                    await sandbox.kill()
-                except Exception as e:
-                    if logger:
-                        logger.debug(f"Failed to cleanup sandbox: {e}")
 
-            await asyncio.gather(
-                *[kill_sandbox(s) for s in self._sandboxes.values()],
-                return_exceptions=True
-            )
+def build_shell_batch(commands: List[Union[str, List[str]]]) -> Tuple[str, str]:
+    """
+    Build one sh script that runs all commands in order (one `mobile: shell` round trip).
 
-            self._sandboxes.clear()
-            self._drivers.clear()
-            print("Resource cleanup complete")
+    Each command's output (stdout + stderr) is framed by a begin marker and an end
+    marker carrying its exit code; the marker is random per batch so command output
+    cannot collide with it. Returns (script, marker).
+    """
+    marker = f"__SHELL_BATCH_{secrets.token_hex(6)}"
+    parts = [
+        f"echo {marker}B{i}; {{ {_shell_command_text(command)}\n}} 2>&1; echo {marker}E{i}:$?"
+        for i, command in enumerate(commands)
+    ]
+    return '\n'.join(parts), marker
+
+
+def parse_shell_batch(output: str, marker: str, commands: List[Union[str, List[str]]]) -> List[ShellResult]:
+    """Split the output of a build_shell_batch script back into one ShellResult per command"""
+    results = [ShellResult(_shell_command_text(command)) for command in commands]
+    pattern = re.compile(rf"{marker}B(\d+)\n(.*?){marker}E\1:(\d+)", re.DOTALL)
+    for match in pattern.finditer(output or ''):
+        index = int(match.group(1))
+        if index < len(results):
+            results[index].output = match.group(2)
+            results[index].exit_code = int(match.group(3))
+    return results
 
 
 # =============================================================================
@@ -781,72 +2873,290 @@ async def warmup_connection_pool() -> None:
         print(f"Warmup complete (with exception, not affecting): {elapsed_ms:.0f}ms, {e}")
 
 
-def create_appium_connection_class(access_token: str) -> type:
-    """Create isolated AppiumConnection subclass for each sandbox"""
-    from appium.webdriver.appium_connection import AppiumConnection
+class AppiumError(Exception):
+    """W3C WebDriver error returned by the Appium server"""
+
+    def __init__(self, error: str, message: str, status_code: int):
+        super().__init__(f"{error}: {message[:MAX_ERROR_MSG_LENGTH]} (HTTP {status_code})")
+        self.error = error
+        self.status_code = status_code
+
+
+# Shared Appium HTTP client (one connection pool per process, bound to the running event loop)
+_appium_http: Optional[httpx.AsyncClient] = None
+_readiness_prober: Optional['ReadinessProber'] = None
+
+
+def get_appium_http_client(max_connections: int = 1000) -> httpx.AsyncClient:
+    """Lazy-create the shared async HTTP client used by all AsyncAppiumClient instances"""
+    global _appium_http
+    if _appium_http is None or _appium_http.is_closed:
+        _appium_http = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            timeout=httpx.Timeout(300.0, connect=30.0),
+        )
+    return _appium_http
+
+
+async def close_appium_http_client() -> None:
+    """Close the shared Appium HTTP client"""
+    global _appium_http, _readiness_prober
+    if _appium_http is not None:
+        client, _appium_http = _appium_http, None
+        try:
+            await client.aclose()
+        except Exception as e:
+            if logger:
+                logger.debug(f"Failed to close Appium HTTP client: {e}")
+    _readiness_prober = None
+
+
+class ReadinessProber:
+    """
+    Shared Appium readiness prober (one per process).
+
+    Every waiting sandbox registers a target; a single background loop probes all due
+    targets concurrently over the shared keep-alive HTTP pool (no new TLS handshake
+    per poll). The first probe is immediate, then each target's interval grows by
+    READINESS_BACKOFF_FACTOR from min_interval up to max_interval, so fast-starting
+    sandboxes are caught within one round trip and slow ones are not hammered.
+    """
+
+    def __init__(self, http: httpx.AsyncClient, min_interval_ms: float = 50.0, max_interval_ms: float = 1000.0):
+        self.http = http
+        self.min_interval = min_interval_ms / 1000
+        self.max_interval = max_interval_ms / 1000
+        self._targets: List[Dict[str, Any]] = []
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._probes: Set[asyncio.Task] = set()
+
+    async def wait_ready(self, url: str, headers: Dict[str, str], timeout_s: float) -> Tuple[float, int]:
+        """Wait until url answers 200; returns (time to ready ms, probe count), raises asyncio.TimeoutError"""
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        target: Dict[str, Any] = {
+            'url': url, 'headers': headers, 'future': loop.create_future(),
+            'start': now, 'deadline': now + timeout_s, 'next_at': now,
+            'interval': self.min_interval, 'probes': 0, 'in_flight': False,
+        }
+        self._targets.append(target)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        self._wakeup.set()
+        try:
+            return await target['future']
+        finally:
+            self._targets.remove(target)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while self._targets:
+            now = loop.time()
+            for target in list(self._targets):
+                if not target['in_flight'] and not target['future'].done() and target['next_at'] <= now:
+                    target['in_flight'] = True
+                    task = asyncio.create_task(self._probe(target))
+                    self._probes.add(task)
+                    task.add_done_callback(self._probes.discard)
+            idle = [t['next_at'] for t in self._targets if not t['in_flight'] and not t['future'].done()]
+            delay = max(0.0, min(idle) - now) if idle else self.max_interval
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _probe(self, target: Dict[str, Any]) -> None:
+        loop = asyncio.get_running_loop()
+        target['probes'] += 1
+        ready = False
+        try:
+            resp = await self.http.get(target['url'], headers=target['headers'],
+                                       timeout=READINESS_PROBE_TIMEOUT_SECONDS)
+            ready = resp.status_code == 200
+        except httpx.HTTPError:
+            pass
+        finally:
+            target['in_flight'] = False
+
+        future: asyncio.Future = target['future']
+        now = loop.time()
+        if future.done():
+            return
+        if ready:
+            future.set_result(((now - target['start']) * 1000, target['probes']))
+        elif now >= target['deadline']:
+            future.set_exception(asyncio.TimeoutError(
+                f"Appium not ready after {now - target['start']:.1f}s ({target['probes']} probes)"))
+        else:
+            target['next_at'] = now + target['interval']
+            target['interval'] = min(self.max_interval, target['interval'] * READINESS_BACKOFF_FACTOR)
+        self._wakeup.set()
+
+
+def get_readiness_prober(http: httpx.AsyncClient, config: Optional[Dict[str, Any]] = None) -> ReadinessProber:
+    """Lazy-create the per-process readiness prober on the shared HTTP client"""
+    global _readiness_prober
+    if _readiness_prober is None or _readiness_prober.http is not http:
+        config = config or {}
+        _readiness_prober = ReadinessProber(
+            http,
+            float(config.get('READINESS_MIN_INTERVAL_MS', DEFAULT_CONFIG['READINESS_MIN_INTERVAL_MS'])),
+            float(config.get('READINESS_MAX_INTERVAL_MS', DEFAULT_CONFIG['READINESS_MAX_INTERVAL_MS'])),
+        )
+    return _readiness_prober
+
+
+def appium_health_target(sandbox: Any) -> Tuple[str, Dict[str, str]]:
+    """(health URL, auth headers) for a sandbox's Appium readiness endpoint"""
+    return f"https://{sandbox.get_host(8080)}/healthz", {'X-Access-Token': sandbox._envd_access_token}
+
+
+class AsyncAppiumClient:
+    """
+    Minimal asyncio W3C WebDriver / Appium client.
 
-    class IsolatedConnection(AppiumConnection):
-        extra_headers = {'X-Access-Token': access_token}
+    Covers what the batch operations need (session create/delete, mobile: shell,
+    screenshot, page source, window rect, app state/activation, push_file). All
+    instances share one httpx connection pool, so thousands of sessions can be
+    driven from one event loop without a thread per sandbox.
+    """
 
-    return IsolatedConnection
+    def __init__(self, http: httpx.AsyncClient, base_url: str, headers: Dict[str, str]):
+        self.http = http
+        self.base_url = base_url.rstrip('/')
+        self.headers = dict(headers)
+        self.session_id: Optional[str] = None
+
+    def _session_path(self, path: str) -> str:
+        if not self.session_id:
+            raise RuntimeError("No active Appium session")
+        return f"/session/{self.session_id}{path}"
+
+    async def _request(self, method: str, path: str, payload: Optional[Dict[str, Any]] = None,
+                       headers: Optional[Dict[str, str]] = None, timeout: Optional[float] = None) -> Any:
+        resp = await self.http.request(
+            method, f"{self.base_url}{path}", json=payload,
+            headers={**self.headers, **(headers or {})},
+            timeout=timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT,
+        )
+        return self._parse_response(resp)
 
+    @staticmethod
+    def _parse_response(resp: httpx.Response) -> Any:
+        try:
+            data = resp.json()
+        except ValueError:
+            resp.raise_for_status()
+            return resp.text
+        value = data.get('value') if isinstance(data, dict) else data
+        if isinstance(value, dict) and value.get('error'):
+            raise AppiumError(str(value['error']), str(value.get('message', '')), resp.status_code)
+        resp.raise_for_status()
+        return value
+
+    async def create_session(self, capabilities: Dict[str, Any]) -> str:
+        """POST /session (W3C), with an idempotency key so gateway retries don't open duplicate sessions"""
+        value = await self._request(
+            'POST', '/session',
+            {'capabilities': {'alwaysMatch': capabilities, 'firstMatch': [{}]}},
+            headers={'X-Idempotency-Key': str(uuid.uuid4())},
+        )
+        self.session_id = value.get('sessionId') if isinstance(value, dict) else None
+        if not self.session_id:
+            raise RuntimeError(f"Invalid session response: {str(value)[:MAX_ERROR_MSG_LENGTH]}")
+        return self.session_id
+
+    async def quit(self) -> None:
+        """Delete the session (no-op without one)"""
+        if not self.session_id:
+            return
+        try:
+            await self._request('DELETE', self._session_path(''), timeout=30)
+        finally:
+            self.session_id = None
+
+    async def execute_script(self, script: str, args: Optional[Dict[str, Any]] = None,
+                             timeout: Optional[float] = None) -> Any:
+        return await self._request('POST', self._session_path('/execute/sync'),
+                                   {'script': script, 'args': [args or {}]}, timeout=timeout)
+
+    async def shell(self, command: str, args: Optional[List[str]] = None, timeout_ms: Optional[int] = None) -> str:
+        """mobile: shell; command may be a whole shell script (device sh interprets it)"""
+        params: Dict[str, Any] = {'command': command, 'args': args or []}
+        if timeout_ms is not None:
+            params['timeout'] = timeout_ms
+        result = await self.execute_script('mobile: shell', params,
+                                           timeout=(timeout_ms / 1000 + 30) if timeout_ms else None)
+        return str(result) if result is not None else ''
+
+    async def shell_batch(self, commands: List[Union[str, List[str]]],
+                          timeout_ms: Optional[int] = None) -> List[ShellResult]:
+        """Run several commands in one mobile: shell request, split back into per-command results"""
+        script, marker = build_shell_batch(commands)
+        return parse_shell_batch(await self.shell(script, timeout_ms=timeout_ms), marker, commands)
+
+    async def get_window_size(self) -> Dict[str, int]:
+        rect = await self._request('GET', self._session_path('/window/rect'))
+        return {'width': int(rect['width']), 'height': int(rect['height'])}
+
+    async def screenshot_base64(self) -> str:
+        """Screenshot as returned by Appium (base64 PNG); decoding is left to the caller"""
+        return await self._request('GET', self._session_path('/screenshot'))
+
+    async def page_source(self) -> str:
+        return await self._request('GET', self._session_path('/source'))
+
+    async def query_app_state(self, package: str) -> int:
+        return int(await self.execute_script('mobile: queryAppState', {'appId': package, 'bundleId': package}))
+
+    async def activate_app(self, package: str) -> None:
+        await self.execute_script('mobile: activateApp', {'appId': package, 'bundleId': package})
+
+    async def post_stream(self, path: str, body: Any, timeout: Optional[float] = None) -> Any:
+        """POST a streamed JSON body (async iterable with __len__) to a session endpoint"""
+        resp = await self.http.post(
+            f"{self.base_url}{self._session_path(path)}", content=body,
+            headers={**self.headers, 'Content-Type': 'application/json; charset=utf-8',
+                     'Content-Length': str(len(body))},
+            timeout=timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT,
+        )
+        return self._parse_response(resp)
 
-def create_appium_driver(sandbox: Any, sandbox_id: int = -1, max_retries: int = 5) -> Any:
-    """Create Appium driver connection"""
-    from appium import webdriver
-    from appium.options.android import UiAutomator2Options
-    from appium.webdriver.client_config import AppiumClientConfig
 
+async def create_appium_client(sandbox: Any, http: httpx.AsyncClient, sandbox_id: int = -1,
+                               max_retries: int = 5, limiter: Optional[AdaptiveLimiter] = None,
+                               prober: Optional[ReadinessProber] = None) -> AsyncAppiumClient:
+    """Create Appium session on the sandbox (async, shared connection pool, optional adaptive limiter)"""
     def _log(msg: str) -> None:
-        print(f"  [{format_timestamp()}] [Sandbox {sandbox_id:2d}]   {msg}")
-    
-    access_token = sandbox._envd_access_token
-    health_url = f"https://{sandbox.get_host(8080)}/healthz"
-    headers = {'X-Access-Token': access_token}
+        console_log_sandbox(sandbox_id, f"  {msg}")
+
+    health_url, headers = appium_health_target(sandbox)
+    prober = prober or get_readiness_prober(http)
+    capabilities = {
+        'platformName': 'Android',
+        'appium:automationName': 'UiAutomator2',
+        'appium:newCommandTimeout': 0,
+    }
     last_error: Optional[Exception] = None
-    
+
     for attempt in range(max_retries + 1):
         if attempt > 0:
             _log(f"Retry {attempt}/{max_retries}, health check first...")
-            for _ in range(10):
-                try:
-                    resp = requests.get(health_url, headers=headers, timeout=5)
-                    if resp.status_code == 200:
-                        _log("Health check passed")
-                        break
-                except requests.RequestException:
-                    pass
-                time.sleep(0.1)  # 100ms interval, max 1 second
-            else:
+            try:
+                ready_ms, probes = await prober.wait_ready(health_url, headers, READINESS_RETRY_TIMEOUT_SECONDS)
+                _log(f"Health check passed ({ready_ms:.0f}ms, {probes} probes)")
+            except asyncio.TimeoutError:
                 _log("Health check timeout, continue trying to connect")
-        
-        try:
-            with timer() as t1:
-                options = UiAutomator2Options()
-                options.platform_name = 'Android'
-                options.automation_name = 'UiAutomator2'
-                options.new_command_timeout = 0
-                
-                ConnectionClass = create_appium_connection_class(access_token)
-                appium_url = f"https://{sandbox.get_host(4723)}"
-                client_config = AppiumClientConfig(
-                    remote_server_addr=appium_url,
-                    timeout=300,
-                )
-                executor = ConnectionClass(client_config=client_config)
-            
-            with timer() as t2:
-                driver = webdriver.Remote(
-                    command_executor=executor,
-                    options=options,
-                )
-            
-            _log(f"Config: {t1['elapsed_ms']:.0f}ms, Session create: {t2['elapsed_ms']:.0f}ms")
 
-            if driver and hasattr(driver, 'get_window_size'):
-                _ = driver.session_id
-                return driver
-            raise RuntimeError("Invalid driver object")
+        try:
+            client = AsyncAppiumClient(http, f"https://{sandbox.get_host(4723)}", headers)
+            with timer() as t:
+                async with (limiter.slot() if limiter else nullcontext()):
+                    await client.create_session(capabilities)
+            _log(f"Session create: {t['elapsed_ms']:.0f}ms")
+            return client
 
         except Exception as e:
             last_error = e
@@ -863,18 +3173,37 @@ class AsyncSandboxTester:
     """Async sandbox tester"""
     
     def __init__(self, sandbox_id: int, config: Dict[str, Any], output_dir: Path,
-                 executor: ThreadPoolExecutor, resource_manager: ResourceManager):
+                 executor: ThreadPoolExecutor, resource_manager: ResourceManager,
+                 pool: Optional[SandboxPool] = None, artifact_cache: Optional[ArtifactCache] = None,
+                 timeseries: Optional[TimeSeriesRecorder] = None,
+                 limiters: Optional[Dict[str, AdaptiveLimiter]] = None,
+                 screenshot_writer: Optional[ScreenshotWriter] = None,
+                 events: Optional[EventLog] = None):
         self.sandbox_id = sandbox_id
         self.worker_id = int(config.get('_WORKER_ID', 0) or 0)
         self.config = config
         self.output_dir = output_dir
         self.executor = executor
         self.resource_manager = resource_manager
+        self.pool = pool
+        self.artifact_cache = artifact_cache or ArtifactCache()
+        self.timeseries = timeseries
+        self.limiters = limiters or {}
+        self.screenshot_writer = screenshot_writer
+        self.events = events
         
         self.sandbox: Optional[Any] = None
-        self.driver: Optional[Any] = None
+        self.driver: Optional[AsyncAppiumClient] = None
         self.screen_width = 720
         self.screen_height = 1280
+        self.apk_install_path: Optional[str] = None  # Chosen by the artifact cache in _upload_app
+        self.apk_cache_status = ''
+        self.operations_wall_ms = 0.0
+        self.critical_path_ms = 0.0
+        self.critical_path: List[str] = []
+        self.screenshots: List[Dict[str, Any]] = []
+        self.logcat: Optional[LogcatCollector] = None
+        self._screenshot_writes: List[Tuple[Dict[str, Any], asyncio.Future]] = []
         
         self.sandbox_output_dir = output_dir / f"sandbox_{sandbox_id}"
         self.sandbox_output_dir.mkdir(parents=True, exist_ok=True)
@@ -882,24 +3211,40 @@ class AsyncSandboxTester:
         self.metrics = create_operation_metrics()
     
     def _log(self, msg: str) -> None:
-        print(f"  [{format_timestamp()}] [Sandbox {self.sandbox_id:2d}] {msg}")
+        console_log_sandbox(self.sandbox_id, msg)
+
+    def _limited(self, call: str) -> Any:
+        """Async context holding an adaptive limiter slot for a platform call (no-op without limiter)"""
+        limiter = self.limiters.get(call)
+        return limiter.slot() if limiter is not None else nullcontext()
+
+    def _record_timeseries(self, op: str, success: bool, latency_ms: float) -> None:
+        if self.timeseries is not None:
+            self.timeseries.record(op, success, latency_ms)
+
+    def _event(self, event: str, **fields: Any) -> None:
+        if self.events is not None:
+            self.events.emit(self.sandbox_id, event, **fields)
 
     async def run(self) -> SandboxTestResult:
         """Run complete test flow"""
         result = SandboxTestResult(sandbox_id=self.sandbox_id)
         result.worker_id = self.worker_id
         result.start_time = format_timestamp()
+        result.start_ts = time.time()
 
         with timer() as total_timer:
             # 1. Create sandbox
-            created = await self._create_sandbox(result)
+            created = await self._create_sandbox(result, int(self.config.get('CREATE_MAX_RETRIES', 1)))
             if created:
                 # 2. Connect Appium
                 connected = await self._connect_appium(result)
                 if not connected:
                     result.destroy_start_time = format_timestamp()
-                    await self._cleanup()
+                    with timer() as destroy_timer:
+                        await self._cleanup()
                     result.destroy_end_time = format_timestamp()
+                    self._event('destroy', ok=False, ms=round(destroy_timer['elapsed_ms'], 2))
                 else:
                     # 3. Execute operations
                     await self._run_operations(result)
@@ -907,41 +3252,68 @@ class AsyncSandboxTester:
                     # 4. Cleanup
                     result.destroy_start_time = format_timestamp()
                     self._log("Destroying sandbox...")
-                    result.destroy_success = await self._cleanup()
+                    with timer() as destroy_timer:
+                        result.destroy_success = await self._cleanup()
                     result.destroy_end_time = format_timestamp()
+                    self._event('destroy', ok=result.destroy_success, ms=round(destroy_timer['elapsed_ms'], 2))
                     self._log("Sandbox destroyed")
 
         result.end_time = format_timestamp()
         result.total_latency_ms = total_timer['elapsed_ms']
         result.success = result.create_success and result.connect_success and result.operations_success
+        self._record_timeseries('sandbox_total', result.success, result.total_latency_ms)
         return result
 
-    async def _create_sandbox(self, result: SandboxTestResult, max_retries: int = 1, retry_delay_ms: int = 100) -> bool:
-        """Create sandbox (with retry support)"""
+    async def _create_sandbox(self, result: SandboxTestResult, max_retries: int = 1) -> bool:
+        """Create sandbox (warm pool first, then cold create with jittered exponential backoff)"""
         SandboxClass = get_async_sandbox_class()
         last_error = None
         total_start = time.perf_counter()
         result.create_start_time = format_timestamp()
-        
+        self._event('create_start')
+
+        if self.pool is not None:
+            sandbox = await self.pool.acquire()
+            if sandbox is not None:
+                self.sandbox = sandbox
+                result.create_source = 'pool'
+                result.create_latency_ms = (time.perf_counter() - total_start) * 1000
+                result.create_success = True
+                result.create_end_time = format_timestamp()
+                result.real_sandbox_id = self.sandbox.sandbox_id
+                self._record_timeseries('sandbox_create', True, result.create_latency_ms)
+                self._event('create_end', ok=True, ms=round(result.create_latency_ms, 2), src='pool',
+                            rid=result.real_sandbox_id)
+                await self.resource_manager.register_sandbox(self.sandbox_id, self.sandbox)
+                self._log(f"Sandbox acquired from pool ({result.create_latency_ms:.0f}ms) sandbox_id={self.sandbox.sandbox_id}")
+                return True
+
+        result.create_source = 'cold'
         for attempt in range(max_retries + 1):
             if attempt > 0:
                 result.create_retried = True
                 result.create_retry_count = attempt
-                self._log(f"Retry create sandbox ({attempt}/{max_retries})...")
-                await asyncio.sleep(retry_delay_ms / 1000)
+                delay = backoff_delay(attempt, float(self.config.get('RETRY_BACKOFF_BASE_MS', 200)),
+                                      float(self.config.get('RETRY_BACKOFF_MAX_MS', 10000)))
+                self._log(f"Retry create sandbox ({attempt}/{max_retries}) after {delay * 1000:.0f}ms backoff...")
+                await asyncio.sleep(delay)
 
             start = time.perf_counter()
             try:
                 self._log(f"Preparing to create sandbox ts={time.time():.3f}")
-                self.sandbox = await SandboxClass.create(
-                    template=self.config['SANDBOX_TEMPLATE'],
-                    timeout=self.config['SANDBOX_TIMEOUT']
-                )
+                async with self._limited('sandbox_create'):
+                    self.sandbox = await SandboxClass.create(
+                        template=self.config['SANDBOX_TEMPLATE'],
+                        timeout=self.config['SANDBOX_TIMEOUT']
+                    )
 
                 result.create_latency_ms = (time.perf_counter() - total_start) * 1000
                 result.create_success = True
                 result.create_end_time = format_timestamp()
                 result.real_sandbox_id = self.sandbox.sandbox_id
+                self._record_timeseries('sandbox_create', True, result.create_latency_ms)
+                self._event('create_end', ok=True, ms=round(result.create_latency_ms, 2), src='cold',
+                            retries=attempt, rid=result.real_sandbox_id)
 
                 await self.resource_manager.register_sandbox(self.sandbox_id, self.sandbox)
                 if attempt > 0:
@@ -958,6 +3330,9 @@ class AsyncSandboxTester:
         # All retries failed
         result.create_latency_ms = (time.perf_counter() - total_start) * 1000
         result.error = f"Sandbox creation failed (retried {max_retries} times): {last_error[:MAX_ERROR_MSG_LENGTH]}"
+        self._record_timeseries('sandbox_create', False, result.create_latency_ms)
+        self._event('create_end', ok=False, ms=round(result.create_latency_ms, 2), src='cold',
+                    retries=max_retries, err=result.error)
         self._log(f"{result.error} (total: {result.create_latency_ms:.0f}ms)")
         return False
 
@@ -966,18 +3341,33 @@ class AsyncSandboxTester:
         self._log("Connecting Appium...")
         start = time.perf_counter()
         try:
-            loop = asyncio.get_running_loop()
-            import functools
-            self.driver = await loop.run_in_executor(
-                self.executor,
-                functools.partial(create_appium_driver, self.sandbox, self.sandbox_id)
-            )
+            http = get_appium_http_client(int(self.config.get('APPIUM_MAX_CONNECTIONS', 1000)))
+            prober = get_readiness_prober(http, self.config)
+
+            # Create the session the moment /healthz answers (a timeout still falls through to connect retries)
+            health_url, headers = appium_health_target(self.sandbox)
+            try:
+                result.ready_latency_ms, result.ready_probes = await prober.wait_ready(
+                    health_url, headers, float(self.config.get('APPIUM_READY_TIMEOUT_SECONDS', 60)))
+                result.ready_success = True
+                self._log(f"Appium ready ({result.ready_latency_ms:.0f}ms, {result.ready_probes} probes)")
+            except asyncio.TimeoutError as e:
+                result.ready_latency_ms = (time.perf_counter() - start) * 1000
+                self._log(f"{e}, trying to connect anyway")
+            self._record_timeseries('appium_ready', result.ready_success, result.ready_latency_ms)
+            self._event('ready', ok=result.ready_success, ms=round(result.ready_latency_ms, 2),
+                        probes=result.ready_probes)
+
+            self.driver = await create_appium_client(self.sandbox, http, self.sandbox_id,
+                                                     limiter=self.limiters.get('appium_connect'), prober=prober)
             
             result.connect_latency_ms = (time.perf_counter() - start) * 1000
             result.connect_success = True
+            self._record_timeseries('appium_connect', True, result.connect_latency_ms)
+            self._event('connect', ok=True, ms=round(result.connect_latency_ms, 2))
             await self.resource_manager.register_driver(self.sandbox_id, self.driver)
             
-            window_size = await loop.run_in_executor(self.executor, self.driver.get_window_size)
+            window_size = await self.driver.get_window_size()
             self.screen_width = window_size['width']
             self.screen_height = window_size['height']
             self._log(f"Appium connected ({result.connect_latency_ms:.0f}ms)")
@@ -987,6 +3377,8 @@ class AsyncSandboxTester:
             result.connect_latency_ms = (time.perf_counter() - start) * 1000
             error_msg = extract_error_details(e)
             result.error = f"Appium connection failed: {error_msg[:MAX_ERROR_MSG_LENGTH]}"
+            self._record_timeseries('appium_connect', False, result.connect_latency_ms)
+            self._event('connect', ok=False, ms=round(result.connect_latency_ms, 2), err=result.error)
             self._log(f"{result.error} ({result.connect_latency_ms:.0f}ms)")
             return False
 
@@ -994,28 +3386,35 @@ class AsyncSandboxTester:
         """Execute operation tests"""
         try:
             self._log("Executing operation tests...")
-            loop = asyncio.get_running_loop()
-            result.operations_success = await loop.run_in_executor(
-                self.executor, self._execute_operations
-            )
+            result.operations_success = await self._execute_operations()
+            result.screenshots = await self._finish_screenshot_writes()
             result.operation_metrics = self.metrics
+            result.apk_cache_status = self.apk_cache_status
+            result.operations_wall_ms = self.operations_wall_ms
+            result.critical_path_ms = self.critical_path_ms
+            result.critical_path = self.critical_path
             status = "all passed" if result.operations_success else "partial failed"
-            self._log(f"Operation tests complete ({status})")
+            self._log(f"Operation tests complete ({status}, wall={self.operations_wall_ms:.0f}ms, "
+                      f"critical path={self.critical_path_ms:.0f}ms: {' -> '.join(self.critical_path)})")
 
         except Exception as e:
             error_msg = str(e).strip() if str(e).strip() else f"{type(e).__name__}"
             result.error = f"Operation test exception: {error_msg[:MAX_ERROR_MSG_LENGTH]}"
             self._log(result.error)
+            result.screenshots = await self._finish_screenshot_writes()
             result.operation_metrics = self.metrics
+            result.apk_cache_status = self.apk_cache_status
 
     async def _cleanup(self) -> bool:
         """Cleanup resources"""
         success = True
-        loop = asyncio.get_running_loop()
+
+        if self.logcat is not None:
+            await self.logcat.stop()
 
         if self.driver:
             try:
-                await loop.run_in_executor(self.executor, self.driver.quit)
+                await self.driver.quit()
             except Exception as e:
                 if logger:
                     logger.debug(f"Failed to cleanup driver: {e}")
@@ -1024,7 +3423,8 @@ class AsyncSandboxTester:
 
         if self.sandbox:
             try:
-                await self.sandbox.kill()
+                async with self._limited('sandbox_kill'):
+                    await self.sandbox.kill()
             except Exception as e:
                 if logger:
                     logger.debug(f"Failed to cleanup sandbox: {e}")
@@ -1034,9 +3434,14 @@ class AsyncSandboxTester:
         await self.resource_manager.unregister(self.sandbox_id)
         return success
 
-    def _execute_operations(self) -> bool:
-        """Execute all operations (sync method, called in thread pool)"""
-        all_success = True
+    async def _run_io(self, func: Callable, *args) -> Any:
+        """Run blocking disk I/O in the (small) I/O thread pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, func, *args)
+
+    async def _execute_operations(self) -> bool:
+        """Execute all operations as a dependency graph (coroutines on the shared event loop)"""
+        graph = build_operation_graph(bool(self.config.get('PIPELINE_OPERATIONS', True)))
 
         # Operation mapping
         operation_funcs: Dict[str, Tuple[Callable, tuple]] = {
@@ -1050,19 +3455,54 @@ class AsyncSandboxTester:
             'open_browser': (self._open_browser, ()),
             'tap_random_2': (self._tap_random, ()),
             'screenshot_2': (self._take_screenshot, ('screenshot_2.png',)),
-            'get_logs': (self._get_device_logs, ('logcat.txt',)),
+            'get_logs': (self._get_device_logs, ()),
         }
 
-        for i, (key, name) in enumerate(OPERATIONS, 1):
-            func, args = operation_funcs[key]
-            success, latency = self._measure_operation(key, func, *args)
-            self._log(f"[{i}/{len(OPERATIONS)}] {name}: {'success' if success else 'failed'} ({latency:.0f}ms)")
-            all_success &= success
+        # Logcat is read incrementally while the operations run; get_logs only reads the tail
+        self.logcat = LogcatCollector(
+            self.driver, self.sandbox_output_dir, self.executor,
+            float(self.config.get('LOGCAT_POLL_SECONDS', 5.0)), self.config.get('LOGCAT_FILTER', ''),
+            int(self.config.get('LOGCAT_ROTATE_MB', 16)) * 1024 * 1024,
+        )
+        self.logcat.start()
+
+        loop = asyncio.get_running_loop()
+        lanes = {lane: asyncio.Semaphore(limit) for lane, limit in OPERATION_LANES.items()}
+        finished: Dict[str, asyncio.Future] = {key: loop.create_future() for key in graph}
+        durations_ms: Dict[str, float] = {}
+        ops_start = time.perf_counter()
+
+        async def run_node(i: int, key: str, name: str) -> bool:
+            success = False
+            try:
+                node = graph[key]
+                if node['deps']:
+                    await asyncio.gather(*(finished[dep] for dep in node['deps']))
+                async with lanes[node['lane']]:
+                    func, args = operation_funcs[key]
+                    success, latency = await self._measure_operation(key, func, *args)
+                durations_ms[key] = latency
+                self._log(f"[{i}/{len(OPERATIONS)}] {name}: {'success' if success else 'failed'} ({latency:.0f}ms)")
+                return success
+            finally:
+                # Dependents only wait for completion, not success
+                finished[key].set_result(success)
+
+        results = await asyncio.gather(
+            *[run_node(i, key, name) for i, (key, name) in enumerate(OPERATIONS, 1)],
+            return_exceptions=True
+        )
+
+        self.operations_wall_ms = (time.perf_counter() - ops_start) * 1000
+        self.critical_path_ms, self.critical_path = compute_critical_path(graph, durations_ms)
 
-        return all_success
+        for r in results:
+            if isinstance(r, BaseException):
+                raise r
+        return all(results)
 
-    def _measure_operation(self, key: str, func: Callable, *args,
-                           max_retries: int = 1, retry_delay_ms: int = 100) -> Tuple[bool, float]:
+    async def _measure_operation(self, key: str, func: Callable, *args,
+                                 max_retries: int = 1, retry_delay_ms: int = 100) -> Tuple[bool, float]:
         """Measure single operation (with retry support)"""
         metrics = self.metrics[key]
         last_error = None
@@ -1073,17 +3513,19 @@ class AsyncSandboxTester:
             if attempt > 0:
                 retried = True
                 self._log(f"  Retry {key} ({attempt}/{max_retries})...")
-                time.sleep(retry_delay_ms / 1000)
+                await asyncio.sleep(retry_delay_ms / 1000)
 
             start = time.perf_counter()
             try:
-                result = func(*args)
+                result = await func(*args)
                 elapsed_ms = (time.perf_counter() - start) * 1000
                 success = result is not None and result is not False
 
                 if success:
                     total_elapsed_ms = (time.perf_counter() - total_start) * 1000
                     metrics.record_success(total_elapsed_ms, retried=retried)
+                    self._record_timeseries(key, True, total_elapsed_ms)
+                    self._event('op', k=key, ok=True, ms=round(total_elapsed_ms, 2), retried=retried)
                     return True, total_elapsed_ms
                 else:
                     last_error = f"Operation returned: {result}"
@@ -1094,23 +3536,26 @@ class AsyncSandboxTester:
         # All retries failed
         total_elapsed_ms = (time.perf_counter() - total_start) * 1000
         metrics.record_failure(last_error, total_elapsed_ms, retried=retried)
+        self._record_timeseries(key, False, total_elapsed_ms)
+        self._event('op', k=key, ok=False, ms=round(total_elapsed_ms, 2), retried=retried,
+                    err=(last_error or '')[:MAX_ERROR_MSG_LENGTH])
         return False, total_elapsed_ms
 
     # ========== Operation Implementations ==========
 
-    def _tap_random(self) -> bool:
+    async def _tap_random(self) -> bool:
         """Tap random position"""
         x = random.randint(100, self.screen_width - 100)
         y = random.randint(200, self.screen_height - 200)
-        return self._execute_shell('input', ['tap', str(x), str(y)])
+        return await self._execute_shell('input', ['tap', str(x), str(y)])
     
-    def _install_and_grant(self, app_name: str) -> bool:
-        if not self._install_app(app_name):
+    async def _install_and_grant(self, app_name: str) -> bool:
+        if not await self._install_app(app_name):
             return False
-        self._grant_permissions(app_name)
+        await self._grant_permissions(app_name)
         return True
     
-    def _upload_app(self, app_name: str) -> bool:
+    async def _upload_app(self, app_name: str) -> bool:
         """Upload APK (skip if using mounted mode)"""
         # If using mounted APK, return success directly (no need to upload)
         if self.config.get('USE_MOUNTED_APK', True):
@@ -1125,86 +3570,71 @@ class AsyncSandboxTester:
 
         if not apk_path.exists():
             self._log("Local APK not found, starting download...")
-            if not download_apk(config['apk_name'], apk_path):
+            if not await self._run_io(download_apk, config['apk_name'], apk_path):
                 return False
 
-        CHUNK_SIZE = 20 * 1024 * 1024
-        file_size = apk_path.stat().st_size
-        total_chunks = (file_size + CHUNK_SIZE - 1) // CHUNK_SIZE
-
-        temp_dir = '/data/local/tmp/chunks'
         remote_path = config['remote_path']
+        cache = self.artifact_cache
 
         try:
-            import base64
-
-            upload_total_start = time.perf_counter()
-
-            # Clean and prepare directory
-            t0 = time.perf_counter()
-            self._execute_shell('rm', ['-rf', temp_dir])
-            self._execute_shell('mkdir', ['-p', temp_dir])
-            self._execute_shell('rm', ['-f', remote_path])
-            prep_ms = (time.perf_counter() - t0) * 1000
-            self._log(f"  [upload] Prepare dirs: {prep_ms:.0f}ms")
-
-            # Chunked upload
-            t0 = time.perf_counter()
-            with open(apk_path, 'rb') as f:
-                for i in range(total_chunks):
-                    chunk_start = time.perf_counter()
-                    chunk_data = f.read(CHUNK_SIZE)
-                    chunk_b64 = base64.b64encode(chunk_data).decode('utf-8')
-                    chunk_path = f"{temp_dir}/chunk_{i:04d}"
-                    encode_ms = (time.perf_counter() - chunk_start) * 1000
-                    push_start = time.perf_counter()
-                    self.driver.push_file(chunk_path, chunk_b64)
-                    push_ms = (time.perf_counter() - push_start) * 1000
-                    chunk_size_mb = len(chunk_data) / (1024 * 1024)
-                    self._log(f"  [upload] Chunk {i+1}/{total_chunks} ({chunk_size_mb:.1f}MB): encode={encode_ms:.0f}ms, push={push_ms:.0f}ms")
-            upload_ms = (time.perf_counter() - t0) * 1000
-            self._log(f"  [upload] All chunks uploaded: {upload_ms:.0f}ms")
-
-            # Merge chunks
-            t0 = time.perf_counter()
-            for i in range(total_chunks):
-                chunk_path = f"{temp_dir}/chunk_{i:04d}"
-                if i == 0:
-                    self._execute_shell('cp', [chunk_path, remote_path])
-                else:
-                    self._execute_shell('cat', [chunk_path, '>>', remote_path])
-                self._execute_shell('rm', ['-f', chunk_path])
-            merge_ms = (time.perf_counter() - t0) * 1000
-            self._log(f"  [upload] Merge chunks: {merge_ms:.0f}ms")
-
-            # Clean temp directory
-            t0 = time.perf_counter()
-            self._execute_shell('rm', ['-rf', temp_dir])
-            clean_ms = (time.perf_counter() - t0) * 1000
-            self._log(f"  [upload] Clean temp: {clean_ms:.0f}ms")
-
-            # Verify MD5
-            t0 = time.perf_counter()
-            local_md5 = hashlib.md5(apk_path.read_bytes()).hexdigest()
-            md5_result = self._execute_shell('md5sum', [remote_path], return_result=True)
-            remote_md5 = md5_result.strip().split()[0] if md5_result else ''
-            md5_ms = (time.perf_counter() - t0) * 1000
-            md5_match = remote_md5.lower() == local_md5.lower()
-            self._log(f"  [upload] MD5 verify: {md5_ms:.0f}ms (match={md5_match})")
-            if not md5_match:
-                self._log(f"  [upload] MD5 MISMATCH! local={local_md5}, remote={remote_md5}")
-
-            total_ms = (time.perf_counter() - upload_total_start) * 1000
-            self._log(f"  [upload] Total: {total_ms:.0f}ms (prep={prep_ms:.0f}, upload={upload_ms:.0f}, merge={merge_ms:.0f}, clean={clean_ms:.0f}, md5={md5_ms:.0f})")
-
-            return md5_match
+            digest = await self._run_io(file_md5, apk_path)
+
+            # Content-addressed lookup: skip the transfer if the device already has this APK
+            status, path = await cache.probe(self.driver, digest, remote_path)
+            if path:
+                self.apk_cache_status, self.apk_install_path = status, path
+                self._log(f"  [upload] Cache {status}: {path}")
+                return True
+
+            if cache.shared_dir:
+                if cache.claim_upload(digest):
+                    # Fan-out: this tester uploads once to the shared dir for the whole run
+                    shared_path = cache.shared_path(digest)
+                    partial_path = f"{shared_path}.partial.{self.sandbox.sandbox_id}"
+                    ok = await self._stream_upload(apk_path, partial_path)
+                    if ok:
+                        await self.driver.shell(f"mkdir -p {cache.shared_dir} && mv -f {partial_path} {shared_path}")
+                        ok = (await cache.probe(self.driver, digest, remote_path))[1] == shared_path
+                    cache.publish(digest, ok)
+                    if ok:
+                        self.apk_cache_status, self.apk_install_path = 'shared_upload', shared_path
+                        return True
+                    self._log("  [upload] Shared upload failed, falling back to private upload")
+                elif await cache.wait(digest):
+                    status, path = await cache.probe(self.driver, digest, remote_path)
+                    if path:
+                        self.apk_cache_status, self.apk_install_path = status, path
+                        self._log(f"  [upload] Cache {status} (after shared upload): {path}")
+                        return True
+
+            ok = await self._stream_upload(apk_path, remote_path)
+            if ok:
+                self.apk_cache_status, self.apk_install_path = 'miss', remote_path
+            return ok
 
         except Exception as e:
             if logger:
                 logger.debug(f"Upload APK exception: {e}")
             return False
 
-    def _install_app(self, app_name: str) -> bool:
+    async def _stream_upload(self, apk_path: Path, remote_path: str) -> bool:
+        """Streamed parallel upload of apk_path to remote_path, True if the device MD5 matches"""
+        upload_total_start = time.perf_counter()
+        uploader = StreamedApkUploader(
+            self.driver,
+            chunk_size=int(self.config.get('UPLOAD_CHUNK_SIZE_MB', 8)) * 1024 * 1024,
+            parallelism=int(self.config.get('UPLOAD_PARALLELISM', 4)),
+            executor=self.executor,
+            log=self._log,
+        )
+        md5_match, timings = await uploader.upload(apk_path, remote_path)
+
+        total_ms = (time.perf_counter() - upload_total_start) * 1000
+        self._log(f"  [upload] Total: {total_ms:.0f}ms (prep={timings['prep']:.0f}, upload={timings['upload']:.0f}, "
+                  f"merge+md5={timings['merge']:.0f}, match={md5_match})")
+        return md5_match
+
+    async def _install_app(self, app_name: str) -> bool:
         """Install APK (select mounted path or upload path based on config)"""
         config = APP_CONFIGS.get(app_name.lower())
         if not config:
@@ -1212,122 +3642,162 @@ class AsyncSandboxTester:
 
         # Select APK path based on config
         use_mounted = self.config.get('USE_MOUNTED_APK', True)
-        apk_path = config['mounted_path'] if use_mounted else config['remote_path']
+        apk_path = config['mounted_path'] if use_mounted else (self.apk_install_path or config['remote_path'])
 
         try:
-            state = self.driver.query_app_state(config['package'])
+            state = await self.driver.query_app_state(config['package'])
             if state != 0:
                 return True
 
-            result = self.driver.execute_script('mobile: shell', {
-                'command': 'pm',
-                'args': ['install', '-r', '-g', apk_path],
-                'timeout': 120000
-            })
+            result = await self.driver.shell('pm', ['install', '-r', '-g', apk_path], timeout_ms=120000)
 
-            if result and 'Success' in str(result):
+            if result and 'Success' in result:
                 return True
 
-            state = self.driver.query_app_state(config['package'])
+            state = await self.driver.query_app_state(config['package'])
             return state != 0
         except Exception as e:
             if logger:
                 logger.debug(f"Install APK failed: {e}")
             return False
 
-    def _grant_permissions(self, app_name: str) -> bool:
+    async def _grant_permissions(self, app_name: str) -> bool:
         """Grant permissions"""
         config = APP_CONFIGS.get(app_name.lower())
         if not config:
             return False
         
         package = config['package']
-        for permission in config.get('permissions', []):
-            try:
-                self._execute_shell('pm', ['grant', package, permission])
-            except Exception as e:
-                if logger:
-                    logger.debug(f"Grant {permission} failed: {e}")
+        permissions = config.get('permissions', [])
+        if not permissions:
+            return True
+        try:
+            results = await self.driver.shell_batch([['pm', 'grant', package, p] for p in permissions])
+        except Exception as e:
+            if logger:
+                logger.debug(f"Grant permissions failed: {e}")
+            return True
+        for result in results:
+            if not result.ok and logger:
+                logger.debug(f"Grant failed ({result.command}): exit {result.exit_code} {result.output.strip()}")
         return True
 
-    def _launch_app(self, app_name: str) -> bool:
+    async def _launch_app(self, app_name: str) -> bool:
         """Launch app"""
         config = APP_CONFIGS.get(app_name.lower())
         if not config:
             return False
 
         try:
-            self.driver.activate_app(config['package'])
-            time.sleep(2)
-            state = self.driver.query_app_state(config['package'])
+            await self.driver.activate_app(config['package'])
+            await asyncio.sleep(2)
+            state = await self.driver.query_app_state(config['package'])
             return state == 4
         except Exception as e:
             if logger:
                 logger.debug(f"Launch app failed: {e}")
             return False
 
-    def _take_screenshot(self, filename: str) -> bool:
+    async def _take_screenshot(self, filename: str) -> bool:
+        """Capture, encode (off the event loop) and queue the frame for the background writer"""
         try:
-            filepath = self.sandbox_output_dir / filename
-            # save_screenshot returns True on success, False or exception on failure
-            result = self.driver.save_screenshot(str(filepath))
-            if result:
-                return True
-            # If returns False, check if file exists (compatible with different Appium client versions)
-            return filepath.exists() and filepath.stat().st_size > 0
+            fmt = self.config.get('SCREENSHOT_FORMAT', 'png')
+            filepath = (self.sandbox_output_dir / filename).with_suffix('.' + SCREENSHOT_EXTENSIONS.get(fmt, 'png'))
+
+            start = time.perf_counter()
+            b64_png = await self.driver.screenshot_base64()
+            capture_ms = (time.perf_counter() - start) * 1000
+            if not b64_png:
+                return False
+
+            start = time.perf_counter()
+            data = await self._run_io(encode_screenshot, b64_png, fmt,
+                                      int(self.config.get('SCREENSHOT_QUALITY', 80)),
+                                      int(self.config.get('SCREENSHOT_MAX_WIDTH', 0) or 0))
+            encode_ms = (time.perf_counter() - start) * 1000
+            self._record_timeseries('screenshot_capture', True, capture_ms)
+            self._record_timeseries('screenshot_encode', True, encode_ms)
+
+            frame = {'file': filepath.name, 'capture_ms': capture_ms, 'encode_ms': encode_ms,
+                     'write_ms': 0.0, 'bytes': len(data), 'write_ok': False}
+            self.screenshots.append(frame)
+            if self.screenshot_writer is not None:
+                self._screenshot_writes.append((frame, await self.screenshot_writer.submit(filepath, data)))
+            else:
+                start = time.perf_counter()
+                await self._run_io(filepath.write_bytes, data)
+                frame['write_ms'] = (time.perf_counter() - start) * 1000
+                frame['write_ok'] = True
+                self._record_timeseries('screenshot_write', True, frame['write_ms'])
+            return True
         except Exception as e:
             if logger:
                 logger.debug(f"Screenshot failed: {e}")
             return False
 
-    def _get_page_xml(self, filename: str) -> Optional[str]:
+    async def _finish_screenshot_writes(self) -> List[Dict[str, Any]]:
+        """Wait for this sandbox's queued screenshot writes and record their write times"""
+        writes, self._screenshot_writes = self._screenshot_writes, []
+        for frame, future in writes:
+            try:
+                frame['write_ms'] = await future
+                frame['write_ok'] = True
+            except Exception as e:
+                self._log(f"Screenshot write failed ({frame['file']}): {str(e)[:MAX_ERROR_MSG_LENGTH]}")
+            self._record_timeseries('screenshot_write', frame['write_ok'], frame['write_ms'])
+        return self.screenshots
+
+    async def _get_page_xml(self, filename: str) -> Optional[str]:
         try:
-            page_source = self.driver.page_source
+            page_source = await self.driver.page_source()
             if page_source:
                 filepath = self.sandbox_output_dir / filename
-                filepath.write_text(page_source, encoding='utf-8')
+                await self._run_io(functools.partial(filepath.write_text, page_source, encoding='utf-8'))
             return page_source
         except Exception as e:
             if logger:
                 logger.debug(f"Get page XML failed: {e}")
             return None
 
-    def _get_device_info(self, filename: str) -> Optional[Dict]:
+    async def _get_device_info(self, filename: str) -> Optional[Dict]:
         try:
-            model = self._execute_shell('getprop', ['ro.product.model'], return_result=True)
+            model = await self._execute_shell('getprop', ['ro.product.model'], return_result=True)
             info = {'model': model.strip() if model else 'N/A'}
 
             filepath = self.sandbox_output_dir / filename
-            filepath.write_text(json.dumps(info, indent=2, ensure_ascii=False), encoding='utf-8')
+            await self._run_io(functools.partial(
+                filepath.write_text, json.dumps(info, indent=2, ensure_ascii=False), encoding='utf-8'))
             return info
         except Exception as e:
             if logger:
                 logger.debug(f"Get device info failed: {e}")
             return None
 
-    def _open_browser(self, url: str = "https://www.tencent.com/zh-cn/") -> bool:
+    async def _open_browser(self, url: str = "https://www.tencent.com/zh-cn/") -> bool:
         try:
-            self._execute_shell('am', ['start', '-a', 'android.intent.action.VIEW', '-d', url])
-            time.sleep(2)
+            await self._execute_shell('am', ['start', '-a', 'android.intent.action.VIEW', '-d', url])
+            await asyncio.sleep(2)
             return True
         except Exception as e:
             if logger:
                 logger.debug(f"Open browser failed: {e}")
             return False
 
-    def _get_device_logs(self, filename: str) -> Optional[str]:
+    async def _get_device_logs(self) -> Optional[int]:
+        """Read the logcat lines since the last background poll and close the log files"""
+        if self.logcat is None:
+            return None
         try:
-            logs = self._execute_shell('logcat', ['-d'], return_result=True)
-            if logs:
-                filepath = self.sandbox_output_dir / filename
-                filepath.write_text(logs, encoding='utf-8')
-            return logs
+            lines = await self.logcat.finish()
+            self._log(f"  Logcat: {lines} lines, {len(self.logcat.files)} file(s), "
+                      f"{self.logcat.bytes_written / 1024:.0f}KB uncompressed")
+            return lines
         except Exception as e:
             if logger:
                 logger.debug(f"Get logs failed: {e}")
             return None
 
-    def _execute_shell(self, command: str, args: List[str], return_result: bool = False) -> Union[str, bool, None]:
+    async def _execute_shell(self, command: str, args: List[str], return_result: bool = False) -> Union[str, bool, None]:
         """
         Generic method for executing shell commands.
 
@@ -1339,16 +3809,55 @@ class AsyncSandboxTester:
         Returns:
             Command output string if return_result=True, otherwise True on success
         """
-        result = self.driver.execute_script('mobile: shell', {
-            'command': command,
-            'args': args
-        })
+        result = await self.driver.shell(command, args)
         return result if return_result else True
 
 
 # =============================================================================
 # Result Reporting
 # =============================================================================
+class LiveAggregate:
+    """
+    Incremental cross-worker aggregate in the parent process.
+
+    Workers stream each finished SandboxTestResult over a multiprocessing queue
+    (see BatchRunner._publish). The parent folds results in as they arrive, so the
+    progress line is always current and the collected results can still be
+    reported if a worker hangs or dies before writing its own summary.
+    """
+
+    def __init__(self, expected: int, worker_ids: List[int]):
+        self.expected = expected
+        self.results: List[SandboxTestResult] = []
+        self.successful = 0
+        self.create = OperationMetrics(name='Sandbox Create')
+        self.per_worker: Dict[int, int] = {wid: 0 for wid in worker_ids}
+        self.started_at = time.time()
+        self.last_result_at = 0.0
+
+    def add(self, result: SandboxTestResult) -> None:
+        self.results.append(result)
+        self.last_result_at = time.time()
+        self.per_worker[result.worker_id] = self.per_worker.get(result.worker_id, 0) + 1
+        if result.success:
+            self.successful += 1
+        if result.create_success:
+            self.create.record_success(result.create_latency_ms)
+        else:
+            self.create.record_failure(result.error, result.create_latency_ms)
+
+    def progress_line(self, running: int, total_workers: int) -> str:
+        done = len(self.results)
+        success_pct = self.successful / done * 100 if done else 0.0
+        expected = f"/{self.expected}" if self.expected else ""
+        idle = f"{time.time() - self.last_result_at:.0f}s ago" if self.last_result_at else "none yet"
+        workers = " ".join(f"w{wid}:{n}" for wid, n in sorted(self.per_worker.items()))
+        return (f"[progress {time.time() - self.started_at:.0f}s] done {done}{expected} "
+                f"(success {success_pct:.1f}%) | create P50 {self.create.percentile(0.50):.0f}ms "
+                f"P95 {self.create.percentile(0.95):.0f}ms | workers running {running}/{total_workers} "
+                f"| last result {idle} | {workers}")
+
+
 class ResultReporter:
     """Result report generator"""
 
@@ -1362,10 +3871,21 @@ class ResultReporter:
         duration = (end_time - start_time).total_seconds()
 
         create_metrics = OperationMetrics(name='Sandbox Create')
+        pool_hit_metrics = OperationMetrics(name='Pool Hit')
+        cold_create_metrics = OperationMetrics(name='Cold Create')
         connect_metrics = OperationMetrics(name='Appium Connect')
+        ready_metrics = OperationMetrics(name='Appium Ready')
         operation_metrics = create_operation_metrics()
+        wall_metrics = OperationMetrics(name='Operations Wall')
+        critical_metrics = OperationMetrics(name='Critical Path')
+        critical_paths: Dict[str, int] = {}
+        capture_metrics = OperationMetrics(name='Screenshot Capture')
+        encode_metrics = OperationMetrics(name='Screenshot Encode')
+        write_metrics = OperationMetrics(name='Screenshot Write')
+        screenshot_bytes = 0
 
         success_count = 0
+        apk_cache_counts: Dict[str, int] = {'device_hit': 0, 'shared_hit': 0, 'shared_upload': 0, 'miss': 0}
 
         # Retry statistics
         retry_triggered = 0  # Number of retries triggered
@@ -1379,6 +3899,15 @@ class ResultReporter:
             else:
                 create_metrics.record_failure(r.error, r.create_latency_ms)
 
+            # Split create latency by source (warm pool hit vs cold create)
+            if r.create_source == 'pool':
+                pool_hit_metrics.record_success(r.create_latency_ms)
+            elif r.create_source == 'cold':
+                if r.create_success:
+                    cold_create_metrics.record_success(r.create_latency_ms)
+                else:
+                    cold_create_metrics.record_failure(r.error, r.create_latency_ms)
+
             # Aggregate retry stats
             if r.create_retried:
                 retry_triggered += 1
@@ -1387,6 +3916,12 @@ class ResultReporter:
                 else:
                     retry_failed += 1
 
+            # Time to Appium readiness (part of connect)
+            if r.ready_success:
+                ready_metrics.record_success(r.ready_latency_ms)
+            elif r.ready_latency_ms > 0:
+                ready_metrics.record_failure('Appium readiness timeout', r.ready_latency_ms)
+
             # Aggregate connect metrics
             if r.create_success:
                 if r.connect_success:
@@ -1399,8 +3934,32 @@ class ResultReporter:
                 if key in operation_metrics:
                     operation_metrics[key].merge(metrics)
             
+            # Operation graph timing (only sandboxes that ran operations)
+            if r.operations_wall_ms > 0:
+                wall_metrics.record_success(r.operations_wall_ms)
+                critical_metrics.record_success(r.critical_path_ms)
+                path_key = ' -> '.join(r.critical_path)
+                critical_paths[path_key] = critical_paths.get(path_key, 0) + 1
+
+            # Screenshot pipeline stages (write runs in the background writer)
+            for frame in r.screenshots:
+                capture_metrics.record_success(float(frame.get('capture_ms', 0.0)))
+                encode_metrics.record_success(float(frame.get('encode_ms', 0.0)))
+                if frame.get('write_ok'):
+                    write_metrics.record_success(float(frame.get('write_ms', 0.0)))
+                else:
+                    write_metrics.record_failure('Screenshot write failed', float(frame.get('write_ms', 0.0)))
+                screenshot_bytes += int(frame.get('bytes', 0) or 0)
+
+            if r.apk_cache_status in apk_cache_counts:
+                apk_cache_counts[r.apk_cache_status] += 1
+
             if r.success:
                 success_count += 1
+
+        cache_hits = apk_cache_counts['device_hit'] + apk_cache_counts['shared_hit']
+        cache_lookups = sum(apk_cache_counts.values())
+        windows = self._aggregate_windows(results, start_time, config)
         
         data: Dict[str, Any] = {
             'config': {
@@ -1408,6 +3967,18 @@ class ResultReporter:
                 'process_count': int(config.get('PROCESS_COUNT', 2) or 2),
                 'use_mounted_apk': bool(config.get('USE_MOUNTED_APK', False)),
                 'thread_pool_size': config.get('THREAD_POOL_SIZE', 5),
+                'sandbox_pool_size': int(config.get('SANDBOX_POOL_SIZE', 0) or 0),
+                'keep_raw_latencies': bool(config.get('KEEP_RAW_LATENCIES', False)),
+                'apk_shared_dir': config.get('APK_SHARED_DIR', ''),
+                'pipeline_operations': bool(config.get('PIPELINE_OPERATIONS', True)),
+                'load_mode': config.get('LOAD_MODE', 'burst'),
+                'arrival_rate': float(config.get('ARRIVAL_RATE', 0) or 0),
+                'arrival_process': config.get('ARRIVAL_PROCESS', 'poisson'),
+                'ramp_up_seconds': float(config.get('RAMP_UP_SECONDS', 0) or 0),
+                'hold_seconds': float(config.get('HOLD_SECONDS', 0) or 0),
+                'ramp_down_seconds': float(config.get('RAMP_DOWN_SECONDS', 0) or 0),
+                'max_in_flight': int(config.get('MAX_IN_FLIGHT', 0) or 0),
+                'virtual_users': int(config.get('VIRTUAL_USERS', 0) or 0),
             },
             'summary': {
                 'start_time': start_time.isoformat(),
@@ -1415,7 +3986,8 @@ class ResultReporter:
                 'duration_seconds': duration,
                 'total_sandboxes': self.sandbox_count,
                 'successful_sandboxes': success_count,
-                'success_rate': f"{success_count / self.sandbox_count * 100:.2f}%",
+                # An open/closed run can end with no arrivals at all
+                'success_rate': f"{success_count / self.sandbox_count * 100:.2f}%" if self.sandbox_count else "N/A",
             },
             'retry': {
                 'sandbox_create': {
@@ -1425,24 +3997,108 @@ class ResultReporter:
                 },
             },
             'sandbox_create': create_metrics.to_dict(),
+            'sandbox_create_pool_hit': pool_hit_metrics.to_dict(),
+            'sandbox_create_cold': cold_create_metrics.to_dict(),
+            'sandbox_pool': {
+                'hits': pool_hit_metrics.total_runs,
+                'misses': cold_create_metrics.total_runs,
+                'hit_rate': f"{pool_hit_metrics.total_runs / len(results) * 100:.2f}%" if results else "0.00%",
+            },
             'appium_connect': connect_metrics.to_dict(),
+            'appium_ready': ready_metrics.to_dict(),
             'operations': {k: v.to_dict() for k, v in operation_metrics.items()},
+            'operations_wall': wall_metrics.to_dict(),
+            'critical_path': {
+                **critical_metrics.to_dict(),
+                'paths': [{'path': k, 'count': v}
+                          for k, v in sorted(critical_paths.items(), key=lambda kv: -kv[1])],
+            },
+            'windows': windows,
+            'screenshot': {
+                'format': config.get('SCREENSHOT_FORMAT', 'png'),
+                'quality': int(config.get('SCREENSHOT_QUALITY', 80)),
+                'max_width': int(config.get('SCREENSHOT_MAX_WIDTH', 0) or 0),
+                'frames': capture_metrics.total_runs,
+                'avg_bytes': round(screenshot_bytes / capture_metrics.total_runs) if capture_metrics.total_runs else 0,
+                'capture': capture_metrics.to_dict(),
+                'encode': encode_metrics.to_dict(),
+                'write': write_metrics.to_dict(),
+            },
+            'artifact_cache': {
+                'hits': cache_hits,
+                'misses': cache_lookups - cache_hits,
+                'hit_rate': f"{cache_hits / cache_lookups * 100:.2f}%" if cache_lookups else "0.00%",
+                **apk_cache_counts,
+            },
         }
 
         return data
     
+    def _aggregate_windows(self, results: List[SandboxTestResult], start_time: datetime,
+                           config: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Per-window breakdown by tester start time (to find the create-rate knee)"""
+        window_s = float(config.get('METRICS_WINDOW_SECONDS', 10) or 10)
+        origin = start_time.timestamp()
+        mode = config.get('LOAD_MODE', 'burst')
+        profile = LoadProfile.from_config(config, float(config.get('ARRIVAL_RATE', 0) or 0)) if mode == 'open' else None
+
+        buckets: Dict[int, Dict[str, Any]] = {}
+        for r in results:
+            if r.start_ts <= 0:
+                continue
+            idx = max(0, int((r.start_ts - origin) // window_s))
+            b = buckets.setdefault(idx, {
+                'started': 0, 'successful': 0, 'create': OperationMetrics(name='Sandbox Create'),
+                'connect': OperationMetrics(name='Appium Connect'), 'queue_delay': OperationMetrics(name='Queue Delay'),
+            })
+            b['started'] += 1
+            b['successful'] += 1 if r.success else 0
+            if r.create_success:
+                b['create'].record_success(r.create_latency_ms)
+            else:
+                b['create'].record_failure(r.error, r.create_latency_ms)
+            if r.create_success:
+                if r.connect_success:
+                    b['connect'].record_success(r.connect_latency_ms)
+                else:
+                    b['connect'].record_failure(r.error, r.connect_latency_ms)
+            b['queue_delay'].record_success(r.queue_delay_ms)
+
+        windows = []
+        for idx in sorted(buckets):
+            b = buckets[idx]
+            start_s = idx * window_s
+            entry: Dict[str, Any] = {
+                'window_start_s': start_s,
+                'window_seconds': window_s,
+                'started': b['started'],
+                'achieved_rate': round(b['started'] / window_s, 3),
+                'success_rate': f"{b['successful'] / b['started'] * 100:.2f}%",
+                'create_success_rate': b['create'].to_dict()['success_rate'],
+                'create_p50_ms': f"{b['create'].percentile(0.50):.2f}",
+                'create_p95_ms': f"{b['create'].percentile(0.95):.2f}",
+                'create_p99_ms': f"{b['create'].percentile(0.99):.2f}",
+                'connect_p95_ms': f"{b['connect'].percentile(0.95):.2f}",
+                'queue_delay_p95_ms': f"{b['queue_delay'].percentile(0.95):.2f}",
+            }
+            if profile is not None:
+                entry['target_rate'] = round(profile.rate_at(start_s + window_s / 2), 3)
+            windows.append(entry)
+        return windows
+
     def print_summary(self, summary: Dict[str, Any]) -> None:
         """Print summary report"""
-        print(f"\n{'='*80}")
+        print(f"\n{'='*100}")
         print("Test Results Summary")
-        print(f"{'='*80}")
+        print(f"{'='*100}")
         print(f"Total duration: {summary['summary']['duration_seconds']:.2f} seconds")
         print(f"Successful sandboxes: {summary['summary']['successful_sandboxes']}/{summary['summary']['total_sandboxes']} "
               f"({summary['summary']['success_rate']})")
 
-        print(f"\n{'-'*80}")
-        print(f"{'Operation':<28} {'Success%':<12} {'Avg(ms)':<12} {'P95(ms)':<12} {'Max(ms)':<12}")
-        print(f"{'-'*80}")
+        print(f"\n{'-'*100}")
+        print(f"{'Operation':<28} {'Success%':<12} {'Avg(ms)':<12} {'P50(ms)':<12} {'P95(ms)':<12} "
+              f"{'P99(ms)':<12} {'Max(ms)':<12}")
+        print(f"{'-'*100}")
 
         idx = 1
 
@@ -1450,7 +4106,15 @@ class ResultReporter:
         self._print_metric_row(idx, 'Sandbox Create', summary['sandbox_create'])
         idx += 1
 
+        # Warm pool enabled: show pool hit / cold create latency as separate rows
+        if summary.get('config', {}).get('sandbox_pool_size', 0) > 0:
+            for key, name in (('sandbox_create_pool_hit', 'Pool Hit'), ('sandbox_create_cold', 'Cold Create')):
+                if key in summary:
+                    self._print_metric_row(idx, name, summary[key], label=f"   - {name}")
+
         self._print_metric_row(idx, 'Appium Connect', summary['appium_connect'])
+        if summary.get('appium_ready', {}).get('total_runs'):
+            self._print_metric_row(idx, 'Appium Ready', summary['appium_ready'], label="   - Appium Ready")
         idx += 1
 
         # Print operation metrics (skip Upload APK if using mounted mode)
@@ -1464,15 +4128,74 @@ class ResultReporter:
                 self._print_metric_row(idx, name, summary['operations'][key])
                 idx += 1
 
-        print(f"{'='*80}")
+        # Operation graph timing: wall time vs. dependency critical path
+        if summary.get('operations_wall', {}).get('total_runs', 0) > 0:
+            print(f"{'-'*100}")
+            self._print_metric_row(idx, 'Operations Wall', summary['operations_wall'], label='Operations Wall')
+            self._print_metric_row(idx, 'Critical Path', summary['critical_path'], label='Critical Path')
+            paths = summary['critical_path'].get('paths', [])
+            if paths:
+                print(f"Most common critical path ({paths[0]['count']}x): {paths[0]['path']}")
+
+        # Screenshot pipeline: capture / encode / background write, per frame
+        screenshot = summary.get('screenshot', {})
+        if screenshot.get('frames', 0) > 0:
+            print(f"{'-'*100}")
+            quality = f" q{screenshot['quality']}" if screenshot['format'] != 'png' else ''
+            width = f", max width {screenshot['max_width']}" if screenshot['max_width'] else ''
+            print(f"Screenshots: {screenshot['frames']} frames, {screenshot['format']}{quality}{width}, "
+                  f"avg {screenshot['avg_bytes'] / 1024:.0f}KB")
+            for key, name in (('capture', 'Capture'), ('encode', 'Encode'), ('write', 'Write (background)')):
+                self._print_metric_row(idx, name, screenshot[key], label=f"   - {name}")
+
+        print(f"{'='*100}")
+
+        # Per-window breakdown (open/closed load modes)
+        if summary.get('config', {}).get('load_mode', 'burst') != 'burst' and summary.get('windows'):
+            print(f"\nPer-window breakdown (by tester start time):")
+            print(f"{'Window(s)':<12} {'Target/s':<10} {'Started/s':<10} {'Success%':<10} "
+                  f"{'Create%':<10} {'CreateP50':<12} {'CreateP95':<12} {'QueueP95':<12}")
+            for w in summary['windows']:
+                print(f"{w['window_start_s']:<12g} {str(w.get('target_rate', '-')):<10} {w['achieved_rate']:<10} "
+                      f"{w['success_rate']:<10} {w['create_success_rate']:<10} {w['create_p50_ms']:<12} "
+                      f"{w['create_p95_ms']:<12} {w['queue_delay_p95_ms']:<12}")
+
+        # Adaptive concurrency limits
+        concurrency = summary.get('concurrency') or {}
+        if any(c.get('enabled') or c.get('overload_errors') for c in concurrency.values()):
+            print(f"\nAdaptive concurrency ({'enabled' if any(c.get('enabled') for c in concurrency.values()) else 'disabled'}):")
+            for name, c in concurrency.items():
+                if not c.get('enabled'):
+                    print(f"  {name:<16} not limited, {c['overload_errors']} overload errors (429/5xx/timeout)")
+                    continue
+                limit_range = f" (range {c['min_limit_seen']}-{c['max_limit_seen']})" if 'min_limit_seen' in c else ""
+                print(f"  {name:<16} limit {c['limit']}{limit_range}, {c['decreases']} decreases, "
+                      f"{c['overload_errors']} overload errors (429/5xx/timeout), wait P95 {c['wait_p95_ms']:.0f}ms")
+
+        # Console logging overhead (queued writer)
+        logging_stats = summary.get('logging') or {}
+        if logging_stats.get('messages'):
+            print(f"Console logging ({logging_stats['verbosity']}): {logging_stats['messages']} messages, "
+                  f"{logging_stats['caller_overhead_ms']:.1f}ms in callers (avg {logging_stats['caller_avg_us']:.2f}us), "
+                  f"writer {logging_stats['writer_ms']:.1f}ms in {logging_stats['batches']} batches, "
+                  f"{logging_stats['terminal_dropped']} kept off the terminal")
+
+        # Print APK artifact cache statistics
+        cache = summary.get('artifact_cache', {})
+        if cache.get('hits', 0) + cache.get('misses', 0) > 0:
+            print(f"APK cache: {cache['hits']} hits / {cache['misses']} misses ({cache['hit_rate']}) | "
+                  f"device_hit={cache['device_hit']} shared_hit={cache['shared_hit']} "
+                  f"shared_upload={cache['shared_upload']} miss={cache['miss']}")
 
         # Print retry statistics
         self._print_retry_summary(summary)
 
-    def _print_metric_row(self, idx: int, name: str, metrics: Dict[str, Any]) -> None:
+    def _print_metric_row(self, idx: int, name: str, metrics: Dict[str, Any], label: Optional[str] = None) -> None:
         """Print single metric row"""
-        print(f"{f'{idx}. {name}':<28} {metrics['success_rate']:<12} "
-              f"{metrics['avg_latency_ms']:<12} {metrics['p95_latency_ms']:<12} "
+        label = label if label is not None else f'{idx}. {name}'
+        print(f"{label:<28} {metrics['success_rate']:<12} "
+              f"{metrics['avg_latency_ms']:<12} {metrics.get('p50_latency_ms', '-'):<12} "
+              f"{metrics['p95_latency_ms']:<12} {metrics.get('p99_latency_ms', '-'):<12} "
               f"{metrics['max_latency_ms']:<12}")
 
     def _print_retry_summary(self, summary: Dict[str, Any]) -> None:
@@ -1536,12 +4259,36 @@ class BatchRunner:
         self.executor: Optional[ThreadPoolExecutor] = None
         self.resource_manager = ResourceManager()
         self.reporter = ResultReporter(self.sandbox_count)
-        self._sandbox_id_offset = 0
+        self.pool: Optional[SandboxPool] = None
+        self.artifact_cache = ArtifactCache(config.get('APK_SHARED_DIR', ''))
+        self.timeseries: Optional[TimeSeriesRecorder] = None
+        self.screenshot_writer: Optional[ScreenshotWriter] = None
+        self.result_queue: Optional[Any] = None  # Set in multi-process workers; results are streamed to the parent
+        self.journal: Optional[ResultJournal] = None
+        self.events: Optional[EventLog] = None
+        self.console: Optional[TeeLogger] = None
+        self.limiters = create_limiters(config)
+        self._sandbox_ids: List[int] = []
+        self._prior_results: List[SandboxTestResult] = []
+        OperationMetrics.keep_raw_latencies = bool(config.get('KEEP_RAW_LATENCIES', False))
+
+    async def run(self, task_dir: Optional[Path] = None, sandbox_id_offset: int = 0,
+                  sandbox_ids: Optional[List[int]] = None,
+                  prior_results: Optional[List[SandboxTestResult]] = None) -> Dict[str, Any]:
+        """
+        Run batch operations
+
+        sandbox_ids: explicit ids to run (default: sandbox_id_offset .. +SANDBOX_COUNT)
+        prior_results: results already in the journal (--resume), included in the report
+        """
+        if sandbox_ids is None:
+            sandbox_ids = [int(sandbox_id_offset) + i for i in range(self.sandbox_count)]
+        self._sandbox_ids = list(sandbox_ids)
+        self._prior_results = list(prior_results or [])
+        self.sandbox_count = len(self._sandbox_ids)
+        self.reporter.sandbox_count = self.sandbox_count + len(self._prior_results)
+        resumed = bool(self.config.get('_RESUMED'))
 
-    async def run(self, task_dir: Optional[Path] = None, sandbox_id_offset: int = 0) -> Dict[str, Any]:
-        """Run batch operations"""
-        self._sandbox_id_offset = int(sandbox_id_offset)
-        
         if task_dir is None:
             output_dir = Path(__file__).parent / "output" / "batch_output"
             output_dir.mkdir(parents=True, exist_ok=True)
@@ -1551,21 +4298,42 @@ class BatchRunner:
             task_dir.mkdir(parents=True, exist_ok=True)
         else:
             task_dir.mkdir(parents=True, exist_ok=True)
+        if self.config.get('_WORKER_ID') is None and not resumed:
+            write_run_meta(task_dir, self.config, self.sandbox_count, 1)
         
-        # Thread pool size: Appium connections/operations are sync blocking, need thread pool for concurrency
-        # Default=SANDBOX_COUNT (consistent with old behavior), can override with THREAD_POOL_SIZE; max 1000
-        override_workers = self.config.get('THREAD_POOL_SIZE')
-        max_workers = min(int(override_workers), 1000) if override_workers else min(self.sandbox_count, 1000)
+        # Appium calls are async on a shared HTTP pool; the thread pool only serves disk I/O
+        # (APK reads/hashing, screenshot/XML/log writes), so it stays small
+        max_workers = int(self.config.get('THREAD_POOL_SIZE') or DEFAULT_CONFIG['THREAD_POOL_SIZE'])
         self.executor = ThreadPoolExecutor(max_workers=max_workers)
-        print(f"Thread pool size: {max_workers}")
+        print(f"I/O thread pool size: {max_workers}, Appium max connections: "
+              f"{self.config.get('APPIUM_MAX_CONNECTIONS', DEFAULT_CONFIG['APPIUM_MAX_CONNECTIONS'])}")
 
         log_file = task_dir / "console.log"
         # Main process output (including summary) always outputs to terminal
         mirror_to_terminal = True
-        with TeeLogger(log_file, mirror_to_terminal=mirror_to_terminal):
+        with TeeLogger(log_file, mirror_to_terminal=mirror_to_terminal, append=resumed,
+                       verbosity=self.config.get('CONSOLE_VERBOSITY', 'all'),
+                       flush_interval=float(self.config.get('CONSOLE_FLUSH_MS', 100)) / 1000) as console:
+            self.console = console
+            # Results are journaled as they finish so an interrupted run can be resumed
+            self.journal = ResultJournal(task_dir / JOURNAL_FILE, float(self.config.get('JOURNAL_FSYNC_SECONDS', 1.0)))
+            self.journal.start()
+            if self.config.get('EVENT_LOG_ENABLED', True):
+                self.events = EventLog(task_dir / EVENT_LOG_FILE, int(self.config.get('_WORKER_ID', 0) or 0),
+                                       int(self.config.get('EVENT_LOG_BUFFER_KB', 256)) * 1024)
+                self.events.start()
             try:
                 return await self._run_tests(task_dir)
             finally:
+                await self.journal.close()
+                if self.events is not None:
+                    await self.events.close()
+                if self.screenshot_writer is not None:
+                    await self.screenshot_writer.close()
+                    self.screenshot_writer = None
+                if self.timeseries is not None:
+                    await self.timeseries.close()
+                await close_appium_http_client()
                 if self.executor:
                     self.executor.shutdown(wait=False)
                     self.executor = None
@@ -1577,24 +4345,68 @@ class BatchRunner:
         # Warmup connection pool (not counted in batch operation time)
         await warmup_connection_pool()
 
+        # Pre-warm sandbox pool (not counted in batch operation time)
+        await self._fill_sandbox_pool()
+
+        if self._prior_results:
+            print(f"\nResuming: {len(self._prior_results)} results from journal, {self.sandbox_count} sandboxes to run")
         print(f"\nStarting concurrent test of {self.sandbox_count} sandboxes...")
 
+        # Per-second metrics stream (tail -f timeseries.jsonl during the run)
+        if self.config.get('TIMESERIES_ENABLED', True):
+            self.timeseries = TimeSeriesRecorder(
+                task_dir / TIMESERIES_FILE, int(self.config.get('_WORKER_ID', 0) or 0),
+                float(self.config.get('TIMESERIES_FLUSH_SECONDS', 1.0))
+            )
+            self.timeseries.start()
+
+        # Screenshots are encoded on the I/O pool and written behind the operations
+        self.screenshot_writer = ScreenshotWriter(self.executor, int(self.config.get('SCREENSHOT_WRITE_QUEUE', 64)))
+        self.screenshot_writer.start()
+
         # Record batch operation start time
         start_time = datetime.now()
-
-        # Execute tests concurrently
-        sandbox_ids = [self._sandbox_id_offset + i for i in range(self.sandbox_count)]
-        tasks = [self._run_single_test(sandbox_id, task_dir) for sandbox_id in sandbox_ids]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        self._publish('started', {'start_time': start_time.isoformat()})
+
+        # Execute tests (burst: all at once; open: arrival schedule; closed: virtual users)
+        mode = self.config.get('LOAD_MODE', 'burst')
+        if mode == 'open':
+            sandbox_ids, results = await self._run_open_loop(task_dir)
+        elif mode == 'closed':
+            sandbox_ids, results = await self._run_closed_loop(task_dir)
+        else:
+            sandbox_ids = list(self._sandbox_ids)
+            tasks = [self._run_single_test(sandbox_id, task_dir) for sandbox_id in sandbox_ids]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
 
         # Record batch operation end time (before result processing)
         end_time = datetime.now()
 
-        # Process results (not counted in batch operation total time)
-        valid_results = self._process_results(sandbox_ids, results)
+        if self.timeseries is not None:
+            await self.timeseries.close()
+            print(f"Time series written: {self.timeseries.path} ({self.timeseries.lines_written} lines)")
 
-        # Generate report
-        summary = self.reporter.aggregate(valid_results, start_time, end_time, self.config)
+        if self.pool is not None:
+            await self.pool.drain()
+            print(f"Sandbox pool stats: {self.pool.to_dict()}")
+
+        # Process results (not counted in batch operation total time)
+        valid_results = self._prior_results + self._process_results(sandbox_ids, results)
+        if mode != 'burst':
+            # Open/closed modes launch as many sandboxes as the schedule produced
+            self.reporter.sandbox_count = len(valid_results)
+
+        # Generate report (a resumed run is reported from the original start)
+        report_start = start_time
+        prior_starts = [r.start_ts for r in self._prior_results if r.start_ts > 0]
+        if prior_starts:
+            report_start = min(start_time, datetime.fromtimestamp(min(prior_starts)))
+        summary = self.reporter.aggregate(valid_results, report_start, end_time, self.config)
+        if self._prior_results:
+            summary['resume'] = {'journal_results': len(self._prior_results), 'rescheduled': self.sandbox_count}
+        summary['concurrency'] = self.limiter_stats()
+        if self.console is not None:
+            summary['logging'] = self.console.stats()
 
         # In multi-process mode, worker processes only save results without printing summary (avoid duplicate output)
         # Final summary is printed by parent process
@@ -1607,9 +4419,24 @@ class BatchRunner:
             self.reporter.print_summary(summary)
 
         self.reporter.save(summary, valid_results, task_dir)
+        self._publish('done', {'start_time': start_time.isoformat(), 'end_time': end_time.isoformat(),
+                               'concurrency': summary['concurrency'], 'logging': summary.get('logging', {})})
 
         return summary
 
+    def limiter_stats(self) -> Dict[str, Dict[str, Any]]:
+        return {name: limiter.to_dict() for name, limiter in self.limiters.items()}
+
+    def _publish(self, kind: str, payload: Any) -> None:
+        """Send a message to the multi-process parent (no-op in single-process mode)"""
+        if self.result_queue is None:
+            return
+        try:
+            self.result_queue.put((kind, int(self.config.get('_WORKER_ID', 0) or 0), payload))
+        except Exception as e:
+            if logger:
+                logger.warning(f"Failed to publish {kind} to parent: {e}")
+
     def _print_header(self, task_dir: Path) -> None:
         """Print test header info"""
         print(f"\n{'='*80}")
@@ -1619,32 +4446,139 @@ class BatchRunner:
         print(f"Task directory: {task_dir}")
         print(f"{'='*80}")
 
-    async def _run_single_test(self, sandbox_id: int, task_dir: Path) -> SandboxTestResult:
-        """Run single sandbox test"""
+    async def _fill_sandbox_pool(self) -> None:
+        """Create and pre-fill the warm sandbox pool (if enabled)"""
+        pool_size = int(self.config.get('SANDBOX_POOL_SIZE', 0) or 0)
+        if pool_size <= 0:
+            return
+
+        self.pool = SandboxPool(self.config, demand=self.sandbox_count, create_limiter=self.limiters['sandbox_create'])
+        self.resource_manager.register_pool(self.pool)
+        print(f"\nWarming sandbox pool: target={min(pool_size, self.sandbox_count)}, "
+              f"refill_concurrency={self.pool.refill_concurrency}, max_idle={self.pool.max_idle_seconds:.0f}s")
+        start = time.perf_counter()
+        await self.pool.fill()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        print(f"Sandbox pool ready: {self.pool.idle_count} idle, "
+              f"{self.pool.create_failures} failed, elapsed: {elapsed_ms:.0f}ms")
+
+    async def _run_open_loop(self, task_dir: Path) -> Tuple[List[int], List[Any]]:
+        """Open-loop load: start testers on an arrival schedule, independent of completions"""
+        profile = LoadProfile.from_config(self.config, float(self.config['ARRIVAL_RATE']))
+        process = self.config.get('ARRIVAL_PROCESS', 'poisson')
+        rng = random.Random()
+        arrivals = profile.arrival_times(process, len(self._sandbox_ids), rng)
+        max_in_flight = int(self.config.get('MAX_IN_FLIGHT', 0) or 0)
+        slots = asyncio.Semaphore(max_in_flight) if max_in_flight > 0 else None
+
+        print(f"Open-loop schedule: {len(arrivals)} arrivals over {profile.duration:.0f}s "
+              f"(peak {profile.peak:.2f}/s, {process}, max in flight: {max_in_flight or 'unlimited'})")
+
+        loop = asyncio.get_running_loop()
+        origin = loop.time()
+
+        async def arrival(sandbox_id: int, offset_s: float) -> SandboxTestResult:
+            await asyncio.sleep(max(0.0, origin + offset_s - loop.time()))
+            if slots is not None:
+                await slots.acquire()
+            try:
+                delay_ms = max(0.0, (loop.time() - origin - offset_s) * 1000)
+                return await self._run_single_test(sandbox_id, task_dir,
+                                                   scheduled_offset_s=offset_s, queue_delay_ms=delay_ms)
+            finally:
+                if slots is not None:
+                    slots.release()
+
+        sandbox_ids = self._sandbox_ids[:len(arrivals)]
+        results = await asyncio.gather(*[arrival(sid, off) for sid, off in zip(sandbox_ids, arrivals)],
+                                       return_exceptions=True)
+        return sandbox_ids, list(results)
+
+    async def _run_closed_loop(self, task_dir: Path) -> Tuple[List[int], List[Any]]:
+        """Closed-loop load: N virtual users each loop create -> operate -> destroy"""
+        users = int(self.config.get('VIRTUAL_USERS', 1))
+        if users <= 0:
+            # VIRTUAL_USERS < PROCESS_COUNT leaves some workers without a user
+            print("Closed-loop: no virtual users assigned to this worker")
+            return [], []
+        profile = LoadProfile.from_config(self.config, float(users))
+        print(f"Closed-loop: {users} virtual users, ramp up {profile.ramp_up:.0f}s, hold {profile.hold:.0f}s, "
+              f"ramp down {profile.ramp_down:.0f}s, max {self.sandbox_count} iterations")
+
+        loop = asyncio.get_running_loop()
+        origin = loop.time()
+        # (sandbox_id, result) pairs in completion order; users finish out of order,
+        # so ids and results must be recorded together
+        completed: List[Tuple[int, Any]] = []
+        next_index = 0
+
+        async def user(u: int) -> None:
+            nonlocal next_index
+            # Users join evenly over ramp-up and leave evenly over ramp-down (user 0 leaves last)
+            start_at = profile.ramp_up * u / users
+            stop_at = profile.ramp_up + profile.hold + profile.ramp_down * (users - u) / users
+            await asyncio.sleep(max(0.0, origin + start_at - loop.time()))
+            while loop.time() - origin < stop_at and next_index < len(self._sandbox_ids):
+                sandbox_id = self._sandbox_ids[next_index]
+                next_index += 1
+                offset_s = loop.time() - origin
+                try:
+                    result = await self._run_single_test(sandbox_id, task_dir,
+                                                         scheduled_offset_s=offset_s, virtual_user=u)
+                except Exception as e:
+                    result = e
+                completed.append((sandbox_id, result))
+
+        await asyncio.gather(*[user(u) for u in range(users)])
+        return [sid for sid, _ in completed], [r for _, r in completed]
+
+    async def _run_single_test(self, sandbox_id: int, task_dir: Path, **schedule: Any) -> SandboxTestResult:
+        """Run single sandbox test (schedule: load generator fields set on the result)"""
         tester = AsyncSandboxTester(
             sandbox_id, self.config, task_dir,
-            self.executor, self.resource_manager
+            self.executor, self.resource_manager, self.pool, self.artifact_cache, self.timeseries, self.limiters,
+            self.screenshot_writer, self.events
         )
-        return await tester.run()
+        try:
+            result = await tester.run()
+        except Exception as e:
+            self._record_result(self._error_result(sandbox_id, e))
+            raise
+        for name, value in schedule.items():
+            setattr(result, name, value)
+        self._record_result(result)
+        return result
+
+    def _record_result(self, result: SandboxTestResult) -> None:
+        """Journal a finished result and stream it to the multi-process parent"""
+        record = result.to_dict()
+        if self.journal is not None:
+            self.journal.append(record)
+        if self.events is not None:
+            self.events.emit(result.sandbox_id, 'end', **result_end_event(result))
+        self._publish('result', record)
+
+    def _error_result(self, sandbox_id: int, error: Exception) -> SandboxTestResult:
+        err_result = SandboxTestResult(sandbox_id=sandbox_id, error=str(error)[:MAX_ERROR_MSG_LENGTH])
+        err_result.worker_id = int(self.config.get('_WORKER_ID', 0) or 0)
+        return err_result
 
     def _process_results(self, sandbox_ids: List[int], results: List[Any]) -> List[SandboxTestResult]:
         """Process test results"""
         valid_results = []
         for sandbox_id, r in zip(sandbox_ids, results):
             if isinstance(r, Exception):
-                print(f"  [Sandbox {sandbox_id}] Exception: {str(r)[:50]}")
-                err_result = SandboxTestResult(sandbox_id=sandbox_id, error=str(r)[:MAX_ERROR_MSG_LENGTH])
-                err_result.worker_id = int(self.config.get('_WORKER_ID', 0) or 0)
-                valid_results.append(err_result)
+                console_print(f"  [Sandbox {sandbox_id}] Exception: {str(r)[:50]}", CONSOLE_SANDBOX)
+                valid_results.append(self._error_result(sandbox_id, r))
             else:
                 valid_results.append(r)
                 status = "success" if r.success else "failed"
                 # Detailed output: sandbox ID, real ID, start/end time, create time, destroy time
-                print(f"  [Done] Sandbox {r.sandbox_id} ({r.real_sandbox_id}) {status} | "
-                      f"start: {r.start_time} end: {r.end_time} | "
-                      f"create: {r.create_start_time}~{r.create_end_time} ({r.create_latency_ms:.0f}ms) | "
-                      f"destroy: {r.destroy_start_time}~{r.destroy_end_time} | "
-                      f"total: {r.total_latency_ms:.0f}ms")
+                console_print(f"  [Done] Sandbox {r.sandbox_id} ({r.real_sandbox_id}) {status} | "
+                              f"start: {r.start_time} end: {r.end_time} | "
+                              f"create: {r.create_start_time}~{r.create_end_time} ({r.create_latency_ms:.0f}ms) | "
+                              f"destroy: {r.destroy_start_time}~{r.destroy_end_time} | "
+                              f"total: {r.total_latency_ms:.0f}ms", CONSOLE_SANDBOX)
         return valid_results
 
     async def cleanup(self) -> None:
@@ -1663,14 +4597,29 @@ def _split_sandbox_counts(total: int, process_count: int) -> List[int]:
     return [base + (1 if i < rem else 0) for i in range(process_count)]
 
 
-def _worker_process_entry(worker_id: int, sandbox_count: int, sandbox_id_offset: int, task_dir_str: str,
-                          base_config: Dict[str, Any]) -> None:
-    """Worker process entry: each worker has independent event loop + thread pool"""
+def _split_proportional(total: int, weights: List[int]) -> List[int]:
+    """Split an integer total by weights (floor + largest remainder), parts sum exactly to total"""
+    total = int(total)
+    weight_sum = sum(weights)
+    if total <= 0 or weight_sum <= 0:
+        return [0] * len(weights)
+    exact = [total * w / weight_sum for w in weights]
+    parts = [int(x) for x in exact]
+    # Hand out what flooring dropped, largest fractional part first (ties: lower worker id)
+    by_remainder = sorted(range(len(weights)), key=lambda i: (parts[i] - exact[i], i))
+    for i in by_remainder[:total - sum(parts)]:
+        parts[i] += 1
+    return parts
+
+
+def _worker_process_entry(worker_id: int, sandbox_ids: List[int], task_dir_str: str,
+                          base_config: Dict[str, Any], result_queue: Optional[Any] = None) -> None:
+    """Worker process entry: each worker has independent event loop + thread pool, results stream to the parent"""
     global logger, _runner, _cleanup_done
     _cleanup_done = False
 
     config = dict(base_config)
-    config['SANDBOX_COUNT'] = int(sandbox_count)
+    config['SANDBOX_COUNT'] = len(sandbox_ids)
     config['PROCESS_COUNT'] = 1  # Prevent worker from recursively splitting
     config['_WORKER_ID'] = int(worker_id)
 
@@ -1692,10 +4641,11 @@ def _worker_process_entry(worker_id: int, sandbox_count: int, sandbox_id_offset:
     atexit.register(_sync_cleanup)
 
     runner = BatchRunner(config)
+    runner.result_queue = result_queue
     _runner = runner
 
     try:
-        asyncio.run(runner.run(task_dir=Path(task_dir_str), sandbox_id_offset=int(sandbox_id_offset)))
+        asyncio.run(runner.run(task_dir=Path(task_dir_str), sandbox_ids=sandbox_ids))
     except KeyboardInterrupt:
         print("\n\nTest interrupted")
         _sync_cleanup()
@@ -1705,30 +4655,117 @@ def _worker_process_entry(worker_id: int, sandbox_count: int, sandbox_id_offset:
         _sync_cleanup()
 
 
-def _run_multiprocess(config: Dict[str, Any]) -> None:
-    """Multi-process mode: parent process splits tasks and aggregates results"""
+def _collect_worker_results(processes: List[multiprocessing.Process], result_queue: Any,
+                            live: LiveAggregate, config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Drain streamed worker messages until every worker has exited.
+
+    Prints a progress line every PROGRESS_INTERVAL_SECONDS. On Ctrl+C or after
+    WORKER_TIMEOUT_SECONDS the workers get SIGINT (they clean up their sandboxes), and
+    are terminated WORKER_STOP_GRACE_SECONDS later; a second Ctrl+C terminates at once.
+    Results streamed up to that point are kept for the report.
+    """
+    progress_interval = float(config.get('PROGRESS_INTERVAL_SECONDS', 5.0) or 5.0)
+    timeout_s = float(config.get('WORKER_TIMEOUT_SECONDS', 0) or 0)
+    started: Dict[int, str] = {}
+    finished: Dict[int, Dict[str, Any]] = {}
+    stop_reason = ''
+    stop_sent_at = 0.0
+    interrupts = 0
+    next_progress = time.time() + progress_interval
+
+    def on_sigint(signum: int, frame: Optional[FrameType]) -> None:
+        nonlocal interrupts
+        interrupts += 1
+
+    previous_handler = signal.signal(signal.SIGINT, on_sigint)
+    try:
+        while True:
+            try:
+                message = result_queue.get(timeout=0.5)
+            except queue.Empty:
+                message = None
+            except (EOFError, OSError):
+                break
+
+            if message is not None:
+                kind, wid, payload = message
+                if kind == 'result':
+                    live.add(_sandbox_test_result_from_detail_dict(payload))
+                elif kind == 'started':
+                    started[wid] = payload['start_time']
+                elif kind == 'done':
+                    finished[wid] = payload
+            elif not any(p.is_alive() for p in processes):
+                break  # All workers exited and everything they sent has been drained
+
+            now = time.time()
+            if not stop_reason and (interrupts or (timeout_s and now - live.started_at > timeout_s)):
+                stop_reason = 'interrupted' if interrupts else f"timeout after {timeout_s:.0f}s"
+                print(f"\nStopping workers ({stop_reason}), keeping results received so far...")
+                for p in processes:
+                    try:
+                        if p.is_alive() and p.pid:
+                            os.kill(p.pid, signal.SIGINT)
+                    except Exception:
+                        pass
+                stop_sent_at = now
+            if stop_sent_at and (interrupts > 1 or now - stop_sent_at > WORKER_STOP_GRACE_SECONDS):
+                for p in processes:
+                    if p.is_alive():
+                        p.terminate()
+                stop_sent_at = 0.0
+
+            if now >= next_progress:
+                print(live.progress_line(sum(1 for p in processes if p.is_alive()), len(processes)))
+                next_progress = now + progress_interval
+    finally:
+        signal.signal(signal.SIGINT, previous_handler)
+
+    print(live.progress_line(sum(1 for p in processes if p.is_alive()), len(processes)))
+    return {'started': started, 'finished': finished, 'stop_reason': stop_reason}
+
+
+def _run_multiprocess(config: Dict[str, Any], resume_dir: Optional[Path] = None) -> None:
+    """Multi-process mode: parent process splits tasks and aggregates results (resume_dir: --resume)"""
     global _worker_processes
     
-    total = int(config['SANDBOX_COUNT'])
+    OperationMetrics.keep_raw_latencies = bool(config.get('KEEP_RAW_LATENCIES', False))
     process_count = int(config.get('PROCESS_COUNT', 1) or 1)
-    counts = _split_sandbox_counts(total, process_count)
+
+    if resume_dir is not None:
+        # Only sandbox ids missing from the journal are scheduled again
+        total, prior_results, pending_ids = load_resume_state(resume_dir, config)
+        task_dir = resume_dir
+        config = dict(config, _RESUMED=True)
+    else:
+        total = int(config['SANDBOX_COUNT'])
+        prior_results, pending_ids = [], list(range(total))
+
+    counts = _split_sandbox_counts(len(pending_ids), process_count)
     process_count = len(counts)
-    
-    output_dir = Path(__file__).parent / "output" / "batch_output"
-    output_dir.mkdir(parents=True, exist_ok=True)
-    
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    task_dir = output_dir / f"{total}_p{process_count}_{timestamp}"
-    task_dir.mkdir(parents=True, exist_ok=True)
+
+    if resume_dir is None:
+        output_dir = Path(__file__).parent / "output" / "batch_output"
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        task_dir = output_dir / f"{total}_p{process_count}_{timestamp}"
+        task_dir.mkdir(parents=True, exist_ok=True)
+        write_run_meta(task_dir, config, total, process_count)
     
     log_file = task_dir / "console.log"
     # Parent process summary always outputs to terminal (most important info for user)
     mirror_to_terminal = True
-    with TeeLogger(log_file, mirror_to_terminal=mirror_to_terminal):
+    with TeeLogger(log_file, mirror_to_terminal=mirror_to_terminal, append=resume_dir is not None,
+                   verbosity=config.get('CONSOLE_VERBOSITY', 'all'),
+                   flush_interval=float(config.get('CONSOLE_FLUSH_MS', 100)) / 1000) as console:
         print(f"\n{'='*80}")
         print("Batch Concurrent Operations (Multi-process + Thread Pool)")
         print(f"{'='*80}")
         print(f"Total sandboxes: {total}")
+        if resume_dir is not None:
+            print(f"Resuming: {len(prior_results)} results from journal, {len(pending_ids)} sandboxes to run")
         print(f"Process count: {process_count}")
         print(f"Per-process allocation: {counts}")
         print(f"Task directory: {task_dir}")
@@ -1738,12 +4775,30 @@ def _run_multiprocess(config: Dict[str, Any]) -> None:
         plan = []
         offset = 0
         for wid, c in enumerate(counts):
-            plan.append({'worker_id': wid, 'sandbox_count': c, 'sandbox_id_offset': offset})
+            ids = pending_ids[offset:offset + c]
+            item: Dict[str, Any] = {'worker_id': wid, 'sandbox_count': c, 'sandbox_id_offset': ids[0]}
+            if resume_dir is not None:
+                item['sandbox_ids'] = ids
+            plan.append(item)
             offset += c
-        (task_dir / "workers.json").write_text(json.dumps(plan, indent=2, ensure_ascii=False), encoding='utf-8')
+        plan_name = "workers_resume.json" if resume_dir is not None else "workers.json"
+        (task_dir / plan_name).write_text(json.dumps(plan, indent=2, ensure_ascii=False), encoding='utf-8')
         
         ctx = multiprocessing.get_context("spawn")
         processes: List[multiprocessing.Process] = []
+        result_queue = ctx.Queue()
+
+        # Split warm pool size across workers (SANDBOX_POOL_SIZE is a total)
+        pool_counts = _split_sandbox_counts(int(config.get('SANDBOX_POOL_SIZE', 0) or 0), process_count)
+        pool_counts += [0] * (process_count - len(pool_counts))
+
+        # Open/closed load is split proportionally to each worker's share of SANDBOX_COUNT;
+        # integer limits are split so the per-worker values add up to the configured totals
+        user_counts = _split_proportional(int(config.get('VIRTUAL_USERS', 1) or 1), counts)
+        max_in_flight = int(config.get('MAX_IN_FLIGHT', 0) or 0)
+        flight_counts = _split_proportional(max_in_flight, counts)
+        # A worker left without in-flight slots gets no arrivals; its rate share goes to the others
+        rate_weights = [c if max_in_flight == 0 or f > 0 else 0 for c, f in zip(counts, flight_counts)]
         
         offset = 0
         for wid, c in enumerate(counts):
@@ -1753,10 +4808,20 @@ def _run_multiprocess(config: Dict[str, Any]) -> None:
             # Pass actual process count so workers know whether to output to terminal
             worker_config = dict(config)
             worker_config['_ACTUAL_PROCESS_COUNT'] = process_count
+            worker_config['SANDBOX_POOL_SIZE'] = pool_counts[wid]
+            share = c / len(pending_ids)
+            worker_config['ARRIVAL_RATE'] = (float(config.get('ARRIVAL_RATE', 0) or 0)
+                                             * rate_weights[wid] / sum(rate_weights))
+            worker_config['VIRTUAL_USERS'] = user_counts[wid]
+            if max_in_flight > 0:
+                worker_config['MAX_IN_FLIGHT'] = flight_counts[wid]
+            # Adaptive limits are platform-wide totals, each worker adapts its share independently
+            worker_config['ADAPTIVE_CONCURRENCY_INITIAL'] = max(1, round(int(config['ADAPTIVE_CONCURRENCY_INITIAL']) * share))
+            worker_config['ADAPTIVE_CONCURRENCY_MAX'] = max(1, round(int(config['ADAPTIVE_CONCURRENCY_MAX']) * share))
 
             p = ctx.Process(
                 target=_worker_process_entry,
-                args=(wid, c, offset, str(worker_dir), worker_config),
+                args=(wid, pending_ids[offset:offset + c], str(worker_dir), worker_config, result_queue),
                 name=f"batch-worker-{wid}",
             )
             processes.append(p)
@@ -1765,10 +4830,17 @@ def _run_multiprocess(config: Dict[str, Any]) -> None:
         _worker_processes = processes
         for p in processes:
             p.start()
-        
+
+        # Results stream in over the queue as they finish; nothing is re-read from worker files
+        live = LiveAggregate(total if config.get('LOAD_MODE', 'burst') == 'burst' else 0,
+                             [item['worker_id'] for item in plan])
+        for r in prior_results:
+            live.add(r)
+        collected = _collect_worker_results(processes, result_queue, live, config)
+
         for p in processes:
-            p.join()
-        
+            p.join(timeout=WORKER_STOP_GRACE_SECONDS)
+
         exit_codes = {p.name: p.exitcode for p in processes}
         failed = {k: v for k, v in exit_codes.items() if v not in (0, None)}
         if failed:
@@ -1776,53 +4848,59 @@ def _run_multiprocess(config: Dict[str, Any]) -> None:
 
         _worker_processes.clear()
 
-        # Aggregate results
-        worker_summaries: List[Dict[str, Any]] = []
-        all_results: List[SandboxTestResult] = []
-
-        for item in plan:
-            wid = item['worker_id']
-            worker_dir = task_dir / f"worker_{wid:02d}"
-            summary_path = worker_dir / "summary.json"
-            details_path = worker_dir / "details.json"
-            if not summary_path.exists() or not details_path.exists():
-                print(f"Warning: worker_{wid:02d} missing result files, skipping aggregation")
-                continue
-            
-            worker_summaries.append(json.loads(summary_path.read_text(encoding='utf-8')))
-            details = json.loads(details_path.read_text(encoding='utf-8'))
-            if isinstance(details, list):
-                all_results.extend(_sandbox_test_result_from_detail_dict(d) for d in details if isinstance(d, dict))
-
-        # Use worker's actual start/end times to calculate overall interval
-        start_times = []
-        end_times = []
-        for s in worker_summaries:
-            try:
-                st = s.get('summary', {}).get('start_time')
-                et = s.get('summary', {}).get('end_time')
-                if st:
-                    start_times.append(datetime.fromisoformat(st))
-                if et:
-                    end_times.append(datetime.fromisoformat(et))
-            except Exception:
-                continue
+        # Aggregate streamed results (partial if a worker died, hung or was stopped)
+        all_results = live.results
+        incomplete = {item['worker_id']: processes[i].exitcode for i, item in enumerate(plan)
+                      if item['worker_id'] not in collected['finished']}
+        if incomplete:
+            print(f"Warning: Partial report, workers without a final result: "
+                  f"{sorted(incomplete)} ({len(all_results)} results received)")
+
+        # Overall interval: earliest worker start to latest worker end (or latest streamed result)
+        start_times = [datetime.fromisoformat(st) for st in collected['started'].values()]
+        end_times = [datetime.fromisoformat(d['end_time']) for d in collected['finished'].values()]
+        if incomplete or not end_times:
+            end_times += [datetime.fromtimestamp(r.start_ts + r.total_latency_ms / 1000)
+                          for r in all_results if r.start_ts > 0]
+        # A resumed run is reported from the original start
+        start_times += [datetime.fromtimestamp(r.start_ts) for r in prior_results if r.start_ts > 0]
         overall_start = min(start_times) if start_times else datetime.now()
         overall_end = max(end_times) if end_times else datetime.now()
-        
-        reporter = ResultReporter(total)
+
+        reporter = ResultReporter(total if config.get('LOAD_MODE', 'burst') == 'burst' else len(all_results))
         summary = reporter.aggregate(all_results, overall_start, overall_end, config)
+        summary['workers'] = {
+            'process_count': process_count,
+            'finished': sorted(collected['finished']),
+            'incomplete': {str(wid): code for wid, code in incomplete.items()},
+            'partial': bool(incomplete),
+            'stop_reason': collected['stop_reason'],
+        }
+        if resume_dir is not None:
+            summary['resume'] = {'journal_results': len(prior_results), 'rescheduled': len(pending_ids)}
+        summary['concurrency'] = merge_limiter_stats(
+            {wid: d.get('concurrency', {}) for wid, d in collected['finished'].items()})
+        summary['logging'] = merge_console_stats({
+            'parent': console.stats(),
+            **{f"worker_{wid:02d}": d.get('logging', {}) for wid, d in sorted(collected['finished'].items())},
+        })
         reporter.print_summary(summary)
         reporter.save(summary, all_results, task_dir)
 
+        # Merge per-worker time series into one timeline (also covers workers that died before saving results)
+        if config.get('TIMESERIES_ENABLED', True):
+            worker_files = [task_dir / f"worker_{item['worker_id']:02d}" / TIMESERIES_FILE for item in plan]
+            seconds = merge_timeseries_files(worker_files, task_dir / TIMESERIES_FILE)
+            print(f"Merged time series: {task_dir / TIMESERIES_FILE} ({seconds} seconds)")
+
         print(f"\nMulti-process batch operation complete: {task_dir}")
 
 
 # =============================================================================
 # Main Function
 # =============================================================================
-async def main_async() -> None:
-    """Async main function"""
+async def main_async(resume_dir: Optional[Path] = None) -> None:
+    """Async main function (resume_dir: task directory of an interrupted run)"""
     global logger
 
     try:
@@ -1847,8 +4925,26 @@ async def main_async() -> None:
     print(f"SANDBOX_COUNT: {config['SANDBOX_COUNT']}")
     print(f"PROCESS_COUNT: {config['PROCESS_COUNT']}")
     print(f"USE_MOUNTED_APK: {config['USE_MOUNTED_APK']}")
+    print(f"SANDBOX_POOL_SIZE: {config['SANDBOX_POOL_SIZE']}")
+    print(f"KEEP_RAW_LATENCIES: {config['KEEP_RAW_LATENCIES']}")
+    print(f"APK_SHARED_DIR: {config['APK_SHARED_DIR'] or '(disabled)'}")
+    print(f"PIPELINE_OPERATIONS: {config['PIPELINE_OPERATIONS']}")
+    print(f"LOAD_MODE: {config['LOAD_MODE']}")
+    if config['LOAD_MODE'] == 'open':
+        print(f"ARRIVAL: {config['ARRIVAL_RATE']}/s {config['ARRIVAL_PROCESS']}, "
+              f"ramp {config['RAMP_UP_SECONDS']:.0f}s/{config['HOLD_SECONDS']:.0f}s/{config['RAMP_DOWN_SECONDS']:.0f}s, "
+              f"MAX_IN_FLIGHT: {config['MAX_IN_FLIGHT'] or 'unlimited'}")
+    elif config['LOAD_MODE'] == 'closed':
+        print(f"VIRTUAL_USERS: {config['VIRTUAL_USERS']}, "
+              f"ramp {config['RAMP_UP_SECONDS']:.0f}s/{config['HOLD_SECONDS']:.0f}s/{config['RAMP_DOWN_SECONDS']:.0f}s")
+    if config['ADAPTIVE_CONCURRENCY']:
+        print(f"ADAPTIVE_CONCURRENCY: initial {config['ADAPTIVE_CONCURRENCY_INITIAL']}, "
+              f"max {config['ADAPTIVE_CONCURRENCY_MAX']}, latency tolerance {config['ADAPTIVE_LATENCY_TOLERANCE']}x")
     print(f"THREAD_POOL_SIZE: {config['THREAD_POOL_SIZE']}")
+    print(f"APPIUM_MAX_CONNECTIONS: {config['APPIUM_MAX_CONNECTIONS']}")
     print(f"HTTP pool: max_keepalive={limits.max_keepalive_connections}, max_conn={limits.max_connections}")
+    if resume_dir is not None:
+        print(f"RESUME: {resume_dir}")
 
     # Pre-check APK (only in local upload mode)
     if config['USE_MOUNTED_APK']:
@@ -1862,16 +4958,21 @@ async def main_async() -> None:
 
     # Multi-process mode: parent process splits and aggregates
     if int(config.get('PROCESS_COUNT', 1) or 1) > 1:
-        _run_multiprocess(config)
+        _run_multiprocess(config, resume_dir)
         return
 
     # Single process mode
     global _runner
+    run_kwargs: Dict[str, Any] = {}
+    if resume_dir is not None:
+        _, prior_results, pending_ids = load_resume_state(resume_dir, config)
+        config['_RESUMED'] = True
+        run_kwargs = {'task_dir': resume_dir, 'sandbox_ids': pending_ids, 'prior_results': prior_results}
     runner = BatchRunner(config)
     _runner = runner  # Set global variable for cleanup function
 
     try:
-        await runner.run()
+        await runner.run(**run_kwargs)
     except KeyboardInterrupt:
         print("\n\nTest interrupted")
         await runner.cleanup()
@@ -1966,10 +5067,36 @@ def _sync_cleanup() -> None:
     print("Resource cleanup complete")
 
 
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Mobile sandbox batch operations")
+    parser.add_argument('--resume', type=str, default=None, metavar='TASK_DIR',
+                        help='Resume an interrupted run: report journaled results and run only the missing sandboxes')
+    subparsers = parser.add_subparsers(dest='command')
+    report = subparsers.add_parser('report', help=f'Rebuild summary.json and time series from {EVENT_LOG_FILE} files')
+    report.add_argument('sources', nargs='+', metavar='PATH',
+                        help=f'Task directories (searched recursively for {EVENT_LOG_FILE}) or event log files')
+    report.add_argument('--output', type=str, default=None, metavar='DIR',
+                        help=f'Output directory (default: <first PATH>/{REPORT_DIR_NAME})')
+    return parser.parse_args()
+
+
 def main() -> None:
     """Entry function"""
     global _runner
 
+    args = parse_args()
+    if args.command == 'report':
+        summary = rebuild_report([Path(s).resolve() for s in args.sources],
+                                 Path(args.output).resolve() if args.output else None)
+        sys.exit(0 if summary is not None else 1)
+
+    resume_dir: Optional[Path] = None
+    if args.resume:
+        resume_dir = Path(args.resume).resolve()
+        if not resume_dir.is_dir():
+            print(f"Error: resume directory not found: {resume_dir}")
+            sys.exit(1)
+
     def signal_handler(signum: int, frame: Optional[FrameType]) -> None:
         sig_name = signal.Signals(signum).name
         print(f"\nReceived {sig_name} signal, exiting...")
@@ -1984,7 +5111,7 @@ def main() -> None:
     import atexit
     atexit.register(_sync_cleanup)
 
-    asyncio.run(main_async())
+    asyncio.run(main_async(resume_dir))
 
 
 if __name__ == "__main__":
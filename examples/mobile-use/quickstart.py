@@ -8,7 +8,7 @@ It provides a complete example of:
 - Installing and launching apps (with chunked APK upload)
 - Screen interactions (tap, screenshot)
 - GPS location mocking
-- Dumping full logcat logs before sandbox cleanup
+- Tailing logcat in the background (gzip) and saving the rest before sandbox cleanup
 
 Usage:
     1. Set E2B_API_KEY (provided by Tencent Cloud Agent Sandbox product) or create .env file
@@ -23,22 +23,29 @@ For more information, see the README.md file.
 """
 
 import os
+import re
 import sys
+import gzip
 import time
+import shlex
 import base64
+import secrets
 import signal
 import atexit
+import threading
 import requests
+import urllib3
 from pathlib import Path
 from types import FrameType
-from typing import Optional, Dict, Any, Union
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, List, Tuple, Union
 
 from e2b import Sandbox
-from appium import webdriver
 from appium.options.android import UiAutomator2Options
 from appium.webdriver.appium_connection import AppiumConnection
 from appium.webdriver.client_config import AppiumClientConfig
 from appium.webdriver.webdriver import WebDriver
+from selenium.common.exceptions import InvalidSessionIdException
 
 # Script directory (captured at import time for use in cleanup/signal handlers)
 SCRIPT_DIR = Path(__file__).parent
@@ -47,6 +54,7 @@ OUTPUT_DIR = SCRIPT_DIR / "output" / "quickstart_output"
 # Global variables for cleanup
 _driver = None
 _sandbox = None
+_logcat_tail = None
 _cleaned_up = False
 
 
@@ -97,6 +105,8 @@ def _load_config() -> Dict[str, Any]:
         'E2B_API_KEY': os.getenv("E2B_API_KEY", ""),
         'SANDBOX_TEMPLATE': os.getenv("SANDBOX_TEMPLATE", "mobile-v1"),
         'SANDBOX_TIMEOUT': int(os.getenv("SANDBOX_TIMEOUT", "3600")),  # 1 hour default
+        # logcat filterspecs applied on the device, e.g. "*:W" (empty = all logs)
+        'LOGCAT_FILTER': os.getenv("LOGCAT_FILTER", "").strip(),
     }
 
     if not config['E2B_DOMAIN']:
@@ -107,11 +117,117 @@ def _load_config() -> Dict[str, Any]:
     return config
 
 
+# Logcat tail: seconds between incremental reads; `-v epoch` lines start with the timestamp used as cursor
+LOGCAT_POLL_INTERVAL = 5
+LOGCAT_TIMESTAMP_PATTERN = re.compile(r'^\s*(\d+\.\d+)\s')
+
+
+class LogcatTail:
+    """
+    Background logcat capture into a gzip file.
+
+    Every LOGCAT_POLL_INTERVAL seconds a thread reads `logcat -d -v epoch -T <cursor>`,
+    where the cursor is the timestamp of the last saved line, and appends only the new
+    lines. Filterspecs (LOGCAT_FILTER) are applied by logcat on the device. finish()
+    reads the remaining lines and closes the file, so the dump at exit is quick.
+    """
+
+    def __init__(self, driver: WebDriver, path: Path, log_filter: str = '',
+                 poll_interval: float = LOGCAT_POLL_INTERVAL):
+        self.driver = driver
+        self.path = path
+        self.filter_args = log_filter.split()
+        self.poll_interval = poll_interval
+        self.cursor: Optional[str] = None
+        self.lines_written = 0
+        self._seen_at_cursor: set = set()  # Lines at the cursor timestamp (-T is inclusive)
+        self._file = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = gzip.open(self.path, 'wt', encoding='utf-8')
+        self._thread = threading.Thread(target=self._run, name='logcat-tail', daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.poll()
+            except Exception:
+                pass  # Retried on the next interval; finish() reports errors
+
+    def poll(self) -> int:
+        """Append lines newer than the cursor; returns the number of lines added"""
+        with self._lock:
+            if self._file is None:
+                return 0
+            command = ['logcat', '-d', '-v', 'epoch']
+            if self.cursor is not None:
+                command += ['-T', self.cursor]
+            output = driver_shell(self.driver, command + self.filter_args)
+            new_lines = []
+            for line in (output or '').splitlines():
+                match = LOGCAT_TIMESTAMP_PATTERN.match(line)
+                if not match:
+                    if not line.startswith('--------- beginning of'):
+                        new_lines.append(line)
+                    continue
+                ts = match.group(1)
+                if self.cursor is not None and float(ts) <= float(self.cursor):
+                    if ts == self.cursor and line not in self._seen_at_cursor:
+                        self._seen_at_cursor.add(line)
+                        new_lines.append(line)
+                    continue
+                if ts != self.cursor:
+                    self.cursor = ts
+                    self._seen_at_cursor = set()
+                self._seen_at_cursor.add(line)
+                new_lines.append(line)
+            if new_lines:
+                self._file.write('\n'.join(new_lines) + '\n')
+                self.lines_written += len(new_lines)
+            return len(new_lines)
+
+    def finish(self) -> int:
+        """Stop the thread, read the remaining lines and close the file; returns total lines"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.poll_interval + 30)
+        try:
+            self.poll()
+        finally:
+            with self._lock:
+                if self._file is not None:
+                    self._file.close()
+                    self._file = None
+        return self.lines_written
+
+
+def driver_shell(driver: WebDriver, command: List[str]) -> str:
+    """Run an argv command through mobile: shell, quoted for the device shell"""
+    result = driver.execute_script('mobile: shell', {'command': _shell_command_text(command), 'args': []})
+    return str(result) if result else ''
+
+
+def start_logcat_tail(driver: WebDriver, log_filter: str = '') -> LogcatTail:
+    """Start tailing logcat into output/quickstart_output/logcat_<timestamp>.txt.gz"""
+    global _logcat_tail
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
+    _logcat_tail = LogcatTail(driver, OUTPUT_DIR / f"logcat_{timestamp}.txt.gz", log_filter)
+    _logcat_tail.start()
+    print(f"Logcat tail started: {_logcat_tail.path}" + (f" (filter: {log_filter})" if log_filter else ""))
+    return _logcat_tail
+
+
 def dump_logcat(driver: WebDriver) -> Optional[str]:
     """
-    Dump full logcat logs from Android device and save to local output directory.
+    Save logcat logs from Android device to local output directory.
 
-    Uses 'logcat -d' to dump all buffered logs. This should be called before
+    With a running logcat tail only the lines since its last read are fetched;
+    otherwise 'logcat -d' dumps all buffered logs. This should be called before
     closing the Appium driver and terminating the sandbox.
 
     Args:
@@ -120,6 +236,20 @@ def dump_logcat(driver: WebDriver) -> Optional[str]:
     Returns:
         Path to the saved logcat file, None if failed
     """
+    global _logcat_tail
+    if _logcat_tail is not None:
+        print("[Action: dump_logcat] Saving remaining logcat lines...")
+        tail, _logcat_tail = _logcat_tail, None
+        try:
+            line_count = tail.finish()
+            print(f"  - Logcat saved: {tail.path}")
+            print(f"  - File size: {tail.path.stat().st_size / 1024:.2f} KB (gzip)")
+            print(f"  - Line count: {line_count}")
+            return str(tail.path)
+        except Exception as e:
+            print(f"  - Failed to save logcat: {e}")
+            return None
+
     print("[Action: dump_logcat] Dumping full logcat from Android device...")
 
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
@@ -189,6 +319,7 @@ def cleanup() -> None:
             print("  - Appium driver closed")
     except Exception as e:
         print(f"  - Error closing driver: {e}")
+    close_appium_pool()
 
     try:
         if _sandbox is not None:
@@ -317,6 +448,67 @@ def download_apk(apk_name: str, save_path: Path) -> bool:
         return False
 
 
+@dataclass
+class ShellResult:
+    """Output and exit code of one command in a shell batch"""
+    command: str
+    exit_code: Optional[int] = None  # None: the batch ended before this command finished
+    output: str = ''
+
+    @property
+    def ok(self) -> bool:
+        return self.exit_code == 0
+
+
+def _shell_command_text(command: Union[str, List[str]]) -> str:
+    """A command given as argv list is quoted for sh; a string is used as-is"""
+    return command if isinstance(command, str) else ' '.join(shlex.quote(str(a)) for a in command)
+
+
+def build_shell_batch(commands: List[Union[str, List[str]]]) -> Tuple[str, str]:
+    """
+    Build one sh script that runs all commands in order.
+
+    Each command's output (stdout + stderr) is framed by a begin marker and an end
+    marker carrying its exit code; the marker is random per batch so command output
+    cannot collide with it. Returns (script, marker).
+    """
+    marker = f"__SHELL_BATCH_{secrets.token_hex(6)}"
+    parts = [
+        f"echo {marker}B{i}; {{ {_shell_command_text(command)}\n}} 2>&1; echo {marker}E{i}:$?"
+        for i, command in enumerate(commands)
+    ]
+    return '\n'.join(parts), marker
+
+
+def parse_shell_batch(output: str, marker: str, commands: List[Union[str, List[str]]]) -> List[ShellResult]:
+    """Split the output of a build_shell_batch script back into one ShellResult per command"""
+    results = [ShellResult(_shell_command_text(command)) for command in commands]
+    pattern = re.compile(rf"{marker}B(\d+)\n(.*?){marker}E\1:(\d+)", re.DOTALL)
+    for match in pattern.finditer(output or ''):
+        index = int(match.group(1))
+        if index < len(results):
+            results[index].output = match.group(2)
+            results[index].exit_code = int(match.group(3))
+    return results
+
+
+def execute_shell_batch(driver: WebDriver, commands: List[Union[str, List[str]]]) -> List[ShellResult]:
+    """
+    Execute several ADB shell commands in one request.
+
+    Args:
+        driver: Appium driver
+        commands: Commands, each an argv list (quoted for sh) or a shell string
+
+    Returns:
+        One ShellResult (output, exit code) per command, in order
+    """
+    script, marker = build_shell_batch(commands)
+    output = driver.execute_script('mobile: shell', {'command': script, 'args': []})
+    return parse_shell_batch(str(output or ''), marker, commands)
+
+
 def is_app_installed(driver: WebDriver, package_name: str) -> bool:
     """Check if app is installed"""
     try:
@@ -549,18 +741,20 @@ def grant_app_permissions(driver: WebDriver, app_name: str) -> bool:
 
     print(f"[Action: grant_permissions] Granting permissions to {config['name']}...")
 
+    try:
+        results = execute_shell_batch(driver, [['pm', 'grant', config['package'], p] for p in config['permissions']])
+    except Exception as e:
+        print(f"  - Failed to grant permissions: {e}")
+        return False
+
     success_count = 0
-    for permission in config['permissions']:
-        try:
-            perm_name = permission.split('.')[-1]
-            driver.execute_script('mobile: shell', {
-                'command': 'pm',
-                'args': ['grant', config['package'], permission]
-            })
+    for permission, result in zip(config['permissions'], results):
+        perm_name = permission.split('.')[-1]
+        if result.ok:
             print(f"  - Granted: {perm_name}")
             success_count += 1
-        except Exception as e:
-            print(f"  - Failed to grant: {perm_name} ({e})")
+        else:
+            print(f"  - Failed to grant: {perm_name} ({result.output.strip() or f'exit {result.exit_code}'})")
 
     print(f"  Permissions granted: {success_count}/{len(config['permissions'])}")
     return success_count > 0
@@ -854,36 +1048,26 @@ def set_location(driver: WebDriver, latitude: float, longitude: float, altitude:
     try:
         appium_settings_pkg = "io.appium.settings"
 
-        # Grant location permissions
+        # Grant location permissions, allow mock location and start LocationService in one request
+        # (permission grants may fail harmlessly if already granted)
         print(f"  - Granting location permissions to io.appium.settings...")
-        for perm in ['ACCESS_FINE_LOCATION', 'ACCESS_COARSE_LOCATION']:
-            try:
-                driver.execute_script('mobile: shell', {
-                    'command': 'pm',
-                    'args': ['grant', appium_settings_pkg, f'android.permission.{perm}']
-                })
-            except Exception:
-                pass
-
-        # Grant mock location permission
-        driver.execute_script('mobile: shell', {
-            'command': 'appops',
-            'args': ['set', appium_settings_pkg, 'android:mock_location', 'allow']
-        })
-        print(f"  - mock_location permission set")
-
-        # Start LocationService
-        driver.execute_script('mobile: shell', {
-            'command': 'am',
-            'args': [
-                'start-foreground-service',
+        _, _, mock_location, location_service = execute_shell_batch(driver, [
+            ['pm', 'grant', appium_settings_pkg, 'android.permission.ACCESS_FINE_LOCATION'],
+            ['pm', 'grant', appium_settings_pkg, 'android.permission.ACCESS_COARSE_LOCATION'],
+            ['appops', 'set', appium_settings_pkg, 'android:mock_location', 'allow'],
+            [
+                'am', 'start-foreground-service',
                 '--user', '0',
                 '-n', f'{appium_settings_pkg}/.LocationService',
                 '--es', 'longitude', str(longitude),
                 '--es', 'latitude', str(latitude),
                 '--es', 'altitude', str(altitude)
-            ]
-        })
+            ],
+        ])
+        for result in (mock_location, location_service):
+            if not result.ok:
+                raise RuntimeError(f"{result.command}: exit {result.exit_code} {result.output.strip()}")
+        print(f"  - mock_location permission set")
         print(f"  - LocationService started")
 
         time.sleep(3)
@@ -963,6 +1147,76 @@ def install_and_launch_app(driver: WebDriver, app_name: str, max_retries: int =
     return True
 
 
+# Appium connection pool: keep-alive connections per sandbox host, shared by every
+# driver and session in the process (requests beyond the limit wait for a free one)
+APPIUM_POOL_ARGS = {'init_args_for_pool_manager': {'num_pools': 16, 'maxsize': 4, 'block': True}}
+
+_appium_pool: Optional[urllib3.PoolManager] = None
+
+
+class TokenAppiumConnection(AppiumConnection):
+    """
+    AppiumConnection that carries its own access token and shares one keep-alive pool.
+
+    The stock connection reads headers from the class-level AppiumConnection.extra_headers
+    (shared by every driver in the process) and opens a new urllib3 pool per connection.
+    Here the token is injected per request from the instance, and all connections draw
+    from one bounded PoolManager, so TLS connections to a sandbox host are reused across
+    commands, sessions and reconnects.
+    """
+
+    def __init__(self, client_config: AppiumClientConfig, access_token: str):
+        self._access_token = access_token
+        super().__init__(client_config=client_config)
+
+    def get_remote_connection_headers(self, parsed_url, keep_alive: bool = True) -> Dict[str, Any]:
+        headers = AppiumConnection.get_remote_connection_headers(parsed_url, keep_alive=keep_alive)
+        headers['X-Access-Token'] = self._access_token
+        return headers
+
+    def _get_connection_manager(self) -> urllib3.PoolManager:
+        global _appium_pool
+        if _appium_pool is None:
+            # Built by the parent so TLS/proxy settings from client_config still apply
+            _appium_pool = super()._get_connection_manager()
+        return _appium_pool
+
+    def close(self) -> None:
+        # The pool outlives drivers; see close_appium_pool()
+        pass
+
+
+def close_appium_pool() -> None:
+    """Close all pooled Appium connections"""
+    global _appium_pool
+    if _appium_pool is not None:
+        _appium_pool.clear()
+        _appium_pool = None
+
+
+class ReconnectingWebDriver(WebDriver):
+    """Appium driver that starts a new session on the same connection when the old one is gone"""
+
+    def start_session(self, capabilities: Any, browser_profile: Optional[str] = None) -> None:
+        self._session_capabilities = capabilities
+        super().start_session(capabilities, browser_profile)
+
+    def reconnect_session(self) -> None:
+        """Start a fresh Appium session, reusing this driver and its pooled connections"""
+        old_session_id = self.session_id
+        self.start_session(self._session_capabilities)
+        print(f"  - Appium session {old_session_id} expired, reconnected as {self.session_id}")
+
+    def execute(self, driver_command: str, params: Optional[Dict] = None) -> Dict:
+        try:
+            return super().execute(driver_command, params)
+        except InvalidSessionIdException:
+            if driver_command in ('newSession', 'quit'):
+                raise
+            self.reconnect_session()
+            return super().execute(driver_command, params)
+
+
 def AppiumDriver(sandbox: Sandbox, port: int = 4723, http_timeout: int = 300, **options_kwargs: Any) -> WebDriver:
     """
     Create Appium Driver connected to E2B sandbox.
@@ -983,76 +1237,105 @@ def AppiumDriver(sandbox: Sandbox, port: int = 4723, http_timeout: int = 300, **
     for key, value in options_kwargs.items():
         setattr(options, key, value)
 
-    # Set authentication header (AppiumConnection uses class variable)
-    AppiumConnection.extra_headers['X-Access-Token'] = sandbox._envd_access_token
-
-    # Use AppiumClientConfig to set HTTP timeout
+    # Use AppiumClientConfig to set HTTP timeout and the shared pool limits
     appium_url = f"https://{sandbox.get_host(port)}"
     client_config = AppiumClientConfig(
         remote_server_addr=appium_url,
-        timeout=http_timeout
+        timeout=http_timeout,
+        init_args_for_pool_manager=APPIUM_POOL_ARGS
     )
+    # Access token travels with this connection, not the AppiumConnection class
+    connection = TokenAppiumConnection(client_config, sandbox._envd_access_token)
 
-    return webdriver.Remote(options=options, client_config=client_config)
+    return ReconnectingWebDriver(command_executor=connection, options=options)
 
 
-def create_driver(sandbox: Sandbox, max_retries: int = 3, retry_interval: int = 5) -> WebDriver:
-    """
-    Create Appium Driver, connect to Android device in sandbox.
+# Readiness polling: first probe is immediate, then the interval grows from
+# READY_MIN_INTERVAL up to READY_MAX_INTERVAL so a fast boot is seen quickly
+# without hammering a slow one
+READY_MIN_INTERVAL = 0.05
+READY_MAX_INTERVAL = 1.0
+READY_BACKOFF_FACTOR = 1.5
+
+# Keep-alive session reused by every health probe (one TLS handshake per host)
+_health_session: Optional[requests.Session] = None
+
+
+def _get_health_session() -> requests.Session:
+    """Return the shared keep-alive session used for health probes."""
+    global _health_session
+    if _health_session is None:
+        _health_session = requests.Session()
+    return _health_session
 
-    First tries direct connection (usually works after sandbox starts),
-    retries with health check if failed.
+
+def wait_for_appium_ready(sandbox: Sandbox, timeout: float = 15.0) -> Optional[float]:
+    """
+    Poll the sandbox health endpoint until Appium answers 200.
 
     Args:
         sandbox: E2B Sandbox instance
-        max_retries: Max retry count, default 3
-        retry_interval: Retry interval in seconds, default 5
+        timeout: Max wait in seconds
 
     Returns:
-        Appium driver instance
+        Time-to-ready in seconds, None if not ready within timeout
     """
     health_url = f"https://{sandbox.get_host(8080)}/healthz"
     headers = {'X-Access-Token': sandbox._envd_access_token}
+    session = _get_health_session()
+
+    start = time.time()
+    deadline = start + timeout
+    interval = READY_MIN_INTERVAL
+    probes = 0
+    last_status = 'no response'
+    while True:
+        probes += 1
+        remaining = deadline - time.time()
+        try:
+            resp = session.get(health_url, headers=headers, timeout=max(0.5, min(5.0, remaining)))
+            if resp.status_code == 200:
+                elapsed = time.time() - start
+                print(f"  - Appium ready in {elapsed:.2f}s ({probes} probes)")
+                return elapsed
+            last_status = f"HTTP {resp.status_code}"
+        except requests.exceptions.RequestException as e:
+            last_status = type(e).__name__
 
-    # First try direct connection without health check
-    print(f"\nConnecting to Appium service...")
-    try:
-        print(f"  - Attempting connection...", end=' ', flush=True)
-        driver = AppiumDriver(sandbox)
-        print(f"connected!")
-        return driver
-    except Exception as e:
-        error_msg = str(e)
-        if 'Bad Gateway' in error_msg:
-            print(f"service not ready (Bad Gateway)")
-        elif 'Connection refused' in error_msg:
-            print(f"service not ready (Connection refused)")
-        else:
-            print(f"connection failed: {error_msg[:50]}")
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            print(f"  - Appium not ready after {timeout:.0f}s ({probes} probes, last: {last_status})")
+            return None
+        time.sleep(min(interval, remaining))
+        interval = min(interval * READY_BACKOFF_FACTOR, READY_MAX_INTERVAL)
 
-    # First connection failed, enter retry logic (with health check)
-    print(f"  - Waiting for service to be ready, max wait {max_retries * retry_interval}s...")
 
-    for attempt in range(1, max_retries + 1):
-        print(f"  - Waiting {retry_interval}s...")
-        time.sleep(retry_interval)
+def create_driver(sandbox: Sandbox, max_retries: int = 3, ready_timeout: float = 15.0) -> WebDriver:
+    """
+    Create Appium Driver, connect to Android device in sandbox.
 
-        try:
-            # Check health endpoint
-            print(f"  - Retry {attempt}/{max_retries}: checking service status...", end=' ', flush=True)
-            resp = requests.get(health_url, headers=headers, timeout=10)
+    Waits for the health endpoint first (usually answers on the first probe
+    once the sandbox has started), then connects; a failed connection goes
+    back to readiness polling before the next attempt.
 
-            if resp.status_code == 200:
-                print(f"health check passed")
-                print(f"  - Attempting connection...", end=' ', flush=True)
-                driver = AppiumDriver(sandbox)
-                print(f"connected!")
-                return driver
-            else:
-                print(f"health check returned {resp.status_code}")
+    Args:
+        sandbox: E2B Sandbox instance
+        max_retries: Max connection attempts, default 3
+        ready_timeout: Max wait for the health endpoint per attempt in seconds, default 15
 
-        except requests.exceptions.RequestException as e:
-            print(f"health check failed: {type(e).__name__}")
+    Returns:
+        Appium driver instance
+    """
+    print(f"\nConnecting to Appium service...")
+
+    for attempt in range(1, max_retries + 1):
+        wait_for_appium_ready(sandbox, timeout=ready_timeout)
+
+        try:
+            print(f"  - Attempt {attempt}/{max_retries}: connecting...", end=' ', flush=True)
+            driver = AppiumDriver(sandbox)
+            print(f"connected!")
+            return driver
         except Exception as e:
             error_msg = str(e)
             if 'Bad Gateway' in error_msg:
@@ -1062,7 +1345,7 @@ def create_driver(sandbox: Sandbox, max_retries: int = 3, retry_interval: int =
             else:
                 print(f"connection failed: {error_msg[:50]}")
 
-    raise Exception(f"Appium service not ready within {max_retries * retry_interval}s")
+    raise Exception(f"Appium service not ready after {max_retries} attempts")
 
 
 def get_device_info(driver: WebDriver) -> Dict[str, Any]:
@@ -1094,6 +1377,7 @@ def main(
     e2b_api_key: str,
     sandbox_template: str,
     sandbox_timeout: int,
+    log_filter: str = '',
 ) -> None:
     """
     Main function - Execute mobile automation test.
@@ -1103,6 +1387,7 @@ def main(
         e2b_api_key: E2B API Key (provided by Tencent Cloud Agent Sandbox product)
         sandbox_template: Sandbox template name
         sandbox_timeout: Sandbox timeout in seconds
+        log_filter: logcat filterspecs applied on the device (empty = all logs)
     """
     global _driver, _sandbox
 
@@ -1156,6 +1441,9 @@ def main(
     driver = create_driver(sandbox)
     _driver = driver
 
+    # Logcat is read in the background from here on
+    start_logcat_tail(driver, log_filter)
+
     # Get device info
     device_info = get_device_info(driver)
     print(f"\n===== Device Info =====")
@@ -1252,6 +1540,7 @@ if __name__ == "__main__":
         e2b_api_key=config['E2B_API_KEY'],
         sandbox_template=config['SANDBOX_TEMPLATE'],
         sandbox_timeout=config['SANDBOX_TIMEOUT'],
+        log_filter=config['LOGCAT_FILTER'],
     )
 
     # Cleanup is executed automatically via atexit
@@ -4,6 +4,7 @@ Single Sandbox Connection Tool - Connect to an existing E2B sandbox for mobile a
 
 Unlike quickstart.py (creates a new sandbox and runs a complete demo) and batch.py (batch testing),
 this tool connects to an existing single sandbox and executes mobile automation operations via CLI.
+Given several sandbox IDs it runs the same action list on all of them concurrently (fan-out).
 
 Supported actions:
 1. App operations: upload_app, install_app, launch_app, check_app, grant_app_permissions, close_app, uninstall_app, get_app_state
@@ -22,32 +23,59 @@ Usage examples:
     python sandbox_connect.py --sandbox-id <id> --action launch_app --app-name yyb
     python sandbox_connect.py --sandbox-id <id> --action set_location --latitude 22.5431 --longitude 113.9298
     python sandbox_connect.py --sandbox-id <id> --action shell --shell-cmd "pm list packages"
+    python sandbox_connect.py --sandbox-id <id1> --sandbox-id <id2> --action install_app,launch_app --app-name yyb
+    python sandbox_connect.py --sandbox-ids-file ids.txt --workers 16 --action screenshot
 """
 
+import io
 import os
+import math
 import re
 import sys
+import gzip
+import json
 import time
+import shlex
 import base64
+import secrets
+import hashlib
 import argparse
+import threading
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Iterator, Tuple, Union
 from urllib.parse import quote
+from xml.etree.ElementTree import iterparse
+
+import requests
+import urllib3
 
 from e2b import Sandbox
-from appium import webdriver
 from appium.options.android import UiAutomator2Options
 from appium.webdriver.appium_connection import AppiumConnection
 from appium.webdriver.client_config import AppiumClientConfig
 from appium.webdriver.webdriver import WebDriver
 from appium.webdriver.common.appiumby import AppiumBy
+from selenium.common.exceptions import InvalidSessionIdException
 
 # Script directory
 SCRIPT_DIR = Path(__file__).parent
 OUTPUT_DIR = SCRIPT_DIR / "output" / "sandbox_connect_output"
 
 # Chunked upload configuration
-CHUNK_SIZE = 20 * 1024 * 1024  # 20MB per chunk
+CHUNK_SIZE = 8 * 1024 * 1024  # 8MB per chunk
+UPLOAD_PARALLELISM = 4  # Chunks pushed in parallel, one connection each
+UPLOAD_READ_BLOCK_SIZE = 3 * 256 * 1024  # Multiple of 3 so per-block base64 concatenates cleanly
+UPLOAD_TEMP_DIR = '/data/local/tmp/chunks'
+DIGEST_CACHE_FILE = OUTPUT_DIR / "apk_digests.json"  # path -> {mtime_ns, size, md5}
+
+# Fan-out: sandboxes processed concurrently when several IDs are given (--workers)
+FANOUT_WORKERS = 8
+
+# Appium connection pool: keep-alive connections per sandbox host, shared by every
+# driver and session in the process (requests beyond the limit wait for a free one)
+APPIUM_POOL_ARGS = {'init_args_for_pool_manager': {'num_pools': 64, 'maxsize': 4, 'block': True}}
 
 # App configuration dictionary
 APP_CONFIGS = {
@@ -86,6 +114,289 @@ def _load_env_file() -> None:
             pass
 
 
+def _file_md5(path: Path) -> str:
+    """MD5 of a local file, hashed incrementally and cached on disk by (mtime, size)"""
+    st = path.stat()
+    key = str(path.resolve())
+    try:
+        cache = json.loads(DIGEST_CACHE_FILE.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        cache = {}
+    entry = cache.get(key) or {}
+    if entry.get('mtime_ns') == st.st_mtime_ns and entry.get('size') == st.st_size and entry.get('md5'):
+        return entry['md5']
+
+    md5 = hashlib.md5()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(UPLOAD_READ_BLOCK_SIZE), b''):
+            md5.update(block)
+    cache[key] = {'mtime_ns': st.st_mtime_ns, 'size': st.st_size, 'md5': md5.hexdigest()}
+    try:
+        DIGEST_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        DIGEST_CACHE_FILE.write_text(json.dumps(cache, indent=2, ensure_ascii=False), encoding='utf-8')
+    except OSError:
+        pass
+    return cache[key]['md5']
+
+
+class _Base64JsonBody:
+    """Streamed push_file body for file[offset:offset+length], base64-encoded block by block"""
+
+    def __init__(self, file_path: Path, offset: int, length: int, remote_path: str):
+        self.file_path = file_path
+        self.offset = offset
+        self.length = length
+        self._head = ('{"path": ' + json.dumps(remote_path) + ', "data": "').encode('utf-8')
+        self._tail = b'"}'
+
+    def __len__(self) -> int:
+        # Exact length, so the request goes out with Content-Length (no chunked encoding)
+        return len(self._head) + 4 * ((self.length + 2) // 3) + len(self._tail)
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self._head
+        with open(self.file_path, 'rb') as f:
+            f.seek(self.offset)
+            remaining = self.length
+            while remaining > 0:
+                block = f.read(min(UPLOAD_READ_BLOCK_SIZE, remaining))
+                if not block:
+                    raise IOError(f"Unexpected EOF reading {self.file_path}")
+                remaining -= len(block)
+                yield base64.b64encode(block)
+        yield self._tail
+
+
+_appium_pool: Optional[urllib3.PoolManager] = None
+_appium_pool_lock = threading.Lock()
+
+
+class TokenAppiumConnection(AppiumConnection):
+    """
+    AppiumConnection that carries its own access token and shares one keep-alive pool.
+
+    The stock connection reads headers from the class-level AppiumConnection.extra_headers
+    (shared by every driver in the process) and opens a new urllib3 pool per connection.
+    Here the token is injected per request from the instance, and all connections draw
+    from one bounded PoolManager, so TLS connections to a sandbox host are reused across
+    commands, sessions and reconnects.
+    """
+
+    def __init__(self, client_config: AppiumClientConfig, access_token: str):
+        self._access_token = access_token
+        super().__init__(client_config=client_config)
+
+    def get_remote_connection_headers(self, parsed_url, keep_alive: bool = True) -> Dict[str, Any]:
+        headers = AppiumConnection.get_remote_connection_headers(parsed_url, keep_alive=keep_alive)
+        headers['X-Access-Token'] = self._access_token
+        return headers
+
+    def _get_connection_manager(self) -> urllib3.PoolManager:
+        global _appium_pool
+        with _appium_pool_lock:
+            if _appium_pool is None:
+                # Built by the parent so TLS/proxy settings from client_config still apply
+                _appium_pool = super()._get_connection_manager()
+        return _appium_pool
+
+    def close(self):
+        # The pool outlives drivers; see close_appium_pool()
+        pass
+
+
+def close_appium_pool() -> None:
+    """Close all pooled Appium connections"""
+    global _appium_pool
+    if _appium_pool is not None:
+        _appium_pool.clear()
+        _appium_pool = None
+
+
+class ReconnectingWebDriver(WebDriver):
+    """Appium driver that starts a new session on the same connection when the old one is gone"""
+
+    def start_session(self, capabilities, browser_profile=None) -> None:
+        self._session_capabilities = capabilities
+        super().start_session(capabilities, browser_profile)
+
+    def reconnect_session(self) -> None:
+        """Start a fresh Appium session, reusing this driver and its pooled connections"""
+        old_session_id = self.session_id
+        self.start_session(self._session_capabilities)
+        print(f"  [Reconnect] Appium session {old_session_id} replaced by {self.session_id}")
+
+    def execute(self, driver_command: str, params: Dict = None) -> Dict:
+        try:
+            return super().execute(driver_command, params)
+        except InvalidSessionIdException:
+            if driver_command in ('newSession', 'quit'):
+                raise
+            self.reconnect_session()
+            return super().execute(driver_command, params)
+
+
+@dataclass
+class ShellResult:
+    """Output and exit code of one command in a shell batch"""
+    command: str
+    exit_code: Optional[int] = None  # None: the batch ended before this command finished
+    output: str = ''
+
+    @property
+    def ok(self) -> bool:
+        return self.exit_code == 0
+
+
+def _shell_command_text(command: Union[str, List[str]]) -> str:
+    """A command given as argv list is quoted for sh; a string is used as-is"""
+    return command if isinstance(command, str) else ' '.join(shlex.quote(str(a)) for a in command)
+
+
+def build_shell_batch(commands: List[Union[str, List[str]]]) -> Tuple[str, str]:
+    """
+    Build one sh script that runs all commands in order.
+
+    Each command's output (stdout + stderr) is framed by a begin marker and an end
+    marker carrying its exit code; the marker is random per batch so command output
+    cannot collide with it. Returns (script, marker).
+    """
+    marker = f"__SHELL_BATCH_{secrets.token_hex(6)}"
+    parts = [
+        f"echo {marker}B{i}; {{ {_shell_command_text(command)}\n}} 2>&1; echo {marker}E{i}:$?"
+        for i, command in enumerate(commands)
+    ]
+    return '\n'.join(parts), marker
+
+
+def parse_shell_batch(output: str, marker: str, commands: List[Union[str, List[str]]]) -> List[ShellResult]:
+    """Split the output of a build_shell_batch script back into one ShellResult per command"""
+    results = [ShellResult(_shell_command_text(command)) for command in commands]
+    pattern = re.compile(rf"{marker}B(\d+)\n(.*?){marker}E\1:(\d+)", re.DOTALL)
+    for match in pattern.finditer(output or ''):
+        index = int(match.group(1))
+        if index < len(results):
+            results[index].output = match.group(2)
+            results[index].exit_code = int(match.group(3))
+    return results
+
+
+UI_BOUNDS_PATTERN = re.compile(r'\[(-?\d+),(-?\d+)\]\[(-?\d+),(-?\d+)\]')
+
+# Actions that only read device state; any other action invalidates the cached UI tree when it finishes
+UI_READ_ONLY_ACTIONS = {
+    'dump_ui', 'screenshot', 'get_window_size', 'check_app', 'get_app_state', 'get_location',
+    'device_info', 'get_device_model', 'get_current_activity', 'get_current_package', 'get_device_logs',
+}
+
+
+class UiNode:
+    """One element of the UI hierarchy (only the attributes used for lookups and summaries)"""
+    __slots__ = ('index', 'parent', 'depth', 'cls', 'text', 'resource_id', 'content_desc',
+                 'clickable', 'bounds')
+
+    def __init__(self, index: int, parent: int, depth: int, attrs: Dict[str, str]):
+        self.index = index
+        self.parent = parent  # Index of the parent node, -1 for top-level nodes
+        self.depth = depth
+        self.cls = attrs.get('class', '')
+        self.text = attrs.get('text', '')
+        self.resource_id = attrs.get('resource-id', '')
+        self.content_desc = attrs.get('content-desc', '')
+        self.clickable = attrs.get('clickable') == 'true'
+        match = UI_BOUNDS_PATTERN.fullmatch(attrs.get('bounds', ''))
+        self.bounds = tuple(int(v) for v in match.groups()) if match else None
+
+    @property
+    def center(self) -> Optional[Tuple[int, int]]:
+        if self.bounds is None:
+            return None
+        x1, y1, x2, y2 = self.bounds
+        return (x1 + x2) // 2, (y1 + y2) // 2
+
+    @property
+    def signature(self) -> Tuple:
+        """Identity of the node across dumps (position in the tree is ignored)"""
+        return (self.cls, self.resource_id, self.text, self.content_desc, self.bounds)
+
+
+class UiTree:
+    """
+    UI hierarchy parsed once from a page_source dump.
+
+    The XML is read with iterparse into a flat node table (document order) and
+    indexed by text and resource-id, so element lookups after a dump do not
+    re-scan the XML.
+    """
+
+    def __init__(self, nodes: List[UiNode], captured_at: float):
+        self.nodes = nodes
+        self.captured_at = captured_at
+        self.by_text: Dict[str, List[int]] = {}
+        self.by_resource_id: Dict[str, List[int]] = {}
+        for node in nodes:
+            if node.text:
+                self.by_text.setdefault(node.text, []).append(node.index)
+            if node.resource_id:
+                self.by_resource_id.setdefault(node.resource_id, []).append(node.index)
+                # Short form ("button" for "com.example:id/button")
+                if ':id/' in node.resource_id:
+                    short_id = node.resource_id.split(':id/', 1)[1]
+                    self.by_resource_id.setdefault(short_id, []).append(node.index)
+
+    @classmethod
+    def parse(cls, xml_content: str) -> 'UiTree':
+        nodes: List[UiNode] = []
+        stack: List[int] = []
+        data = xml_content.encode('utf-8') if isinstance(xml_content, str) else xml_content
+        for event, elem in iterparse(io.BytesIO(data), events=('start', 'end')):
+            if elem.tag == 'hierarchy':  # Root element of the uiautomator dump
+                continue
+            if event == 'start':
+                index = len(nodes)
+                nodes.append(UiNode(index, stack[-1] if stack else -1, len(stack), elem.attrib))
+                stack.append(index)
+            else:
+                stack.pop()
+                elem.clear()  # Attributes are copied into the node table
+        return cls(nodes, time.time())
+
+    @property
+    def clickable(self) -> List[UiNode]:
+        return [node for node in self.nodes if node.clickable]
+
+    @property
+    def inputs(self) -> List[UiNode]:
+        return [node for node in self.nodes if 'EditText' in node.cls]
+
+    def find(self, text: str = None, resource_id: str = None, partial: bool = False) -> Optional[UiNode]:
+        """First node (document order) with the resource-id or text; partial matches text substrings"""
+        if resource_id:
+            indexes = self.by_resource_id.get(resource_id)
+        elif text and partial:
+            indexes = sorted(i for value, ids in self.by_text.items() if text in value for i in ids)
+        elif text:
+            indexes = self.by_text.get(text)
+        else:
+            indexes = None
+        return self.nodes[indexes[0]] if indexes else None
+
+    def diff(self, previous: 'UiTree') -> Dict[str, int]:
+        """Node counts added / removed / unchanged relative to an earlier dump"""
+        before: Dict[Tuple, int] = {}
+        for node in previous.nodes:
+            before[node.signature] = before.get(node.signature, 0) + 1
+        unchanged = 0
+        for node in self.nodes:
+            if before.get(node.signature, 0) > 0:
+                before[node.signature] -= 1
+                unchanged += 1
+        return {
+            'added': len(self.nodes) - unchanged,
+            'removed': len(previous.nodes) - unchanged,
+            'unchanged': unchanged,
+        }
+
+
 class SandboxClient:
     """E2B Sandbox Client"""
     
@@ -108,6 +419,9 @@ class SandboxClient:
             raise RuntimeError('E2B_API_KEY is required')
         self.sandbox = None
         self.driver = None
+        self.output_dir = OUTPUT_DIR  # Per-sandbox subdirectory in fan-out mode
+        self.ui_tree: Optional[UiTree] = None  # Last parsed dump, None after UI-changing actions
+        self._last_ui_tree: Optional[UiTree] = None  # Kept across invalidation, for dump diffs
         
         # Set environment variables
         os.environ["E2B_DOMAIN"] = self.e2b_domain
@@ -179,15 +493,15 @@ class SandboxClient:
         options.set_capability('adbExecTimeout', 300000)
         options.set_capability('androidInstallTimeout', 300000)
         
-        AppiumConnection.extra_headers['X-Access-Token'] = self.sandbox._envd_access_token
-        
         appium_url = f"https://{self.sandbox.get_host(4723)}"
         client_config = AppiumClientConfig(
             remote_server_addr=appium_url,
-            timeout=300
+            timeout=300,
+            init_args_for_pool_manager=APPIUM_POOL_ARGS
         )
+        connection = TokenAppiumConnection(client_config, self.sandbox._envd_access_token)
         
-        return webdriver.Remote(options=options, client_config=client_config)
+        return ReconnectingWebDriver(command_executor=connection, options=options)
     
     def _get_app_config(self, app_name: str) -> dict:
         """Get app configuration"""
@@ -225,68 +539,63 @@ class SandboxClient:
             return False
         
         file_size = apk_path.stat().st_size
-        total_chunks = (file_size + CHUNK_SIZE - 1) // CHUNK_SIZE
+        chunks = [(i, off, min(CHUNK_SIZE, file_size - off)) for i, off in enumerate(range(0, file_size, CHUNK_SIZE))]
         
         print(f"  - Local APK path: {apk_path}")
         print(f"  - File size: {file_size / 1024 / 1024:.2f} MB")
-        print(f"  - Number of chunks: {total_chunks}")
+        print(f"  - Number of chunks: {len(chunks)} (parallel: {UPLOAD_PARALLELISM})")
         
-        temp_dir = '/data/local/tmp/chunks'
         remote_path = config['remote_path']
+        push_url = f"https://{self.sandbox.get_host(4723)}/session/{self.driver.session_id}/appium/device/push_file"
+        headers = {
+            'X-Access-Token': self.sandbox._envd_access_token,
+            'Content-Type': 'application/json; charset=utf-8',
+        }
+        
+        def push_chunk(http: requests.Session, index: int, offset: int, length: int) -> float:
+            chunk_start = time.time()
+            body = _Base64JsonBody(apk_path, offset, length, f"{UPLOAD_TEMP_DIR}/chunk_{index:04d}")
+            resp = http.post(push_url, data=body, headers=headers, timeout=300)
+            resp.raise_for_status()
+            elapsed = time.time() - chunk_start
+            print(f"    - Chunk {index + 1}/{len(chunks)} ({length / 1024 / 1024:.2f}MB) done ({elapsed:.1f}s)")
+            return elapsed
         
         try:
-            # Clean up and create temp directory
-            self.driver.execute_script('mobile: shell', {'command': 'rm', 'args': ['-rf', temp_dir]})
-            self.driver.execute_script('mobile: shell', {'command': 'mkdir', 'args': ['-p', temp_dir]})
-            self.driver.execute_script('mobile: shell', {'command': 'rm', 'args': ['-f', remote_path]})
-            
-            start_time = time.time()
-            
-            # Upload chunks
-            print(f"  [Phase 1] Uploading chunks...")
-            with open(apk_path, 'rb') as f:
-                for i in range(total_chunks):
-                    chunk_data = f.read(CHUNK_SIZE)
-                    chunk_b64 = base64.b64encode(chunk_data).decode('utf-8')
-                    chunk_path = f"{temp_dir}/chunk_{i:04d}"
-                    
-                    print(f"    - Chunk {i + 1}/{total_chunks} ({len(chunk_data) / 1024 / 1024:.2f}MB)...", end=' ', flush=True)
-                    chunk_start = time.time()
-                    self.driver.push_file(chunk_path, chunk_b64)
-                    print(f"Done ({time.time() - chunk_start:.1f}s)")
-            
-            # Merge chunks
-            print(f"  [Phase 2] Merging chunks...")
-            for i in range(total_chunks):
-                chunk_path = f"{temp_dir}/chunk_{i:04d}"
-                print(f"    - Merging chunk {i + 1}/{total_chunks}...", end=' ', flush=True)
+            with ThreadPoolExecutor(max_workers=UPLOAD_PARALLELISM + 1) as pool:
+                # Local digest is computed while chunks are in flight (cached by mtime/size)
+                digest_future = pool.submit(_file_md5, apk_path)
                 
-                if i == 0:
-                    self.driver.execute_script('mobile: shell', {'command': 'cp', 'args': [chunk_path, remote_path]})
-                else:
-                    # Subsequent chunks: append to target file
-                    self.driver.execute_script('mobile: shell', {
-                        'command': 'cat',
-                        'args': [chunk_path, '>>', remote_path]
-                    })
+                # Clean up and create temp directory
+                self.execute_shell(f"rm -rf {UPLOAD_TEMP_DIR} && mkdir -p {UPLOAD_TEMP_DIR} && rm -f {remote_path}")
                 
-                self.driver.execute_script('mobile: shell', {'command': 'rm', 'args': ['-f', chunk_path]})
-                print(f"Done")
-            
-            # Cleanup
-            self.driver.execute_script('mobile: shell', {'command': 'rm', 'args': ['-rf', temp_dir]})
-            
-            # Verify
-            result = self.driver.execute_script('mobile: shell', {'command': 'ls', 'args': ['-la', remote_path]})
+                start_time = time.time()
+                
+                # Upload chunks
+                print(f"  [Phase 1] Uploading chunks...")
+                with requests.Session() as http:
+                    adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=UPLOAD_PARALLELISM)
+                    http.mount('https://', adapter)
+                    futures = [pool.submit(push_chunk, http, i, off, length) for i, off, length in chunks]
+                    for future in futures:
+                        future.result()
+                
+                # Merge chunks, clean up and verify in one shell round trip
+                print(f"  [Phase 2] Merging chunks...")
+                result = self.execute_shell(
+                    f"cat {UPLOAD_TEMP_DIR}/chunk_* > {remote_path} && rm -rf {UPLOAD_TEMP_DIR} && md5sum {remote_path}"
+                )
+                local_md5 = digest_future.result()
             
             print(f"  - Total time: {time.time() - start_time:.1f}s")
             
-            if result and 'No such file' not in str(result):
-                print(f"✓ APK upload completed")
+            remote_md5 = result.strip().split()[0] if result and result.strip() else ''
+            if remote_md5.lower() == local_md5.lower():
+                print(f"✓ APK upload completed (MD5: {local_md5})")
                 print()
                 return True
             else:
-                print(f"✗ File verification failed")
+                print(f"✗ File verification failed (local MD5: {local_md5}, remote: {remote_md5 or result})")
                 print()
                 return False
                 
@@ -386,20 +695,21 @@ class SandboxClient:
             print()
             return True
         
+        try:
+            results = self.execute_shell_batch([['pm', 'grant', config['package'], p] for p in permissions])
+        except Exception as e:
+            print(f"✗ Grant permissions failed: {e}")
+            print()
+            return False
+        
         success_count = 0
-        for permission in permissions:
-            try:
-                perm_name = permission.split('.')[-1]
-                print(f"  - Granting permission: {perm_name}...", end=' ')
-                
-                self.driver.execute_script('mobile: shell', {
-                    'command': 'pm',
-                    'args': ['grant', config['package'], permission]
-                })
-                print(f"✓")
+        for permission, result in zip(permissions, results):
+            perm_name = permission.split('.')[-1]
+            if result.ok:
+                print(f"  - Granting permission: {perm_name}... ✓")
                 success_count += 1
-            except Exception:
-                print(f"⚠ Skipped")
+            else:
+                print(f"  - Granting permission: {perm_name}... ⚠ Skipped")
         
         print(f"\nPermissions granted: {success_count}/{len(permissions)}")
         print()
@@ -487,6 +797,7 @@ class SandboxClient:
                 'command': 'input',
                 'args': ['tap', str(x), str(y)]
             })
+            self.invalidate_ui_tree()
             print(f"✓ Tap successful")
             print()
             return True
@@ -499,13 +810,13 @@ class SandboxClient:
         """Take screenshot"""
         print("[Action: screenshot] Taking screenshot...")
         
-        OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
         
         if filename is None:
             timestamp = time.strftime("%Y%m%d_%H%M%S")
             filename = f"screenshot_{timestamp}.png"
         
-        screenshot_path = OUTPUT_DIR / filename
+        screenshot_path = self.output_dir / filename
         
         try:
             self.driver.save_screenshot(str(screenshot_path))
@@ -533,63 +844,44 @@ class SandboxClient:
             print(f"  - Target DPI: {dpi}")
         
         try:
-            # Step 1: Get current resolution
-            print(f"  - Step 1: Getting current resolution...")
-            current_size = self.driver.execute_script('mobile: shell', {
-                'command': 'wm',
-                'args': ['size']
-            })
-            print(f"    Current setting: {current_size.strip()}")
+            # One request: read current, apply, wait, read back
+            commands = [['wm', 'size'], ['wm', 'size', f'{width}x{height}']]
+            if dpi:
+                commands.append(['wm', 'density', str(dpi)])
+            commands += [['sleep', '1'], ['wm', 'size'], ['wm', 'density']]
+            results = self.execute_shell_batch(commands)
+            current_size, set_size = results[0], results[1]
+            new_size, current_dpi = results[-2], results[-1]
             
-            # Step 2: Set new resolution
-            print(f"  - Step 2: Setting new resolution {width}x{height}...")
-            result = self.driver.execute_script('mobile: shell', {
-                'command': 'wm',
-                'args': ['size', f'{width}x{height}']
-            })
+            print(f"  - Step 1: Current setting: {current_size.output.strip()}")
             
-            if result and 'error' in str(result).lower():
-                print(f"    ✗ Setting failed: {result}")
+            print(f"  - Step 2: Setting new resolution {width}x{height}...")
+            if not set_size.ok or 'error' in set_size.output.lower():
+                print(f"    ✗ Setting failed: {set_size.output.strip()}")
                 return False
-            
             print(f"    ✓ Resolution set")
             
-            # Step 3: Set DPI if specified
             if dpi:
                 print(f"  - Step 3: Setting DPI to {dpi}...")
-                dpi_result = self.driver.execute_script('mobile: shell', {
-                    'command': 'wm',
-                    'args': ['density', str(dpi)]
-                })
-                
-                if dpi_result and 'error' in str(dpi_result).lower():
-                    print(f"    ⚠ DPI setting failed: {dpi_result}")
+                dpi_result = results[2]
+                if not dpi_result.ok or 'error' in dpi_result.output.lower():
+                    print(f"    ⚠ DPI setting failed: {dpi_result.output.strip()}")
                 else:
                     print(f"    ✓ DPI set")
             
             # Step 4: Verify resolution is applied
             print(f"  - Step 4: Verifying resolution...")
-            time.sleep(1)
-            
-            new_size = self.driver.execute_script('mobile: shell', {
-                'command': 'wm',
-                'args': ['size']
-            })
-            print(f"    New setting: {new_size.strip()}")
+            print(f"    New setting: {new_size.output.strip()}")
             
             # Parse and verify
             expected = f"{width}x{height}"
-            if expected in str(new_size):
+            if expected in new_size.output:
                 print(f"\n✓ Screen resolution set successfully")
                 print(f"  - Resolution: {width}x{height}")
                 
                 # Display current DPI
-                current_dpi = self.driver.execute_script('mobile: shell', {
-                    'command': 'wm',
-                    'args': ['density']
-                })
-                if current_dpi:
-                    print(f"  - DPI: {current_dpi.strip()}")
+                if current_dpi.output.strip():
+                    print(f"  - DPI: {current_dpi.output.strip()}")
                 
                 print(f"\n  Note:")
                 print(f"    - This change is temporary and will be reset after device reboot")
@@ -610,42 +902,22 @@ class SandboxClient:
         print(f"[Action: reset_screen_resolution] Resetting screen resolution...")
         
         try:
-            # Get current resolution
+            # One request: read current, reset size and DPI, wait, read back
+            current_size, _, _, _, new_size, new_dpi = self.execute_shell_batch([
+                ['wm', 'size'],
+                ['wm', 'size', 'reset'],
+                ['wm', 'density', 'reset'],
+                ['sleep', '1'],
+                ['wm', 'size'],
+                ['wm', 'density'],
+            ])
             print(f"  - Current resolution:")
-            current_size = self.driver.execute_script('mobile: shell', {
-                'command': 'wm',
-                'args': ['size']
-            })
-            print(f"    {current_size.strip()}")
-            
-            # Reset resolution
-            print(f"  - Resetting resolution...")
-            self.driver.execute_script('mobile: shell', {
-                'command': 'wm',
-                'args': ['size', 'reset']
-            })
-            
-            # Reset DPI
-            print(f"  - Resetting DPI...")
-            self.driver.execute_script('mobile: shell', {
-                'command': 'wm',
-                'args': ['density', 'reset']
-            })
-            
-            # Verify reset result
-            time.sleep(1)
-            new_size = self.driver.execute_script('mobile: shell', {
-                'command': 'wm',
-                'args': ['size']
-            })
-            new_dpi = self.driver.execute_script('mobile: shell', {
-                'command': 'wm',
-                'args': ['density']
-            })
+            print(f"    {current_size.output.strip()}")
+            print(f"  - Resetting resolution and DPI...")
             
             print(f"\n✓ Screen resolution reset")
-            print(f"  - Resolution: {new_size.strip()}")
-            print(f"  - DPI: {new_dpi.strip()}")
+            print(f"  - Resolution: {new_size.output.strip()}")
+            print(f"  - DPI: {new_dpi.output.strip()}")
             print()
             return True
             
@@ -656,12 +928,44 @@ class SandboxClient:
     
     # ==================== UI Operations ====================
     
+    def get_ui_tree(self, refresh: bool = False) -> Optional[UiTree]:
+        """
+        Parsed UI hierarchy of the current screen
+        
+        Served from the cached tree until an action changes the UI (see
+        invalidate_ui_tree) or refresh is requested.
+        
+        Args:
+            refresh: Always fetch a new page_source
+            
+        Returns:
+            UiTree, None if the page source is empty
+        """
+        if self.ui_tree is not None and not refresh:
+            return self.ui_tree
+        xml_content = self.driver.page_source
+        if not xml_content:
+            return None
+        self._set_ui_tree(UiTree.parse(xml_content))
+        return self.ui_tree
+    
+    def _set_ui_tree(self, tree: UiTree) -> Optional[Dict[str, int]]:
+        """Cache a new tree; returns its diff against the previous dump, if any"""
+        previous, self._last_ui_tree = self._last_ui_tree, tree
+        self.ui_tree = tree
+        return tree.diff(previous) if previous is not None else None
+    
+    def invalidate_ui_tree(self) -> None:
+        """Drop the cached UI tree (the screen may have changed)"""
+        self.ui_tree = None
+    
     def dump_ui(self, save_path: str = None) -> str:
         """
         Get current screen UI hierarchy (XML format)
         
         Uses Appium's page_source to get the complete UI tree of current screen,
-        useful for analyzing UI elements and locating controls.
+        useful for analyzing UI elements and locating controls. The parsed tree is
+        cached for later element lookups in the same session.
         
         Args:
             save_path: Local path to save XML file (optional)
@@ -682,16 +986,22 @@ class SandboxClient:
             
             # Save to output directory by default
             if save_path is None:
-                OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-                save_path = OUTPUT_DIR / 'ui_dump.xml'
+                self.output_dir.mkdir(parents=True, exist_ok=True)
+                save_path = self.output_dir / 'ui_dump.xml'
             
             with open(save_path, 'w', encoding='utf-8') as f:
                 f.write(xml_content)
             
             print(f"✓ UI structure saved to: {save_path}")
             
-            # Parse and print key element info
-            self._print_ui_summary(xml_content)
+            # Parse once, cache and print key element info
+            tree = UiTree.parse(xml_content)
+            diff = self._set_ui_tree(tree)
+            print(f"  - Nodes: {len(tree.nodes)}")
+            if diff is not None:
+                print(f"  - Changes since last dump: +{diff['added']} / -{diff['removed']} "
+                      f"({diff['unchanged']} unchanged)")
+            self._print_ui_summary(tree)
             
             print()
             return xml_content
@@ -701,12 +1011,11 @@ class SandboxClient:
             print()
             return None
     
-    def _print_ui_summary(self, xml_content: str):
-        """Parse and print UI structure summary"""
+    def _print_ui_summary(self, tree: UiTree):
+        """Print UI structure summary"""
         
-        # Extract all clickable elements
-        node_pattern = r'<[^>]*clickable="true"[^>]*>'
-        clickable_nodes = re.findall(node_pattern, xml_content)
+        # Clickable elements with at least one identifier
+        clickable_nodes = tree.clickable
         
         if clickable_nodes:
             print(f"\n  Clickable elements ({len(clickable_nodes)} total):")
@@ -716,61 +1025,77 @@ class SandboxClient:
                     print(f"    ... {len(clickable_nodes) - 15} more elements")
                     break
                 
-                # Extract attributes
-                text_match = re.search(r'text="([^"]*)"', node)
-                res_id_match = re.search(r'resource-id="([^"]*)"', node)
-                bounds_match = re.search(r'bounds="\[(\d+),(\d+)\]\[(\d+),(\d+)\]"', node)
-                content_desc_match = re.search(r'content-desc="([^"]*)"', node)
-                
-                text = text_match.group(1) if text_match else ""
-                res_id = res_id_match.group(1) if res_id_match else ""
-                content_desc = content_desc_match.group(1) if content_desc_match else ""
-                
                 # Skip elements without any identifier
-                if not text and not res_id and not content_desc:
+                if not node.text and not node.resource_id and not node.content_desc:
                     continue
                 
-                display_text = text[:20] if text else (content_desc[:20] if content_desc else "(no text)")
-                display_id = res_id.split('/')[-1] if res_id else "(no ID)"
+                display_text = node.text[:20] if node.text else (node.content_desc[:20] if node.content_desc else "(no text)")
+                display_id = node.resource_id.split('/')[-1] if node.resource_id else "(no ID)"
                 
-                if bounds_match:
-                    x1, y1, x2, y2 = bounds_match.groups()
-                    center_x = (int(x1) + int(x2)) // 2
-                    center_y = (int(y1) + int(y2)) // 2
+                if node.center:
+                    center_x, center_y = node.center
                     print(f"    [{display_id}] {display_text} @ ({center_x}, {center_y})")
                 else:
                     print(f"    [{display_id}] {display_text}")
                 
                 count += 1
         
-        # Extract all input field elements
-        input_pattern = r'<[^>]*class="[^"]*EditText[^"]*"[^>]*>'
-        input_nodes = re.findall(input_pattern, xml_content)
+        # Input field elements
+        input_nodes = tree.inputs
         
         if input_nodes:
             print(f"\n  Input fields ({len(input_nodes)} total):")
-            for i, node in enumerate(input_nodes[:5]):  # Show at most 5
-                res_id_match = re.search(r'resource-id="([^"]*)"', node)
-                hint_match = re.search(r'text="([^"]*)"', node)
-                
-                res_id = res_id_match.group(1) if res_id_match else ""
-                hint = hint_match.group(1) if hint_match else ""
-                
-                display_id = res_id.split('/')[-1] if res_id else "(no ID)"
-                display_hint = hint[:20] if hint else "(no hint text)"
+            for node in input_nodes[:5]:  # Show at most 5
+                display_id = node.resource_id.split('/')[-1] if node.resource_id else "(no ID)"
+                display_hint = node.text[:20] if node.text else "(no hint text)"
                 
                 print(f"    [{display_id}] {display_hint}")
     
     def click_element(self, text: str = None, resource_id: str = None, partial: bool = False) -> bool:
-        """Click element"""
+        """
+        Click element
+        
+        The element is looked up in the cached UI tree (fetched once if there is
+        none) and tapped at the center of its bounds; elements missing from the
+        tree fall back to an Appium find_element search.
+        """
         print(f"[Action: click_element] Finding and clicking element...")
         
+        if not text and not resource_id:
+            print(f"✗ Either text or resource_id parameter is required")
+            print()
+            return False
+        
+        if resource_id:
+            print(f"  - Search method: resource-id")
+            print(f"  - Target ID: {resource_id}")
+        else:
+            print(f"  - Search method: text matching")
+            print(f"  - Target text: {text}")
+        
+        try:
+            cached = self.ui_tree is not None
+            tree = self.get_ui_tree()
+            node = tree.find(text=text, resource_id=resource_id, partial=partial) if tree else None
+            if node is not None and node.center:
+                center_x, center_y = node.center
+                print(f"  - Element found in {'cached' if cached else 'new'} UI tree, "
+                      f"center coordinates: ({center_x}, {center_y})")
+                self.driver.execute_script('mobile: shell', {
+                    'command': 'input',
+                    'args': ['tap', str(center_x), str(center_y)]
+                })
+                self.invalidate_ui_tree()
+                print(f"✓ Click successful")
+                print()
+                return True
+        except Exception as e:
+            print(f"  - UI tree lookup failed ({e}), searching with Appium")
+        
         element = None
         
         try:
             if resource_id:
-                print(f"  - Search method: resource-id")
-                print(f"  - Target ID: {resource_id}")
                 try:
                     element = self.driver.find_element(AppiumBy.ID, resource_id)
                 except Exception:
@@ -779,18 +1104,12 @@ class SandboxClient:
                     else:
                         xpath = f'//*[contains(@resource-id, ":id/{resource_id}")]'
                     element = self.driver.find_element(AppiumBy.XPATH, xpath)
-            elif text:
-                print(f"  - Search method: text matching")
-                print(f"  - Target text: {text}")
+            else:
                 if partial:
                     xpath = f'//*[contains(@text, "{text}")]'
                 else:
                     xpath = f'//*[@text="{text}"]'
                 element = self.driver.find_element(AppiumBy.XPATH, xpath)
-            else:
-                print(f"✗ Either text or resource_id parameter is required")
-                print()
-                return False
             
             if element:
                 location = element.location
@@ -800,6 +1119,7 @@ class SandboxClient:
                 print(f"  - Element found, center coordinates: ({center_x}, {center_y})")
                 
                 element.click()
+                self.invalidate_ui_tree()
                 print(f"✓ Click successful")
                 print()
                 return True
@@ -869,33 +1189,24 @@ class SandboxClient:
         try:
             appium_settings_pkg = "io.appium.settings"
             
-            # Grant permissions
-            for perm in ['ACCESS_FINE_LOCATION', 'ACCESS_COARSE_LOCATION']:
-                try:
-                    self.driver.execute_script('mobile: shell', {
-                        'command': 'pm',
-                        'args': ['grant', appium_settings_pkg, f'android.permission.{perm}']
-                    })
-                except Exception:
-                    pass
-            
-            self.driver.execute_script('mobile: shell', {
-                'command': 'appops',
-                'args': ['set', appium_settings_pkg, 'android:mock_location', 'allow']
-            })
-            
-            # Start LocationService
-            self.driver.execute_script('mobile: shell', {
-                'command': 'am',
-                'args': [
-                    'start-foreground-service',
+            # Grant permissions, allow mock location and start LocationService in one request
+            # (permission grants may fail harmlessly if already granted)
+            results = self.execute_shell_batch([
+                ['pm', 'grant', appium_settings_pkg, 'android.permission.ACCESS_FINE_LOCATION'],
+                ['pm', 'grant', appium_settings_pkg, 'android.permission.ACCESS_COARSE_LOCATION'],
+                ['appops', 'set', appium_settings_pkg, 'android:mock_location', 'allow'],
+                [
+                    'am', 'start-foreground-service',
                     '--user', '0',
                     '-n', f'{appium_settings_pkg}/.LocationService',
                     '--es', 'longitude', str(longitude),
                     '--es', 'latitude', str(latitude),
                     '--es', 'altitude', str(altitude)
-                ]
-            })
+                ],
+            ])
+            for result in results[2:]:
+                if not result.ok:
+                    raise RuntimeError(f"{result.command}: exit {result.exit_code} {result.output.strip()}")
             
             time.sleep(3)
             print(f"✓ GPS location set: ({latitude}, {longitude})")
@@ -962,8 +1273,7 @@ class SandboxClient:
         window_size = self.driver.get_window_size()
         
         try:
-            wm_size = self.driver.execute_script('mobile: shell', {'command': 'wm', 'args': ['size']})
-            wm_density = self.driver.execute_script('mobile: shell', {'command': 'wm', 'args': ['density']})
+            wm_size, wm_density = (r.output for r in self.execute_shell_batch([['wm', 'size'], ['wm', 'density']]))
         except Exception:
             wm_size = "N/A"
             wm_density = "N/A"
@@ -1141,25 +1451,34 @@ class SandboxClient:
             print()
             return None
     
-    def get_device_logs(self, save_to_file: bool = True) -> str:
+    def get_device_logs(self, save_to_file: bool = True, log_filter: str = '', since: str = None) -> str:
         """
         Get device logs (logcat)
         
         Args:
-            save_to_file: Whether to save to file
+            save_to_file: Whether to save to file (gzip-compressed)
+            log_filter: logcat filterspecs applied on the device, e.g. "*:W" or "ActivityManager:I *:S"
+            since: Only lines since this time ('MM-DD hh:mm:ss.mmm' or epoch seconds) or the last N lines
         """
         print("[Action: get_device_logs] Getting device logs...")
         
         try:
-            logs = self.execute_shell('logcat', ['-d'])
+            command = ['logcat', '-d']
+            if since:
+                command += ['-T', since]
+            command += log_filter.split()
+            if len(command) > 2:
+                print(f"  - Filter: {' '.join(command[2:])}")
+            logs = self.execute_shell(_shell_command_text(command))
             
             if logs and save_to_file:
-                OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+                self.output_dir.mkdir(parents=True, exist_ok=True)
                 timestamp = time.strftime("%Y%m%d_%H%M%S")
-                log_path = OUTPUT_DIR / f'device_logs_{timestamp}.txt'
-                log_path.write_text(logs, encoding='utf-8')
+                log_path = self.output_dir / f'device_logs_{timestamp}.txt.gz'
+                with gzip.open(log_path, 'wt', encoding='utf-8') as f:
+                    f.write(logs)
                 print(f"✓ Logs saved to: {log_path}")
-                print(f"  - Log size: {len(logs) / 1024:.2f} KB")
+                print(f"  - Log size: {len(logs) / 1024:.2f} KB ({log_path.stat().st_size / 1024:.2f} KB compressed)")
             else:
                 print(f"✓ Logs retrieved successfully ({len(logs) if logs else 0} bytes)")
             
@@ -1190,6 +1509,20 @@ class SandboxClient:
         except Exception:
             return None
     
+    def execute_shell_batch(self, commands: List[Union[str, List[str]]]) -> List[ShellResult]:
+        """
+        Execute several ADB shell commands in one request
+        
+        Args:
+            commands: Commands, each an argv list (quoted for sh) or a shell string
+            
+        Returns:
+            One ShellResult (output, exit code) per command, in order
+        """
+        script, marker = build_shell_batch(commands)
+        output = self.driver.execute_script('mobile: shell', {'command': script, 'args': []})
+        return parse_shell_batch(str(output or ''), marker, commands)
+    
     def shell(self, command: str, args: List[str] = None) -> str:
         """
         Execute ADB shell command (public interface with print output)
@@ -1255,7 +1588,7 @@ Supported actions:
     get_app_state           - Get app state (requires --app-name)
     get_current_activity    - Get current Activity
     get_current_package     - Get current package name
-    get_device_logs         - Get device logs
+    get_device_logs         - Get device logs (optional --logcat-filter, --logcat-since)
     open_browser            - Open browser (requires --url)
     disable_gms             - Disable Google Play Services
     enable_gms              - Enable Google Play Services
@@ -1271,10 +1604,18 @@ Usage examples:
     %(prog)s --sandbox-id <id> --action set_location --latitude 22.5431 --longitude 113.9298
     %(prog)s --sandbox-id <id> --action upload_app,install_app,launch_app --app-name yyb
     %(prog)s --sandbox-id <id> --action shell --shell-cmd "pm list packages"
+    %(prog)s --sandbox-id <id> --action get_device_logs --logcat-filter "*:W" --logcat-since 1000
+    %(prog)s --sandbox-id <id1> --sandbox-id <id2> --action install_app,launch_app --app-name yyb
+    %(prog)s --sandbox-ids-file ids.txt --workers 16 --action set_location --latitude 22.5431 --longitude 113.9298
         """
     )
     
-    parser.add_argument('--sandbox-id', type=str, required=True, help='Sandbox ID')
+    parser.add_argument('--sandbox-id', type=str, action='append', default=[],
+                        help='Sandbox ID (repeat to run the actions on several sandboxes)')
+    parser.add_argument('--sandbox-ids-file', type=str, default=None,
+                        help='File with one sandbox ID per line (blank lines and # comments ignored)')
+    parser.add_argument('--workers', type=int, default=FANOUT_WORKERS,
+                        help=f'Sandboxes processed concurrently in fan-out mode (default: {FANOUT_WORKERS})')
     parser.add_argument('--action', type=str, required=True, help='Action to execute, multiple actions separated by comma')
     parser.add_argument('--app-name', type=str, default=None, help='App name (yyb)')
     parser.add_argument('--apk-path', type=str, default=None, help='APK file path')
@@ -1291,18 +1632,24 @@ Usage examples:
     parser.add_argument('--dpi', type=int, default=None, help='Screen DPI')
     parser.add_argument('--url', type=str, default=None, help='Browser URL')
     parser.add_argument('--shell-cmd', type=str, default=None, help='ADB shell command')
+    parser.add_argument('--logcat-filter', type=str, default='',
+                        help='logcat filterspecs applied on the device (e.g. "*:W" or "ActivityManager:I *:S")')
+    parser.add_argument('--logcat-since', type=str, default=None,
+                        help="Only logcat lines since this time ('MM-DD hh:mm:ss.mmm' or epoch seconds) or the last N lines")
     parser.add_argument('--list-actions', action='store_true', help='List all available actions')
     
     return parser.parse_args()
 
 
-def execute_actions(client: SandboxClient, actions: List[str], args):
-    """Execute actions"""
+def execute_actions(client: SandboxClient, actions: List[str], args) -> Tuple[Dict[str, bool], Dict[str, float]]:
+    """Execute actions; returns (success per action, latency in ms per action)"""
     results = {}
+    timings = {}
     
     for i, action in enumerate(actions, 1):
         print(f"[{i}/{len(actions)}] Executing action: {action}")
         print("-" * 70)
+        action_start = time.perf_counter()
         
         try:
             # App operations
@@ -1445,7 +1792,8 @@ def execute_actions(client: SandboxClient, actions: List[str], args):
                 results[action] = client.get_current_package() is not None
             
             elif action == 'get_device_logs':
-                results[action] = client.get_device_logs() is not None
+                results[action] = client.get_device_logs(log_filter=args.logcat_filter,
+                                                         since=args.logcat_since) is not None
             
             elif action == 'shell':
                 if args.shell_cmd is None:
@@ -1466,6 +1814,12 @@ def execute_actions(client: SandboxClient, actions: List[str], args):
             print(f"✗ Action execution failed: {e}")
             results[action] = False
         
+        timings[action] = (time.perf_counter() - action_start) * 1000
+        
+        # The screen may have changed; the next UI lookup fetches a new tree
+        if action not in UI_READ_ONLY_ACTIONS:
+            client.invalidate_ui_tree()
+        
         print()
     
     # Print execution summary
@@ -1483,6 +1837,159 @@ def execute_actions(client: SandboxClient, actions: List[str], args):
     print("-" * 70)
     print(f"Total: {success_count}/{total_count} succeeded")
     print("=" * 70)
+    
+    return results, timings
+
+
+# ==================== Fan-out ====================
+
+class _ThreadOutput:
+    """sys.stdout replacement that sends each fan-out worker thread's prints to its own log file"""
+    
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+    
+    def redirect(self, f) -> None:
+        self._local.file = f
+    
+    def write(self, text: str) -> int:
+        return (getattr(self._local, 'file', None) or self._stream).write(text)
+    
+    def flush(self) -> None:
+        (getattr(self._local, 'file', None) or self._stream).flush()
+
+
+def load_sandbox_ids(args) -> List[str]:
+    """Sandbox IDs from --sandbox-id and --sandbox-ids-file, in order, without duplicates"""
+    sandbox_ids = list(args.sandbox_id)
+    if args.sandbox_ids_file:
+        with open(args.sandbox_ids_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.split('#', 1)[0].strip()
+                if line:
+                    sandbox_ids.append(line)
+    return list(dict.fromkeys(sandbox_ids))
+
+
+def _percentile(sorted_values: List[float], p: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values), math.ceil(p / 100 * len(sorted_values))) - 1)
+    return sorted_values[rank]
+
+
+def _run_one_sandbox(sandbox_id: str, actions: List[str], args, run_dir: Path) -> Dict[str, Any]:
+    """Connect, run the action list and disconnect one sandbox; prints go to <run_dir>/<id>/run.log"""
+    outcome = {'sandbox_id': sandbox_id, 'connect_ms': None, 'results': {}, 'timings': {}, 'error': None}
+    sandbox_dir = run_dir / sandbox_id
+    sandbox_dir.mkdir(parents=True, exist_ok=True)
+    with open(sandbox_dir / 'run.log', 'w', encoding='utf-8') as log_file:
+        sys.stdout.redirect(log_file)
+        client = None
+        try:
+            client = SandboxClient(sandbox_id=sandbox_id)
+            client.output_dir = sandbox_dir
+            connect_start = time.perf_counter()
+            client.connect()
+            outcome['connect_ms'] = (time.perf_counter() - connect_start) * 1000
+            outcome['results'], outcome['timings'] = execute_actions(client, actions, args)
+        except Exception as e:
+            outcome['error'] = str(e) or type(e).__name__
+            print(f"✗ Error occurred: {e}")
+        finally:
+            if client is not None:
+                client.disconnect()
+            sys.stdout.redirect(None)
+    return outcome
+
+
+def run_fanout(sandbox_ids: List[str], actions: List[str], args) -> List[Dict[str, Any]]:
+    """
+    Run the same action list on many sandboxes with a bounded worker pool
+    
+    Each sandbox gets its own connection, Appium session and output subdirectory
+    (with its console log in run.log); all drivers share the process-wide Appium
+    connection pool. Prints a per-sandbox and a per-action latency/success table.
+    """
+    workers = max(1, min(args.workers, len(sandbox_ids)))
+    run_dir = OUTPUT_DIR / f"fanout_{time.strftime('%Y%m%d_%H%M%S')}"
+    
+    print("=" * 70)
+    print("E2B Sandbox Client - Fan-out")
+    print("=" * 70)
+    print(f"Sandboxes: {len(sandbox_ids)}")
+    print(f"Actions: {', '.join(actions)}")
+    print(f"Workers: {workers}")
+    print(f"Output: {run_dir}")
+    print("=" * 70)
+    print()
+    
+    outcomes = []
+    console = sys.stdout
+    sys.stdout = _ThreadOutput(console)
+    start = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='fanout') as executor:
+            futures = [executor.submit(_run_one_sandbox, sandbox_id, actions, args, run_dir)
+                       for sandbox_id in sandbox_ids]
+            for future in as_completed(futures):
+                outcome = future.result()
+                outcomes.append(outcome)
+                ok = sum(1 for v in outcome['results'].values() if v)
+                status = f"error: {outcome['error'][:60]}" if outcome['error'] else f"{ok}/{len(actions)} succeeded"
+                console.write(f"[{len(outcomes)}/{len(sandbox_ids)}] {outcome['sandbox_id']}: {status}\n")
+                console.flush()
+    finally:
+        sys.stdout = console
+    wall = time.perf_counter() - start
+    
+    order = {sandbox_id: i for i, sandbox_id in enumerate(sandbox_ids)}
+    outcomes.sort(key=lambda o: order[o['sandbox_id']])
+    print_fanout_summary(outcomes, actions, wall)
+    return outcomes
+
+
+def print_fanout_summary(outcomes: List[Dict[str, Any]], actions: List[str], wall: float) -> None:
+    """Print per-sandbox status and per-action latency/success across all sandboxes"""
+    print()
+    print("=" * 70)
+    print("Fan-out Summary")
+    print("=" * 70)
+    print(f"{'Sandbox':<36} {'Connect':>10} {'Actions':>9}  Status")
+    print("-" * 70)
+    for outcome in outcomes:
+        connect = f"{outcome['connect_ms']:.0f}ms" if outcome['connect_ms'] is not None else "-"
+        ok = sum(1 for v in outcome['results'].values() if v)
+        done = f"{ok}/{len(outcome['results'])}"
+        status = f"✗ {outcome['error'][:40]}" if outcome['error'] else ("✓" if _fanout_ok(outcome) else "✗")
+        print(f"{outcome['sandbox_id']:<36} {connect:>10} {done:>9}  {status}")
+    
+    print()
+    print(f"{'Action':<25} {'OK':>9} {'Rate':>7} {'P50':>9} {'P95':>9} {'Max':>9}")
+    print("-" * 70)
+    rows = [('connect', [o['connect_ms'] is not None for o in outcomes],
+             [o['connect_ms'] for o in outcomes if o['connect_ms'] is not None])]
+    for action in dict.fromkeys(actions):
+        attempted = [o for o in outcomes if action in o['results']]
+        rows.append((action, [o['results'][action] for o in attempted], [o['timings'][action] for o in attempted]))
+    for name, successes, latencies in rows:
+        latencies = sorted(latencies)
+        ok = sum(1 for v in successes if v)
+        rate = f"{ok / len(successes) * 100:.0f}%" if successes else "-"
+        print(f"{name:<25} {f'{ok}/{len(successes)}':>9} {rate:>7} "
+              f"{_percentile(latencies, 50):>7.0f}ms {_percentile(latencies, 95):>7.0f}ms "
+              f"{(latencies[-1] if latencies else 0):>7.0f}ms")
+    
+    print("-" * 70)
+    succeeded = sum(1 for o in outcomes if _fanout_ok(o))
+    print(f"Total: {succeeded}/{len(outcomes)} sandboxes succeeded, wall time {wall:.1f}s")
+    print("=" * 70)
+
+
+def _fanout_ok(outcome: Dict[str, Any]) -> bool:
+    return not outcome['error'] and bool(outcome['results']) and all(outcome['results'].values())
 
 
 def main():
@@ -1501,8 +2008,23 @@ def main():
     # Parse action list
     actions = [a.strip() for a in args.action.split(',')]
     
+    sandbox_ids = load_sandbox_ids(args)
+    if not sandbox_ids:
+        print("Error: --sandbox-id or --sandbox-ids-file is required")
+        sys.exit(1)
+    
+    # Several sandboxes: same action list on each, concurrently
+    if len(sandbox_ids) > 1:
+        try:
+            outcomes = run_fanout(sandbox_ids, actions, args)
+        finally:
+            close_appium_pool()
+        if not all(_fanout_ok(o) for o in outcomes):
+            sys.exit(1)
+        return
+    
     # Create client
-    client = SandboxClient(sandbox_id=args.sandbox_id)
+    client = SandboxClient(sandbox_id=sandbox_ids[0])
     
     try:
         # Connect
@@ -1520,6 +2042,7 @@ def main():
     finally:
         # Disconnect
         client.disconnect()
+        close_appium_pool()
         
         print("=" * 70)
         print("Test completed!")
@@ -0,0 +1,163 @@
+"""Regression tests for batch.py load modes and reporting (no sandboxes are created)."""
+
+import asyncio
+import importlib.util
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+BATCH_PATH = Path(__file__).resolve().parent.parent / "batch.py"
+
+
+@pytest.fixture(scope="module")
+def batch():
+    spec = importlib.util.spec_from_file_location("batch", BATCH_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["batch"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def make_config(batch, **overrides):
+    config = dict(batch.DEFAULT_CONFIG)
+    config.update(PROCESS_COUNT=1, TIMESERIES_ENABLED=False, EVENT_LOG_ENABLED=False)
+    config.update(overrides)
+    return config
+
+
+def test_empty_open_loop_run_reports_na(batch, tmp_path, monkeypatch):
+    async def no_warmup():
+        pass
+
+    monkeypatch.setattr(batch, "warmup_connection_pool", no_warmup)
+    # 0.01 arrivals/s over 1s with constant inter-arrival times schedules nothing
+    config = make_config(batch, LOAD_MODE="open", ARRIVAL_RATE=0.01, ARRIVAL_PROCESS="constant",
+                         HOLD_SECONDS=1, SANDBOX_COUNT=3)
+
+    summary = asyncio.run(batch.BatchRunner(config).run(task_dir=tmp_path))
+
+    assert summary["summary"]["total_sandboxes"] == 0
+    assert summary["summary"]["success_rate"] == "N/A"
+    assert (tmp_path / "summary.json").exists()
+
+
+def test_closed_loop_keeps_results_with_their_sandbox_ids(batch, tmp_path):
+    config = make_config(batch, LOAD_MODE="closed", VIRTUAL_USERS=3, HOLD_SECONDS=5, SANDBOX_COUNT=6)
+    runner = batch.BatchRunner(config)
+    runner._sandbox_ids = list(range(6))
+
+    async def fake_test(sandbox_id, task_dir, **schedule):
+        # Later sandboxes finish first so users complete out of start order
+        await asyncio.sleep(0.01 * (6 - sandbox_id))
+        if sandbox_id % 2:
+            raise RuntimeError(f"boom {sandbox_id}")
+        return batch.SandboxTestResult(sandbox_id=sandbox_id)
+
+    runner._run_single_test = fake_test
+    sandbox_ids, results = asyncio.run(runner._run_closed_loop(tmp_path))
+
+    assert sorted(sandbox_ids) == list(range(6))
+    for sandbox_id, result in zip(sandbox_ids, results):
+        if isinstance(result, Exception):
+            assert str(result) == f"boom {sandbox_id}"
+        else:
+            assert result.sandbox_id == sandbox_id
+
+
+@pytest.mark.parametrize("total, weights", [
+    (3, [1, 1]),
+    (1, [5, 5, 5]),
+    (10, [3, 7]),
+    (7, [4, 4, 3]),
+    (100, [1, 1, 1]),
+])
+def test_split_proportional_adds_up_to_total(batch, total, weights):
+    parts = batch._split_proportional(total, weights)
+
+    assert sum(parts) == total
+    assert all(p >= 0 for p in parts)
+    # No part is more than one away from its exact proportional share
+    assert all(abs(p - total * w / sum(weights)) < 1 for p, w in zip(parts, weights))
+
+
+def test_closed_loop_worker_without_users_runs_nothing(batch, tmp_path):
+    runner = batch.BatchRunner(make_config(batch, LOAD_MODE="closed", VIRTUAL_USERS=0, SANDBOX_COUNT=2))
+    runner._sandbox_ids = [0, 1]
+
+    assert asyncio.run(runner._run_closed_loop(tmp_path)) == ([], [])
+
+
+def test_appium_connect_lines_are_step_lines(batch, tmp_path, capsys):
+    class FakeSandbox:
+        _envd_access_token = "token"
+
+        def get_host(self, port):
+            return f"{port}-sandbox.example"
+
+    class TimeoutProber:
+        async def wait_ready(self, url, headers, timeout):
+            raise asyncio.TimeoutError()
+
+    async def connect():
+        transport = httpx.MockTransport(lambda request: httpx.Response(500, json={"value": {"error": "boom"}}))
+        async with httpx.AsyncClient(transport=transport) as http:
+            with pytest.raises(RuntimeError):
+                await batch.create_appium_client(FakeSandbox(), http, sandbox_id=3, max_retries=1,
+                                                 prober=TimeoutProber())
+
+    with batch.TeeLogger(tmp_path / "console.log", verbosity="progress") as console:
+        asyncio.run(connect())
+        batch.console_print("  [Done] Sandbox 3", batch.CONSOLE_SANDBOX)
+
+    terminal = capsys.readouterr().out
+    log = (tmp_path / "console.log").read_text(encoding="utf-8")
+    assert "Retry 1/1" not in terminal and "Connection failed" not in terminal
+    assert "[Done] Sandbox 3" in terminal
+    assert "[Sandbox  3]   Retry 1/1, health check first..." in log
+    assert console.stats()["terminal_dropped"] == 4
+
+
+def test_pool_off_config_accepts_minimum_timeout(batch):
+    config = make_config(batch, E2B_API_KEY="key", E2B_DOMAIN="example.com", SANDBOX_TEMPLATE="mobile",
+                         SANDBOX_TIMEOUT=60)
+
+    batch._validate_config(config)
+
+    with pytest.raises(batch.ConfigurationError, match="SANDBOX_POOL_MAX_IDLE_SECONDS"):
+        batch._validate_config(dict(config, SANDBOX_POOL_SIZE=1))
+
+
+class PoolSandbox:
+    def __init__(self, fail_set_timeout=False):
+        self.fail_set_timeout = fail_set_timeout
+        self.timeouts = []
+        self.killed = False
+
+    async def set_timeout(self, timeout):
+        if self.fail_set_timeout:
+            raise RuntimeError("sandbox is gone")
+        self.timeouts.append(timeout)
+
+    async def kill(self):
+        self.killed = True
+
+
+def test_pool_hit_resets_timeout_and_drops_dead_sandboxes(batch):
+    async def scenario():
+        pool = batch.SandboxPool(make_config(batch, SANDBOX_TIMEOUT=120, SANDBOX_TEMPLATE="mobile"), demand=0)
+        dead, alive = PoolSandbox(fail_set_timeout=True), PoolSandbox()
+        pool._idle.extend([(dead, batch.time.monotonic()), (alive, batch.time.monotonic())])
+
+        first = await pool.acquire()
+        second = await pool.acquire()
+        await asyncio.sleep(0)
+        return pool, dead, alive, first, second
+
+    pool, dead, alive, first, second = asyncio.run(scenario())
+
+    assert first is alive and alive.timeouts == [120]
+    assert dead.killed
+    assert second is None  # nothing left: caller falls back to a cold create
+    assert (pool.hits, pool.misses, pool.expired) == (1, 1, 1)
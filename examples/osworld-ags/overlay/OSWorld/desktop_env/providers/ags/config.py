@@ -6,6 +6,14 @@ Environment variables (loaded from .env file):
 - E2B_DOMAIN: Domain for Agent Sandbox (default: e2b.dev)
 - AGS_TEMPLATE: Template name for the sandbox (default: osworld)
 - AGS_TIMEOUT: Sandbox timeout in seconds (default: 1800 = 30 minutes)
+- AGS_PROXY_POOL_LIMIT: Max pooled upstream connections per local proxy (default: 32)
+- AGS_PROXY_KEEPALIVE: Idle keep-alive for pooled upstream connections in seconds (default: 60)
+- AGS_PROXY_DNS_TTL: DNS cache TTL for the sandbox gateway in seconds (default: 300)
+- AGS_PROXY_STREAMING: Stream HTTP bodies through the local proxy chunk by chunk (default: true)
+- AGS_PROXY_HUB: Serve all local proxies in the process from one shared event loop (default: true)
+- AGS_PROXY_MODE: "ports" (scan for a free port per service) or "routed" (default: ports)
+- AGS_PROXY_ROUTED_PORT: TCP port of the shared routed listener, 0 = OS-assigned (default: 0)
+- AGS_PROXY_UDS: Optional Unix domain socket path for the routed listener (default: unset)
 
 Derived from xlang-ai/OSWorld under Apache-2.0.
 Modified and redistributed by Agent Sandbox Cookbook as part of the OSWorld AGS overlay.
@@ -24,6 +32,19 @@ E2B_DOMAIN = os.environ.get("E2B_DOMAIN", "e2b.dev")
 AGS_TEMPLATE = os.environ.get("AGS_TEMPLATE", "osworld")
 AGS_TIMEOUT = int(os.environ.get("AGS_TIMEOUT", str(30 * 60)))  # 30 minutes in seconds
 
+# Local Proxy Configuration (upstream connection pool to the sandbox gateway)
+AGS_PROXY_POOL_LIMIT = int(os.environ.get("AGS_PROXY_POOL_LIMIT", "32"))
+AGS_PROXY_KEEPALIVE = float(os.environ.get("AGS_PROXY_KEEPALIVE", "60"))
+AGS_PROXY_DNS_TTL = int(os.environ.get("AGS_PROXY_DNS_TTL", "300"))
+AGS_PROXY_STREAMING = os.environ.get("AGS_PROXY_STREAMING", "true").lower() in ("1", "true", "yes")
+AGS_PROXY_HUB = os.environ.get("AGS_PROXY_HUB", "true").lower() in ("1", "true", "yes")
+AGS_PROXY_MODE = os.environ.get("AGS_PROXY_MODE", "ports").lower()
+AGS_PROXY_ROUTED_PORT = int(os.environ.get("AGS_PROXY_ROUTED_PORT", "0"))
+AGS_PROXY_UDS = os.environ.get("AGS_PROXY_UDS", "")
+
+if AGS_PROXY_MODE not in ("ports", "routed"):
+    raise ValueError(f"AGS_PROXY_MODE must be 'ports' or 'routed', got {AGS_PROXY_MODE!r}")
+
 # Port Configuration (matching AGS sandbox defaults)
 SERVER_PORT = 5000
 CHROMIUM_PORT = 9222
@@ -5,17 +5,36 @@ Modified and redistributed by Agent Sandbox Cookbook as part of the OSWorld AGS
 
 import atexit
 import logging
+import os
 import signal
+import sys
 import time
 import threading
 import socket
+import stat
 import re
 import requests
 import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
 
 from desktop_env.providers.base import Provider
 from desktop_env.providers.ags.config import (
     AGS_TIMEOUT,
+    AGS_PROXY_POOL_LIMIT,
+    AGS_PROXY_KEEPALIVE,
+    AGS_PROXY_DNS_TTL,
+    AGS_PROXY_STREAMING,
+    AGS_PROXY_HUB,
+    AGS_PROXY_MODE,
+    AGS_PROXY_ROUTED_PORT,
+    AGS_PROXY_UDS,
     SERVER_PORT,
     CHROMIUM_PORT,
     VNC_PORT,
@@ -88,6 +107,27 @@ except ImportError:
     AIOHTTP_AVAILABLE = False
     logger.warning("aiohttp package not available, CDP proxy will have limited functionality")
 
+# Chunk size for streamed proxy bodies and how many per-request metrics to keep
+PROXY_STREAM_CHUNK_SIZE = 64 * 1024
+PROXY_METRICS_HISTORY = 256
+# Hop-by-hop / re-encoded headers that must not be copied to the client
+PROXY_SKIP_RESPONSE_HEADERS = ("transfer-encoding", "content-encoding", "content-length", "connection")
+
+# VM readiness probing: cheap endpoint first, screenshot as fallback for older
+# server images; poll interval doubles from the initial value up to the max.
+READY_PROBE_PATHS = ("/platform", "/screenshot")
+READY_POLL_INITIAL = 0.25
+READY_POLL_MAX = 2.0
+
+
+def get_peak_rss_kb() -> int:
+    """Return the process peak resident set size in KiB (0 if unavailable)."""
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and KiB on Linux
+    return peak // 1024 if sys.platform == "darwin" else peak
+
 
 def find_available_port(start_port: int) -> int:
     """Find an available port starting from start_port."""
@@ -132,6 +172,82 @@ def find_and_bind_port(start_port: int, max_retries: int = 100) -> socket.socket
     raise RuntimeError(f"No available port found starting from {start_port}")
 
 
+class ProxyConnectionStats:
+    """
+    Upstream connection counters for a proxy's shared client session.
+
+    Populated through an aiohttp TraceConfig, so every request that reuses a
+    keep-alive connection (instead of paying a new TCP+TLS handshake to the
+    sandbox gateway) shows up in ``connections_reused``.
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.connections_created = 0
+        self.connections_reused = 0
+        self.recent = deque(maxlen=PROXY_METRICS_HISTORY)
+
+    def trace_config(self) -> "aiohttp.TraceConfig":
+        """Build a TraceConfig that updates these counters."""
+        async def on_request_start(session, ctx, params):
+            self.requests += 1
+
+        async def on_connection_create_end(session, ctx, params):
+            self.connections_created += 1
+
+        async def on_connection_reuseconn(session, ctx, params):
+            self.connections_reused += 1
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        return trace_config
+
+    def record_request(self, metrics: dict):
+        """Keep per-request timing / memory metrics (bounded history)."""
+        self.recent.append(metrics)
+
+    def snapshot(self) -> dict:
+        """Return the current counters as a plain dict."""
+        acquired = self.connections_created + self.connections_reused
+        snapshot = {
+            "requests": self.requests,
+            "connections_created": self.connections_created,
+            "connections_reused": self.connections_reused,
+            "reuse_ratio": round(self.connections_reused / acquired, 3) if acquired else 0.0,
+        }
+        recent = list(self.recent)
+        if recent:
+            ttfb = sorted(m["ttfb_ms"] for m in recent)
+            snapshot["ttfb_ms_p50"] = ttfb[len(ttfb) // 2]
+            snapshot["ttfb_ms_max"] = ttfb[-1]
+            snapshot["peak_rss_kb"] = max(m["peak_rss_kb"] for m in recent)
+            snapshot["max_rss_growth_kb"] = max(m["rss_growth_kb"] for m in recent)
+        return snapshot
+
+
+def create_upstream_session(stats: ProxyConnectionStats) -> "aiohttp.ClientSession":
+    """
+    Create the long-lived client session a proxy uses for upstream HTTP.
+
+    Must be called from the proxy's event loop. The connector keeps idle
+    connections to the sandbox gateway alive and caches its DNS lookup, so
+    consecutive screenshot / accessibility / setup calls share one handshake.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=AGS_PROXY_POOL_LIMIT,
+        limit_per_host=AGS_PROXY_POOL_LIMIT,
+        keepalive_timeout=AGS_PROXY_KEEPALIVE,
+        ttl_dns_cache=AGS_PROXY_DNS_TTL,
+        use_dns_cache=True,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        trace_configs=[stats.trace_config()],
+    )
+
+
 class LocalProxyServer:
     """
     Local proxy server for AGS sandbox, supporting both HTTP and WebSocket.
@@ -147,6 +263,10 @@ class LocalProxyServer:
         self.thread = None
         self.loop = None
         self.runner = None
+        self.session = None
+        self.stats = ProxyConnectionStats()
+        self.hub = None
+        self._tasks = set()
         self._start_error = None
         self._start_event = None
 
@@ -165,14 +285,19 @@ class LocalProxyServer:
         self._start_event = threading.Event()
         self._max_retries = max_retries
 
-        self.thread = threading.Thread(target=self._run_server, daemon=True)
-        self.thread.start()
+        if AGS_PROXY_HUB or AGS_PROXY_MODE == "routed":
+            # Attach to the shared process-wide loop instead of a new thread
+            # (routed mode always needs it: the router dispatches on that loop)
+            ProxyHub.instance().add(self)
+        else:
+            self.thread = threading.Thread(target=self._run_server, daemon=True)
+            self.thread.start()
 
-        # Wait for server to start or fail
-        self._start_event.wait(timeout=10)
+            # Wait for server to start or fail
+            self._start_event.wait(timeout=10)
 
-        if self._start_error:
-            raise self._start_error
+            if self._start_error:
+                raise self._start_error
 
         logger.info(
             "Local proxy started: localhost:%d -> %s",
@@ -207,6 +332,15 @@ class LocalProxyServer:
 
         self.runner = web.AppRunner(app)
         await self.runner.setup()
+        self.session = create_upstream_session(self.stats)
+
+        if self.local_port == 0:
+            # OS-assigned port (routed mode): one bind, no retry scan.
+            # Bind IPv4 only so "localhost" cannot resolve to two different ports.
+            site = web.TCPSite(self.runner, '127.0.0.1', 0)
+            await site.start()
+            self.local_port = self.runner.addresses[0][1]
+            return
 
         last_error = None
         base_port = self.local_port
@@ -236,12 +370,26 @@ class LocalProxyServer:
         path = "/" + request.match_info.get('path', '')
         if request.query_string:
             path += '?' + request.query_string
+        return await self.dispatch(request, path)
 
-        # Check if this is a WebSocket upgrade request
-        if request.headers.get('Upgrade', '').lower() == 'websocket':
-            return await self._handle_websocket(request, path)
-        else:
-            return await self._handle_http(request, path)
+    async def dispatch(self, request: web.Request, path: str, public_base: str = None):
+        """
+        Proxy a request for ``path`` to the sandbox.
+
+        Also used by RoutedProxyServer after it strips the route prefix;
+        ``public_base`` is only meaningful for the CDP proxy.
+        """
+        # Track in-flight handlers so a hub-hosted proxy can cancel only its own
+        task = asyncio.current_task()
+        self._tasks.add(task)
+        try:
+            # Check if this is a WebSocket upgrade request
+            if request.headers.get('Upgrade', '').lower() == 'websocket':
+                return await self._handle_websocket(request, path)
+            else:
+                return await self._handle_http(request, path)
+        finally:
+            self._tasks.discard(task)
 
     async def _handle_http(self, request: web.Request, path: str):
         """Handle HTTP request by proxying to the remote sandbox."""
@@ -254,47 +402,130 @@ class LocalProxyServer:
                 headers[key] = value
         headers["X-Access-Token"] = self.access_token
 
-        body = await request.read()
-
         logger.debug("Proxy HTTP %s: %s -> %s", request.method, path, target_url)
 
+        metrics = {
+            "method": request.method,
+            "path": path,
+            "streaming": AGS_PROXY_STREAMING,
+            "status": 502,
+            "bytes": 0,
+            "ttfb_ms": 0.0,
+        }
+        rss_before = get_peak_rss_kb()
+        started = time.perf_counter()
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.request(
-                    request.method,
-                    target_url,
-                    headers=headers,
-                    data=body if body else None,
-                    timeout=aiohttp.ClientTimeout(total=300, connect=30),
-                ) as response:
-                    content = await response.read()
-
-                    if response.status >= 500:
-                        logger.warning(
-                            "Remote returned error %d for %s: %s",
-                            response.status, path,
-                            content.decode('utf-8', errors='replace')[:500]
-                        )
-                    elif response.status >= 400:
-                        logger.debug(
-                            "Remote returned %d for %s",
-                            response.status, path,
-                        )
+            if AGS_PROXY_STREAMING:
+                return await self._proxy_http_streaming(request, path, target_url, headers, metrics, started)
+            return await self._proxy_http_buffered(request, path, target_url, headers, metrics, started)
+        finally:
+            metrics["total_ms"] = round((time.perf_counter() - started) * 1000, 1)
+            metrics["peak_rss_kb"] = get_peak_rss_kb()
+            metrics["rss_growth_kb"] = metrics["peak_rss_kb"] - rss_before
+            self.stats.record_request(metrics)
+            logger.debug(
+                "Proxy HTTP %s %s -> %d, %d bytes, ttfb=%.1fms total=%.1fms peak_rss=%dKB",
+                request.method, path, metrics["status"], metrics["bytes"],
+                metrics["ttfb_ms"], metrics["total_ms"], metrics["peak_rss_kb"],
+            )
 
-                    resp_headers = {}
-                    for key, value in response.headers.items():
-                        if key.lower() not in ("transfer-encoding", "content-encoding", "content-length"):
-                            resp_headers[key] = value
+    async def _proxy_http_buffered(self, request, path, target_url, headers, metrics, started):
+        """Proxy an HTTP request, reading both bodies fully into memory."""
+        body = await request.read()
 
-                    return web.Response(
-                        body=content,
-                        status=response.status,
-                        headers=resp_headers,
+        try:
+            async with self.session.request(
+                request.method,
+                target_url,
+                headers=headers,
+                data=body if body else None,
+                timeout=aiohttp.ClientTimeout(total=300, connect=30),
+            ) as response:
+                metrics["ttfb_ms"] = round((time.perf_counter() - started) * 1000, 1)
+                content = await response.read()
+
+                if response.status >= 500:
+                    logger.warning(
+                        "Remote returned error %d for %s: %s",
+                        response.status, path,
+                        content.decode('utf-8', errors='replace')[:500]
+                    )
+                elif response.status >= 400:
+                    logger.debug(
+                        "Remote returned %d for %s",
+                        response.status, path,
                     )
+
+                resp_headers = {}
+                for key, value in response.headers.items():
+                    if key.lower() not in PROXY_SKIP_RESPONSE_HEADERS:
+                        resp_headers[key] = value
+
+                metrics["status"] = response.status
+                metrics["bytes"] = len(content)
+                return web.Response(
+                    body=content,
+                    status=response.status,
+                    headers=resp_headers,
+                )
         except Exception as e:
             logger.error("Proxy HTTP error for %s: %s", path, e)
             return web.Response(text=str(e), status=502)
 
+    async def _proxy_http_streaming(self, request, path, target_url, headers, metrics, started):
+        """
+        Proxy an HTTP request, piping both bodies chunk by chunk.
+
+        The request body is forwarded straight from the client stream and the
+        response is relayed through a StreamResponse; ``write()`` waits for the
+        client socket to drain, so a slow reader throttles the upstream read
+        instead of the body piling up in memory.
+        """
+        data = None
+        if request.can_read_body:
+            data = request.content.iter_chunked(PROXY_STREAM_CHUNK_SIZE)
+
+        stream = None
+        try:
+            async with self.session.request(
+                request.method,
+                target_url,
+                headers=headers,
+                data=data,
+                timeout=aiohttp.ClientTimeout(total=300, connect=30),
+            ) as response:
+                metrics["ttfb_ms"] = round((time.perf_counter() - started) * 1000, 1)
+                metrics["status"] = response.status
+
+                if response.status >= 500:
+                    logger.warning("Remote returned error %d for %s", response.status, path)
+                elif response.status >= 400:
+                    logger.debug("Remote returned %d for %s", response.status, path)
+
+                resp_headers = {}
+                for key, value in response.headers.items():
+                    if key.lower() not in PROXY_SKIP_RESPONSE_HEADERS:
+                        resp_headers[key] = value
+                # Length is only preserved when the body is relayed byte-for-byte
+                if response.content_length is not None and not response.headers.get("Content-Encoding"):
+                    resp_headers["Content-Length"] = str(response.content_length)
+
+                stream = web.StreamResponse(status=response.status, headers=resp_headers)
+                await stream.prepare(request)
+                async for chunk in response.content.iter_chunked(PROXY_STREAM_CHUNK_SIZE):
+                    await stream.write(chunk)
+                    metrics["bytes"] += len(chunk)
+                await stream.write_eof()
+                return stream
+        except Exception as e:
+            if stream is not None and stream.prepared:
+                # Headers already went out; abort the connection so the client
+                # sees a truncated response instead of a silently short body.
+                logger.error("Proxy HTTP stream aborted for %s: %s", path, e)
+                raise
+            logger.error("Proxy HTTP error for %s: %s", path, e)
+            return web.Response(text=str(e), status=502)
+
     async def _handle_websocket(self, request: web.Request, path: str):
         """Handle WebSocket connection by bidirectional proxying."""
         ws_client = web.WebSocketResponse()
@@ -343,8 +574,31 @@ class LocalProxyServer:
 
         return ws_client
 
+    def connection_stats(self) -> dict:
+        """Return upstream request / connection-reuse counters for this proxy."""
+        return self.stats.snapshot()
+
+    def _close_session(self):
+        """Close the shared upstream session on the proxy's event loop."""
+        if not self.session:
+            return
+        try:
+            future = asyncio.run_coroutine_threadsafe(self.session.close(), self.loop)
+            future.result(timeout=5)
+        except Exception as e:
+            logger.debug("Local proxy session close error: %s", e)
+
     def stop(self):
         """Stop the proxy server."""
+        if self.hub:
+            # Detach from the shared loop; the hub itself keeps running
+            self.hub.remove(self)
+            self.hub = None
+            self.runner = None
+            self.session = None
+            self.loop = None
+            return
+
         if not self.loop:
             self.runner = None
             self.thread = None
@@ -376,6 +630,9 @@ class LocalProxyServer:
             except Exception as e:
                 logger.debug("Local proxy cleanup error: %s", e)
 
+        # Close the shared upstream session and its pooled connections
+        self._close_session()
+
         # Stop the event loop
         self.loop.call_soon_threadsafe(self.loop.stop)
 
@@ -386,6 +643,7 @@ class LocalProxyServer:
             self.loop.close()
 
         self.runner = None
+        self.session = None
         self.loop = None
         self.thread = None
 
@@ -404,6 +662,10 @@ class CDPProxyServer:
         self.thread = None
         self.loop = None
         self.runner = None
+        self.session = None
+        self.stats = ProxyConnectionStats()
+        self.hub = None
+        self._tasks = set()
         self._start_error = None
         self._start_event = None
 
@@ -422,14 +684,19 @@ class CDPProxyServer:
         self._start_event = threading.Event()
         self._max_retries = max_retries
 
-        self.thread = threading.Thread(target=self._run_server, daemon=True)
-        self.thread.start()
+        if AGS_PROXY_HUB or AGS_PROXY_MODE == "routed":
+            # Attach to the shared process-wide loop instead of a new thread
+            # (routed mode always needs it: the router dispatches on that loop)
+            ProxyHub.instance().add(self)
+        else:
+            self.thread = threading.Thread(target=self._run_server, daemon=True)
+            self.thread.start()
 
-        # Wait for server to start or fail
-        self._start_event.wait(timeout=10)
+            # Wait for server to start or fail
+            self._start_event.wait(timeout=10)
 
-        if self._start_error:
-            raise self._start_error
+            if self._start_error:
+                raise self._start_error
 
         logger.info(
             "CDP proxy started: localhost:%d -> %s",
@@ -464,9 +731,18 @@ class CDPProxyServer:
 
         self.runner = web.AppRunner(app)
         await self.runner.setup()
+        self.session = create_upstream_session(self.stats)
 
         # Try to bind with retries to handle concurrent port conflicts
         # Use random offset to reduce collision probability in concurrent scenarios
+        if self.local_port == 0:
+            # OS-assigned port (routed mode): one bind, no retry scan.
+            # Bind IPv4 only so "localhost" cannot resolve to two different ports.
+            site = web.TCPSite(self.runner, '127.0.0.1', 0)
+            await site.start()
+            self.local_port = self.runner.addresses[0][1]
+            return
+
         last_error = None
         base_port = self.local_port
         random_offset = random.randint(0, 1000)
@@ -496,51 +772,66 @@ class CDPProxyServer:
         path = "/" + request.match_info.get('path', '')
         if request.query_string:
             path += '?' + request.query_string
+        return await self.dispatch(request, path)
 
-        # Check if this is a WebSocket upgrade request
-        if request.headers.get('Upgrade', '').lower() == 'websocket':
-            return await self._handle_websocket(request, path)
-        else:
-            return await self._handle_http(request, path)
+    async def dispatch(self, request: web.Request, path: str, public_base: str = None):
+        """
+        Proxy a request for ``path`` to Chromium.
 
-    async def _handle_http(self, request: web.Request, path: str):
+        ``public_base`` is the host[:port][/prefix] clients use to reach this
+        proxy; /json WebSocket URLs are rewritten to it. Defaults to the
+        proxy's own localhost port.
+        """
+        # Track in-flight handlers so a hub-hosted proxy can cancel only its own
+        task = asyncio.current_task()
+        self._tasks.add(task)
+        try:
+            # Check if this is a WebSocket upgrade request
+            if request.headers.get('Upgrade', '').lower() == 'websocket':
+                return await self._handle_websocket(request, path)
+            else:
+                return await self._handle_http(request, path, public_base)
+        finally:
+            self._tasks.discard(task)
+
+    async def _handle_http(self, request: web.Request, path: str, public_base: str = None):
         """Handle HTTP request."""
         target_url = f"https://{self.target_host}{path}"
+        public_base = public_base or f"localhost:{self.local_port}"
         # Note: Host header is handled by the internal proxy in the sandbox
         headers = {"X-Access-Token": self.access_token}
 
         logger.debug("CDP HTTP: %s -> %s", path, target_url)
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(target_url, headers=headers) as response:
-                    content = await response.read()
-
-                    # If remote returns error, log it clearly
-                    if response.status >= 400:
-                        logger.error("Remote CDP returned error %d: %s",
-                                   response.status, content.decode('utf-8', errors='replace')[:500])
-
-                    # Rewrite WebSocket URLs in /json/* responses
-                    if path.startswith("/json") and response.status == 200:
-                        content_str = content.decode("utf-8")
-                        logger.debug("CDP /json response: %s", content_str[:200])
-
-                        # Replace remote WebSocket URLs with local
-                        # Pattern matches wss://host or ws://host followed by path
-                        content_str = re.sub(
-                            r'wss?://[^/\s"]+',
-                            f'ws://localhost:{self.local_port}',
-                            content_str
-                        )
-                        logger.debug("CDP /json rewritten: %s", content_str[:200])
-                        content = content_str.encode("utf-8")
+            async with self.session.get(target_url, headers=headers) as response:
+                content = await response.read()
+
+                # If remote returns error, log it clearly
+                if response.status >= 400:
+                    logger.error("Remote CDP returned error %d: %s",
+                               response.status, content.decode('utf-8', errors='replace')[:500])
 
-                    return web.Response(
-                        body=content,
-                        status=response.status,
-                        content_type=response.content_type
+                # Rewrite WebSocket URLs in /json/* responses
+                if path.startswith("/json") and response.status == 200:
+                    content_str = content.decode("utf-8")
+                    logger.debug("CDP /json response: %s", content_str[:200])
+
+                    # Replace remote WebSocket URLs with local
+                    # Pattern matches wss://host or ws://host followed by path
+                    content_str = re.sub(
+                        r'wss?://[^/\s"]+',
+                        f'ws://{public_base}',
+                        content_str
                     )
+                    logger.debug("CDP /json rewritten: %s", content_str[:200])
+                    content = content_str.encode("utf-8")
+
+                return web.Response(
+                    body=content,
+                    status=response.status,
+                    content_type=response.content_type
+                )
         except Exception as e:
             logger.error("CDP HTTP proxy error: %s", e, exc_info=True)
             return web.Response(text=str(e), status=502)
@@ -596,8 +887,31 @@ class CDPProxyServer:
 
         return ws_client
 
+    def connection_stats(self) -> dict:
+        """Return upstream request / connection-reuse counters for this proxy."""
+        return self.stats.snapshot()
+
+    def _close_session(self):
+        """Close the shared upstream session on the proxy's event loop."""
+        if not self.session:
+            return
+        try:
+            future = asyncio.run_coroutine_threadsafe(self.session.close(), self.loop)
+            future.result(timeout=5)
+        except Exception as e:
+            logger.debug("CDP proxy session close error: %s", e)
+
     def stop(self):
         """Stop the CDP proxy server."""
+        if self.hub:
+            # 从共享事件循环上摘除本代理，hub 本身继续运行
+            self.hub.remove(self)
+            self.hub = None
+            self.runner = None
+            self.session = None
+            self.loop = None
+            return
+
         if not self.loop:
             self.runner = None
             self.thread = None
@@ -629,6 +943,9 @@ class CDPProxyServer:
             except Exception as e:
                 logger.debug("CDP proxy cleanup error: %s", e)
 
+        # Step 2.5: 关闭共享的上游 session（释放连接池）
+        self._close_session()
+
         # Step 3: 停止事件循环
         self.loop.call_soon_threadsafe(self.loop.stop)
 
@@ -642,8 +959,251 @@ class CDPProxyServer:
 
         # 清空引用
         self.runner = None
+        self.session = None
+        self.loop = None
+        self.thread = None
+
+
+def unix_socket_in_use(path: str) -> bool:
+    """Return True if something is accepting connections on the Unix socket ``path``."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.settimeout(1)
+        try:
+            s.connect(path)
+            return True
+        except (ConnectionRefusedError, FileNotFoundError):
+            return False
+        except OSError:
+            # Timeout or permission error: assume another process owns it
+            return True
+
+
+class ProxyHub:
+    """
+    Process-wide event loop shared by every local proxy.
+
+    Without the hub each LocalProxyServer / CDPProxyServer runs its own thread
+    and event loop, i.e. four of each per sandbox. With the hub, all proxies of
+    all providers in the process bind their listeners on one loop. Routes
+    (local port -> sandbox host) are added and removed as sandboxes come and
+    go, and the loop stays up for the life of the process.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self):
+        self.pid = os.getpid()
         self.loop = None
         self.thread = None
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._routes = {}
+
+    @classmethod
+    def instance(cls) -> "ProxyHub":
+        """Return the hub for this process (a forked child gets its own)."""
+        with cls._instance_lock:
+            if cls._instance is None or cls._instance.pid != os.getpid():
+                cls._instance = cls()
+            return cls._instance
+
+    def _ensure_running(self):
+        """Start the hub thread and loop on first use."""
+        with self._lock:
+            if not (self.thread and self.thread.is_alive()):
+                self._ready.clear()
+                self.thread = threading.Thread(target=self._run, name="ags-proxy-hub", daemon=True)
+                self.thread.start()
+        # Every caller waits, not just the one that started the thread: a
+        # concurrent caller can see the thread alive before self.loop is set.
+        if not self._ready.wait(timeout=10):
+            raise RuntimeError("AGS proxy hub event loop failed to start")
+
+    def _run(self):
+        """Run the shared event loop forever."""
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.loop.call_soon(self._ready.set)
+        try:
+            self.loop.run_forever()
+        except Exception as e:
+            logger.error("AGS proxy hub loop error: %s", e)
+        finally:
+            if not self.loop.is_closed():
+                self.loop.close()
+
+    def add(self, proxy):
+        """Bind a proxy's listener on the hub loop (hot-add a route)."""
+        self._ensure_running()
+        future = asyncio.run_coroutine_threadsafe(proxy._start_server(), self.loop)
+        future.result(timeout=10)
+        proxy.loop = self.loop
+        proxy.hub = self
+        with self._lock:
+            self._routes[proxy.local_port] = proxy
+            active = len(self._routes)
+        logger.debug(
+            "Proxy hub: added localhost:%d -> %s (%d active)",
+            proxy.local_port, proxy.target_host, active,
+        )
+
+    def remove(self, proxy):
+        """Close a proxy's listener, in-flight handlers and upstream session."""
+        with self._lock:
+            self._routes.pop(proxy.local_port, None)
+            active = len(self._routes)
+
+        async def _detach():
+            tasks = [t for t in proxy._tasks if not t.done()]
+            for t in tasks:
+                t.cancel()
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+            if proxy.runner:
+                await proxy.runner.cleanup()
+            if proxy.session:
+                await proxy.session.close()
+
+        try:
+            future = asyncio.run_coroutine_threadsafe(_detach(), self.loop)
+            future.result(timeout=10)
+        except Exception as e:
+            logger.debug("Proxy hub remove error: %s", e)
+        logger.debug(
+            "Proxy hub: removed localhost:%d -> %s (%d active)",
+            proxy.local_port, proxy.target_host, active,
+        )
+
+    def routes(self) -> dict:
+        """Return the active local port -> sandbox host mapping."""
+        with self._lock:
+            return {port: proxy.target_host for port, proxy in self._routes.items()}
+
+
+class RoutedProxyServer:
+    """
+    Single listener that routes to every sandbox service in the process.
+
+    Requests are matched to a proxy with one dict lookup, either by path
+    prefix or by Host header:
+
+        http://localhost:<port>/<sandbox_id>/<service>/<path>
+        http://<service>.<sandbox_id>.localhost:<port>/<path>
+
+    where ``service`` is one of server / vnc / vlc / chromium. The listener is
+    bound once (AGS_PROXY_ROUTED_PORT, 0 = OS-assigned) and optionally on a
+    Unix domain socket (AGS_PROXY_UDS). It runs on the ProxyHub loop and lives
+    for the whole process; sandboxes only add and remove routes.
+
+    Routes only cover the sandboxes of this process. ``{pid}`` in AGS_PROXY_UDS
+    gives every process (e.g. each run_multienv env) its own socket; a socket
+    path that another live process is serving is left alone.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, hub: ProxyHub):
+        self.hub = hub
+        self.port = None
+        self.uds_path = AGS_PROXY_UDS.replace("{pid}", str(os.getpid())) if AGS_PROXY_UDS else None
+        self.runner = None
+        self._routes = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def instance(cls) -> "RoutedProxyServer":
+        """Return the routed listener for this process, starting it on first use."""
+        with cls._instance_lock:
+            hub = ProxyHub.instance()
+            if cls._instance is None or cls._instance.hub is not hub:
+                server = cls(hub)
+                server.start()
+                cls._instance = server
+            return cls._instance
+
+    def start(self):
+        """Bind the listener on the hub loop."""
+        self.hub._ensure_running()
+        future = asyncio.run_coroutine_threadsafe(self._start_server(), self.hub.loop)
+        future.result(timeout=10)
+        logger.info(
+            "Routed proxy listening on localhost:%d%s",
+            self.port,
+            f" and unix:{self.uds_path}" if self.uds_path else "",
+        )
+
+    async def _start_server(self):
+        """Start the TCP (and optional UDS) site."""
+        app = web.Application()
+        app.router.add_route('*', '/{path:.*}', self._handle_request)
+
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+
+        host = '127.0.0.1' if AGS_PROXY_ROUTED_PORT == 0 else 'localhost'
+        await web.TCPSite(self.runner, host, AGS_PROXY_ROUTED_PORT).start()
+        self.port = self.runner.addresses[0][1]
+
+        if self.uds_path and os.path.exists(self.uds_path):
+            if stat.S_ISSOCK(os.stat(self.uds_path).st_mode) and not unix_socket_in_use(self.uds_path):
+                # Stale socket left behind by a previous run
+                os.unlink(self.uds_path)
+            else:
+                logger.warning(
+                    "AGS_PROXY_UDS %s is in use by another process; routed proxy is TCP-only "
+                    "(use {pid} in the path for one socket per process)",
+                    self.uds_path,
+                )
+                self.uds_path = None
+        if self.uds_path:
+            await web.UnixSite(self.runner, self.uds_path).start()
+
+    def add_route(self, route: str, proxies: dict):
+        """Register a sandbox's service proxies under ``route``."""
+        with self._lock:
+            for service, proxy in proxies.items():
+                self._routes[(route, service)] = proxy
+        logger.debug("Routed proxy: added %s (%s)", route, ", ".join(proxies))
+
+    def remove_route(self, route: str):
+        """Drop every service registered under ``route``."""
+        with self._lock:
+            for key in [k for k in self._routes if k[0] == route]:
+                del self._routes[key]
+        logger.debug("Routed proxy: removed %s", route)
+
+    def base_url(self, route: str, service: str) -> str:
+        """Return the path-prefixed URL for a sandbox service."""
+        return f"http://localhost:{self.port}/{route}/{service}"
+
+    async def _handle_request(self, request: web.Request):
+        """Resolve the route from the Host header or path prefix and dispatch."""
+        raw_path = request.match_info.get('path', '')
+        proxy = None
+
+        # Host-header form: <service>.<route>.localhost[:port]
+        labels = request.host.split(':')[0].split('.')
+        if len(labels) >= 3:
+            proxy = self._routes.get((labels[1], labels[0]))
+            path = "/" + raw_path
+            public_base = request.host
+
+        # Path-prefix form: /<route>/<service>/<path>
+        if proxy is None:
+            parts = raw_path.split('/', 2)
+            if len(parts) >= 2:
+                proxy = self._routes.get((parts[0], parts[1]))
+                path = "/" + (parts[2] if len(parts) > 2 else "")
+                public_base = f"{request.host}/{parts[0]}/{parts[1]}"
+
+        if proxy is None:
+            return web.Response(text=f"No AGS route for {request.host}/{raw_path}", status=404)
+
+        if request.query_string:
+            path += '?' + request.query_string
+        return await proxy.dispatch(request, path, public_base)
 
 
 class AGSProvider(Provider):
@@ -674,6 +1234,9 @@ class AGSProvider(Provider):
         self.local_vnc_port = None
         self.local_vlc_port = None
 
+        # Per-phase start_emulator durations in seconds
+        self.bringup_timings = {}
+
         # Register for cleanup on exit
         _active_providers.add(self)
 
@@ -682,61 +1245,131 @@ class AGSProvider(Provider):
         return self.sandbox.get_host(port)
 
     def _start_local_proxies(self):
-        """Start local proxy servers for all required ports."""
-        # HTTP + WebSocket proxies (aiohttp-based)
-        http_port_mapping = [
-            ("server", SERVER_PORT, 15000),
-            ("vnc", VNC_PORT, 15910),
-            ("vlc", VLC_PORT, 18080),
+        """Start local proxy servers for all required ports (in parallel)."""
+        start_time = time.time()
+        # HTTP + WebSocket proxies (aiohttp-based); CDP proxy for Chromium
+        proxy_specs = [
+            ("server", LocalProxyServer, SERVER_PORT, 15000),
+            ("vnc", LocalProxyServer, VNC_PORT, 15910),
+            ("vlc", LocalProxyServer, VLC_PORT, 18080),
+            ("chromium", CDPProxyServer, CHROMIUM_PORT, 19222),
         ]
 
-        for name, remote_port, local_start in http_port_mapping:
-            remote_host = self._get_sandbox_host(remote_port)
+        # Routed mode binds each service once on an OS-assigned port (no scan)
+        routed = AGS_PROXY_MODE == "routed"
 
-            proxy = LocalProxyServer(local_start, remote_host, self.envd_access_token)
+        def _start_proxy(spec):
+            name, proxy_cls, remote_port, local_start = spec
+            remote_host = self._get_sandbox_host(remote_port)
+            proxy = proxy_cls(0 if routed else local_start, remote_host, self.envd_access_token)
             proxy.start()  # This will retry and update local_port if needed
-            self.proxy_servers[name] = proxy
-
-            # Get the actual bound port from the proxy object
-            if name == "server":
-                self.local_server_port = proxy.local_port
-            elif name == "vnc":
-                self.local_vnc_port = proxy.local_port
-            elif name == "vlc":
-                self.local_vlc_port = proxy.local_port
-
-        # CDP proxy for Chromium (supports WebSocket)
-        chromium_remote_host = self._get_sandbox_host(CHROMIUM_PORT)
-        cdp_proxy = CDPProxyServer(19222, chromium_remote_host, self.envd_access_token)
-        cdp_proxy.start()  # This will retry and update local_port if needed
-        self.proxy_servers["chromium"] = cdp_proxy
-        self.local_chromium_port = cdp_proxy.local_port
+            return name, proxy
+
+        with ThreadPoolExecutor(max_workers=len(proxy_specs)) as executor:
+            futures = [executor.submit(_start_proxy, spec) for spec in proxy_specs]
+
+        # Keep every proxy that did start so stop_emulator can clean it up
+        errors = []
+        for future in futures:
+            try:
+                name, proxy = future.result()
+                self.proxy_servers[name] = proxy
+            except Exception as e:
+                errors.append(e)
+        if errors:
+            raise errors[0]
+
+        # Get the actual bound ports from the proxy objects
+        self.local_server_port = self.proxy_servers["server"].local_port
+        self.local_vnc_port = self.proxy_servers["vnc"].local_port
+        self.local_vlc_port = self.proxy_servers["vlc"].local_port
+        self.local_chromium_port = self.proxy_servers["chromium"].local_port
+
+        if routed:
+            router = RoutedProxyServer.instance()
+            router.add_route(self.sandbox_id, self.proxy_servers)
+            logger.info(
+                "Routed proxy for %s: %s/<path> (VNC: %s/vnc.html?path=%s/vnc/websockify)",
+                self.sandbox_id,
+                router.base_url(self.sandbox_id, "<service>"),
+                router.base_url(self.sandbox_id, "vnc"),
+                self.sandbox_id,
+            )
+
+        logger.info(
+            "Local proxies started in %.2fs (hub=%s, threads=%d)",
+            time.time() - start_time,
+            AGS_PROXY_HUB or routed,
+            threading.active_count(),
+        )
+
+    def get_proxy_connection_stats(self) -> dict:
+        """
+        Return upstream connection counters for each local proxy.
+
+        Counters are cumulative; diff two snapshots taken around a step to see
+        how many requests reused a pooled connection instead of handshaking.
+        """
+        return {
+            name: proxy.connection_stats()
+            for name, proxy in self.proxy_servers.items()
+        }
 
     def _stop_local_proxies(self):
         """Stop all local proxy servers."""
+        if AGS_PROXY_MODE == "routed" and self.proxy_servers:
+            RoutedProxyServer.instance().remove_route(self.sandbox_id)
         for name, proxy in self.proxy_servers.items():
             try:
+                stats = proxy.connection_stats()
                 proxy.stop()
-                logger.info("Stopped proxy: %s", name)
+                logger.info(
+                    "Stopped proxy: %s (requests=%d, connections created=%d, reused=%d)",
+                    name,
+                    stats["requests"],
+                    stats["connections_created"],
+                    stats["connections_reused"],
+                )
             except Exception as e:
                 logger.error("Error stopping proxy %s: %s", name, e)
         self.proxy_servers = {}
 
     def _wait_for_vm_ready(self, timeout: int = 300):
-        """Wait for VM to be ready by checking screenshot endpoint."""
-        start_time = time.time()
-        url = f"http://localhost:{self.local_server_port}/screenshot"
+        """
+        Wait for VM to be ready by polling a cheap server endpoint.
 
-        while time.time() - start_time < timeout:
-            try:
-                response = requests.get(url, timeout=(10, 10))
-                if response.status_code == 200:
-                    logger.info("AGS sandbox VM is ready")
-                    return True
-            except Exception:
-                pass
-            logger.info("Waiting for AGS sandbox VM to be ready...")
-            time.sleep(2)
+        Probes ``/platform`` over a keep-alive session, falling back to
+        ``/screenshot`` if the server image does not have it. The poll interval
+        starts at READY_POLL_INITIAL and doubles up to READY_POLL_MAX, so a VM
+        that is already up is detected almost immediately.
+        """
+        start_time = time.time()
+        probes = list(READY_PROBE_PATHS)
+        delay = READY_POLL_INITIAL
+        attempts = 0
+
+        with requests.Session() as session:
+            while time.time() - start_time < timeout:
+                url = f"http://localhost:{self.local_server_port}{probes[0]}"
+                attempts += 1
+                try:
+                    response = session.get(url, timeout=(10, 10))
+                    if response.status_code == 200:
+                        logger.info(
+                            "AGS sandbox VM is ready (%s after %d probe(s))",
+                            probes[0], attempts,
+                        )
+                        return True
+                    if response.status_code == 404 and len(probes) > 1:
+                        logger.debug("%s not available, probing %s instead", probes[0], probes[1])
+                        probes.pop(0)
+                        continue
+                except Exception:
+                    pass
+                if delay >= READY_POLL_MAX:
+                    logger.info("Waiting for AGS sandbox VM to be ready...")
+                time.sleep(delay)
+                delay = min(delay * 2, READY_POLL_MAX)
 
         raise TimeoutError(f"AGS sandbox VM failed to become ready within {timeout}s")
 
@@ -772,16 +1405,19 @@ class AGSProvider(Provider):
         3. Uses sudo to replace /usr/bin/socat with a wrapper that intercepts
            "socat tcp-listen:9222,fork tcp:localhost:1337" calls from task setup,
            starts cdp_proxy.py instead, and passes other socat calls through.
+
+        All steps ship as one batched shell script in a single /setup/execute
+        call; the aiohttp check/install runs in the background meanwhile.
         """
         import json as json_module
         exec_url = f"http://localhost:{self.local_server_port}/setup/execute"
         headers = {"Content-Type": "application/json"}
 
-        def exec_shell(cmd: str) -> dict:
+        def exec_shell(cmd: str, timeout: int = 120) -> dict:
             """Execute a shell command in the sandbox."""
             try:
                 payload = json_module.dumps({"command": cmd, "shell": True})
-                resp = requests.post(exec_url, headers=headers, data=payload, timeout=120)
+                resp = requests.post(exec_url, headers=headers, data=payload, timeout=timeout)
                 if resp.status_code == 200:
                     result = resp.json()
                     logger.debug("exec '%s': %s", cmd[:50], result.get("output", "")[:200])
@@ -793,9 +1429,6 @@ class AGSProvider(Provider):
                 logger.warning("exec '%s' error: %s", cmd[:50], e)
                 return {"status": "error", "output": str(e)}
 
-        # Ensure aiohttp is installed
-        exec_shell("python3 -c 'import aiohttp' 2>/dev/null || pip3 install --quiet aiohttp")
-
         # Create CDP proxy script that rewrites Host header
         proxy_script = r'''
 import asyncio
@@ -865,10 +1498,6 @@ app.router.add_route("*", "/{path:.*}", handle_request)
 if __name__ == "__main__":
     web.run_app(app, host="0.0.0.0", port=9222, print=None)
 '''
-        # Write proxy script
-        write_cmd = f"cat > /tmp/cdp_proxy.py << 'CDPPROXYSCRIPT'\n{proxy_script}\nCDPPROXYSCRIPT"
-        exec_shell(write_cmd)
-
         # Install socat wrapper using sudo (password: password).
         # 1. Backup real socat binary
         # 2. Replace /usr/bin/socat with a bash wrapper that:
@@ -891,17 +1520,36 @@ if __name__ == "__main__":
             'done\n'
             'exec "$REAL" "$@"\n'
         )
-        # Write wrapper to /tmp first, then use sudo to install
-        exec_shell(f"cat > /tmp/socat_wrapper << 'SOCATWRAPPER'\n{socat_wrapper}SOCATWRAPPER")
-        exec_shell("chmod +x /tmp/socat_wrapper")
-        exec_shell("echo password | sudo -S cp /usr/bin/socat /usr/bin/socat.real")
-        exec_shell("echo password | sudo -S cp /tmp/socat_wrapper /usr/bin/socat")
-        exec_shell("echo password | sudo -S chmod +x /usr/bin/socat")
-
-        # Verify wrapper is installed
-        result = exec_shell("file /usr/bin/socat && file /usr/bin/socat.real")
+        # One round trip instead of one per step:
+        # 1. Ensure aiohttp is installed (in the background, joined at the end)
+        # 2. Write the proxy script, and the wrapper to /tmp, then sudo-install it
+        # 3. Verify the wrapper is installed
+        setup_script = (
+            "(python3 -c 'import aiohttp' 2>/dev/null || pip3 install --quiet aiohttp) &\n"
+            "AIOHTTP_PID=$!\n"
+            f"cat > /tmp/cdp_proxy.py << 'CDPPROXYSCRIPT'\n{proxy_script}\nCDPPROXYSCRIPT\n"
+            f"cat > /tmp/socat_wrapper << 'SOCATWRAPPER'\n{socat_wrapper}SOCATWRAPPER\n"
+            "chmod +x /tmp/socat_wrapper\n"
+            "echo password | sudo -S cp /usr/bin/socat /usr/bin/socat.real\n"
+            "echo password | sudo -S cp /tmp/socat_wrapper /usr/bin/socat\n"
+            "echo password | sudo -S chmod +x /usr/bin/socat\n"
+            "wait $AIOHTTP_PID\n"
+            "file /usr/bin/socat && file /usr/bin/socat.real\n"
+        )
+        # pip install may run inside this call, so allow more than a single step
+        result = exec_shell(setup_script, timeout=300)
         logger.info("socat wrapper installed: %s", result.get("output", "").strip())
 
+    @contextmanager
+    def _bringup_phase(self, name: str):
+        """Time one start_emulator phase and log its duration."""
+        phase_start = time.time()
+        try:
+            yield
+        finally:
+            self.bringup_timings[name] = round(time.time() - phase_start, 2)
+            logger.info("Bring-up phase %s: %.2fs", name, self.bringup_timings[name])
+
     def start_emulator(self, path_to_vm: str, headless: bool, os_type: str = None):
         """
         Start an AGS sandbox.
@@ -923,8 +1571,12 @@ if __name__ == "__main__":
         template = AGS_TEMPLATE
         logger.info("Creating AGS sandbox with template: %s", template)
 
+        self.bringup_timings = {}
+        bringup_start = time.time()
+
         # Create sandbox using Sandbox.create() (not constructor)
-        self.sandbox = Sandbox.create(template=template, timeout=AGS_TIMEOUT)
+        with self._bringup_phase("create"):
+            self.sandbox = Sandbox.create(template=template, timeout=AGS_TIMEOUT)
         self.sandbox_id = self.sandbox.sandbox_id
 
         # Get access token
@@ -937,14 +1589,25 @@ if __name__ == "__main__":
         logger.info("AGS sandbox created with ID: %s", self.sandbox_id)
 
         # Start local proxy servers
-        self._start_local_proxies()
+        with self._bringup_phase("proxies"):
+            self._start_local_proxies()
 
         # Wait for VM to be ready
-        self._wait_for_vm_ready()
+        with self._bringup_phase("vm_ready"):
+            self._wait_for_vm_ready()
 
         # Deploy CDP proxy infrastructure (cdp_proxy.py + socat wrapper)
         # Does NOT start Chrome — Chrome will be started by task setup config steps
-        self._ensure_chromium_cdp_bridge()
+        with self._bringup_phase("cdp_bridge"):
+            self._ensure_chromium_cdp_bridge()
+
+        self.bringup_timings["total"] = round(time.time() - bringup_start, 2)
+        logger.info(
+            "AGS sandbox %s up in %.2fs (%s)",
+            self.sandbox_id,
+            self.bringup_timings["total"],
+            ", ".join(f"{k}={v:.2f}s" for k, v in self.bringup_timings.items() if k != "total"),
+        )
 
     def get_ip_address(self, path_to_vm: str) -> str:
         """
@@ -0,0 +1,43 @@
+"""
+Load the overlay AGS provider for tests without a full OSWorld checkout.
+
+Only the OSWorld host package is replaced (``desktop_env.providers.base``);
+the overlay's own modules and their dependencies (aiohttp, requests,
+python-dotenv) are imported for real.
+"""
+import importlib.util
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+AGS_DIR = Path(__file__).resolve().parent.parent / "overlay" / "OSWorld" / "desktop_env" / "providers" / "ags"
+
+
+def _load_module(name: str):
+    spec = importlib.util.spec_from_file_location(f"desktop_env.providers.ags.{name}", AGS_DIR / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="session")
+def provider():
+    for package in ("desktop_env", "desktop_env.providers", "desktop_env.providers.ags"):
+        module = types.ModuleType(package)
+        module.__path__ = []
+        sys.modules.setdefault(package, module)
+
+    base = types.ModuleType("desktop_env.providers.base")
+
+    class Provider:
+        def __init__(self, region: str = None):
+            self.region = region
+
+    base.Provider = Provider
+    sys.modules.setdefault("desktop_env.providers.base", base)
+
+    _load_module("config")
+    return _load_module("provider")
@@ -0,0 +1,103 @@
+"""Tests for the AGS provider's local proxy bring-up (no sandbox is created)."""
+import threading
+import time
+
+import pytest
+
+
+class FakeSandbox:
+    """Stands in for an e2b sandbox; only get_host() is used by proxy start."""
+
+    def get_host(self, port: int) -> str:
+        return f"{port}-sandbox.example"
+
+    def kill(self):
+        pass
+
+
+@pytest.fixture
+def fresh_hub(provider, monkeypatch):
+    """A new ProxyHub whose loop thread is slow to come up (widens the start race)."""
+    monkeypatch.setattr(provider, "AGS_PROXY_HUB", True)
+    monkeypatch.setattr(provider.ProxyHub, "_instance", None)
+    original_run = provider.ProxyHub._run
+
+    def slow_run(self):
+        time.sleep(0.2)
+        original_run(self)
+
+    monkeypatch.setattr(provider.ProxyHub, "_run", slow_run)
+    yield provider.ProxyHub.instance()
+
+
+def test_concurrent_proxy_start_waits_for_hub_loop(provider, fresh_hub):
+    ags = provider.AGSProvider()
+    ags.sandbox = FakeSandbox()
+    ags.sandbox_id = "sb-concurrent"
+    ags.envd_access_token = "token"
+    try:
+        ags._start_local_proxies()
+
+        assert set(ags.proxy_servers) == {"server", "vnc", "vlc", "chromium"}
+        ports = [ags.local_server_port, ags.local_vnc_port, ags.local_vlc_port, ags.local_chromium_port]
+        assert all(ports) and len(set(ports)) == 4
+        assert all(proxy.hub is fresh_hub for proxy in ags.proxy_servers.values())
+        assert len(fresh_hub.routes()) == 4
+    finally:
+        ags._stop_local_proxies()
+        ags.sandbox = None
+    assert fresh_hub.routes() == {}
+
+
+def test_concurrent_hub_add_from_many_threads(provider, fresh_hub):
+    proxies = [provider.LocalProxyServer(0, "sandbox.example", "token") for _ in range(8)]
+    errors = []
+
+    def start(proxy):
+        try:
+            proxy.start()
+        except Exception as e:  # collected and asserted below
+            errors.append(e)
+
+    threads = [threading.Thread(target=start, args=(proxy,)) for proxy in proxies]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    try:
+        assert errors == []
+        assert len(fresh_hub.routes()) == len(proxies)
+    finally:
+        for proxy in proxies:
+            proxy.stop()
+
+
+def test_routed_uds_is_not_taken_from_a_live_process(provider, fresh_hub, tmp_path, monkeypatch):
+    sock_path = str(tmp_path / "routed.sock")
+    monkeypatch.setattr(provider, "AGS_PROXY_UDS", sock_path)
+
+    first = provider.RoutedProxyServer(fresh_hub)
+    first.start()
+    second = provider.RoutedProxyServer(fresh_hub)
+    second.start()
+
+    # The live socket still belongs to the first listener
+    assert first.uds_path == sock_path
+    assert second.uds_path is None
+    assert provider.unix_socket_in_use(sock_path)
+
+
+def test_routed_uds_replaces_stale_socket_and_expands_pid(provider, fresh_hub, tmp_path, monkeypatch):
+    import os
+    import socket
+
+    stale = tmp_path / f"routed-{os.getpid()}.sock"
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.bind(str(stale))  # bound but never listening: left over from a dead process
+    monkeypatch.setattr(provider, "AGS_PROXY_UDS", str(tmp_path / "routed-{pid}.sock"))
+
+    router = provider.RoutedProxyServer(fresh_hub)
+    router.start()
+
+    assert router.uds_path == str(stale)
+    assert provider.unix_socket_in_use(str(stale))